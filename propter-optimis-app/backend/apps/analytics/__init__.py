@@ -5,5 +5,3 @@ This app provides OpenStarLab integration for AI-powered football analysis,
 including event detection, tactical analysis, player evaluation, and
 predictive modeling capabilities.
 """
-
-default_app_config = 'apps.analytics.apps.AnalyticsConfig'
\ No newline at end of file
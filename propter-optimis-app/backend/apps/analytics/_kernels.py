@@ -0,0 +1,85 @@
+"""
+Numeric kernels for the OpenStarLab processors.
+
+Kernels are compiled with Numba when it is installed. Each kernel declares
+its signature, so it is compiled eagerly at import (worker start) rather than
+on the first analysis, and cache=True persists the machine code next to this
+module so later processes load it instead of recompiling. Bounds checking is
+off and errors follow NumPy semantics, so the loops compile without
+index or division-by-zero guards. Without Numba the same kernels run as plain
+vectorized NumPy.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; kernels run as plain NumPy without it
+    njit = None
+
+
+def _compute_q_batch_numpy(atypes, phases, positions, zones, noise,
+                           reward_lut, phase_lut, position_lut, zone_lut):
+    """Q-values for a batch of encoded actions, clamped to [-1, 1]."""
+    q = reward_lut[atypes] * (1.0 + phase_lut[phases])
+    q *= position_lut[positions]
+    q *= zone_lut[zones]
+    q += noise
+    return np.clip(q, -1.0, 1.0, out=q)
+
+
+def _q_value_stats_numpy(q_values, threshold):
+    """Count, mean and share of values above ``threshold`` in one call."""
+    n = q_values.shape[0]
+    return n, float(q_values.mean()), float((q_values > threshold).sum()) / n
+
+
+def _aggregate_confidence_numpy(event_confidences, player_scores, tactical, prediction):
+    """Event, player and overall intelligence confidence; empty inputs score 0."""
+    event = float(event_confidences.mean()) if event_confidences.size else 0.0
+    player = 0.0
+    if player_scores.size:
+        player = float(player_scores.sum()) / player_scores.size + 0.2
+        player = 0.9 if player > 0.9 else player
+    return event, player, 0.25 * (event + tactical + player + prediction)
+
+
+if njit is not None:
+    _JIT_OPTIONS = dict(cache=True, fastmath=True, boundscheck=False, error_model='numpy')
+    
+    @njit('f8[:](i1[:], i1[:], i1[:], i1[:], f8[:], f8[:], f8[:], f8[:], f8[:])', **_JIT_OPTIONS)
+    def compute_q_batch(atypes, phases, positions, zones, noise,
+                        reward_lut, phase_lut, position_lut, zone_lut):
+        """Q-values for a batch of encoded actions, clamped to [-1, 1]."""
+        out = np.empty(atypes.shape[0])
+        for i in range(atypes.shape[0]):
+            v = (reward_lut[atypes[i]] * (1.0 + phase_lut[phases[i]])
+                 * position_lut[positions[i]] * zone_lut[zones[i]] + noise[i])
+            out[i] = min(1.0, max(-1.0, v))
+        return out
+    
+    @njit('Tuple((i8, f8, f8))(f8[:], f8)', **_JIT_OPTIONS)
+    def q_value_stats(q_values, threshold):
+        """Count, mean and share of values above ``threshold`` in one pass."""
+        n = q_values.shape[0]
+        total = 0.0
+        above = 0
+        for i in range(n):
+            v = q_values[i]
+            total += v
+            if v > threshold:
+                above += 1
+        return n, total / n, above / n
+    
+    @njit('UniTuple(f8, 3)(f8[:], f8[:], f8, f8)', **_JIT_OPTIONS)
+    def aggregate_confidence(event_confidences, player_scores, tactical, prediction):
+        """Event, player and overall intelligence confidence; empty inputs score 0."""
+        event = event_confidences.mean() if event_confidences.shape[0] else 0.0
+        player = 0.0
+        if player_scores.shape[0]:
+            player = player_scores.mean() + 0.2
+            player = 0.9 if player > 0.9 else player
+        return event, player, 0.25 * (event + tactical + player + prediction)
+else:
+    compute_q_batch = _compute_q_batch_numpy
+    q_value_stats = _q_value_stats_numpy
+    aggregate_confidence = _aggregate_confidence_numpy
@@ -1,6 +1,9 @@
 """
 Analytics admin configuration for Propter-Optimis Sports Analytics Platform.
 """
+import functools
+import uuid
+
 from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
@@ -9,34 +12,94 @@ from django.db.models import Count
 
 from .models import Analysis, AnalysisTask, AnalysisInsight, AnalysisMetrics
 from apps.core.admin import TimestampedModelAdmin
+from apps.core.models import AnalysisStatus
+
+
+# Progress bar colors by analysis status; anything else renders gray
+_PROGRESS_BAR_COLORS = {
+    AnalysisStatus.FAILED: 'red',
+    AnalysisStatus.COMPLETED: 'green',
+    AnalysisStatus.PROCESSING: 'blue',
+}
+
+_PROGRESS_BAR_TEMPLATE = (
+    '<div style="width:100px; background-color:#f0f0f0; border-radius:3px;">'
+    '<div style="width:{}%; background-color:{}; height:20px; border-radius:3px; text-align:center; color:white; font-size:12px; line-height:20px;">'
+    '{}%</div></div>'
+)
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_seconds(seconds):
+    """Format a duration in seconds as e.g. '3m 12s' or '45s'."""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes}m {seconds}s" if minutes else f"{seconds}s"
+
+
+def _is_changelist(request):
+    """Check whether the admin request is for a changelist page."""
+    match = request.resolver_match
+    return bool(match and match.url_name and match.url_name.endswith('_changelist'))
+
+
+class OwnerSearchMixin:
+    """
+    Admin search by video owner id or by prefix.
+    
+    A search term that parses as a UUID is matched exactly against
+    ``owner_lookup`` (the Supabase user id). Anything else falls through to
+    ``search_fields``, which use ``^`` prefix lookups so Postgres can use the
+    pattern indexes instead of scanning for substrings.
+    """
+    owner_lookup = None
+    
+    def get_search_results(self, request, queryset, search_term):
+        try:
+            owner_id = uuid.UUID(search_term.strip())
+        except ValueError:
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(**{self.owner_lookup: owner_id}), False
 
 
 class AnalysisTaskInline(admin.TabularInline):
     """Inline admin for analysis tasks."""
     model = AnalysisTask
     extra = 0
+    max_num = 100
+    classes = ('collapse',)
     readonly_fields = ['started_at', 'completed_at', 'duration']
     fields = [
         'task_name', 'task_type', 'status', 'started_at', 
         'completed_at', 'duration', 'error_message'
     ]
+    
+    def get_queryset(self, request):
+        """Skip the result payload, which the inline never renders."""
+        return super().get_queryset(request).defer('result_data')
 
 
 class AnalysisInsightInline(admin.TabularInline):
     """Inline admin for analysis insights."""
     model = AnalysisInsight
     extra = 0
+    max_num = 100
+    classes = ('collapse',)
     readonly_fields = ['created_at']
     fields = [
         'insight_type', 'title', 'importance_level', 
         'confidence_score', 'created_at'
     ]
+    
+    def get_queryset(self, request):
+        """Skip the metadata payload, which the inline never renders."""
+        return super().get_queryset(request).defer('metadata')
 
 
 class AnalysisMetricsInline(admin.StackedInline):
     """Inline admin for analysis metrics."""
     model = AnalysisMetrics
     can_delete = False
+    classes = ('collapse',)
     readonly_fields = ['total_processing_time', 'events_per_minute']
     fields = [
         ('total_frames_processed', 'events_detected', 'players_tracked'),
@@ -44,10 +107,14 @@ class AnalysisMetricsInline(admin.StackedInline):
         ('preprocessing_time', 'analysis_time', 'postprocessing_time'),
         ('cpu_time_used', 'memory_peak_mb')
     ]
+    
+    def get_queryset(self, request):
+        """Join the video read by events_per_minute."""
+        return super().get_queryset(request).select_related('analysis__video')
 
 
 @admin.register(Analysis)
-class AnalysisAdmin(admin.ModelAdmin):
+class AnalysisAdmin(OwnerSearchMixin, admin.ModelAdmin):
     """Admin configuration for Analysis model."""
     
     inlines = [AnalysisTaskInline, AnalysisInsightInline, AnalysisMetricsInline]
@@ -59,9 +126,10 @@ class AnalysisAdmin(admin.ModelAdmin):
     list_filter = [
         'status', 'video__analysis_intent', 'created_at', 'completed_at'
     ]
-    search_fields = [
-        'video__filename', 'video__user__email', 'video__user__team_name'
-    ]
+    search_fields = ['^video__filename']
+    owner_lookup = 'video__user_id'
+    list_select_related = ['video']
+    show_full_result_count = False
     readonly_fields = [
         'id', 'created_at', 'formatted_processing_time', 'progress_bar',
         'insights_count', 'results_preview'
@@ -95,27 +163,13 @@ class AnalysisAdmin(admin.ModelAdmin):
     def progress_bar(self, obj):
         """Display progress as a visual bar."""
         progress = obj.progress_percentage
-        
-        if obj.status == 'failed':
-            color = 'red'
-        elif obj.status == 'completed':
-            color = 'green'
-        elif obj.status == 'processing':
-            color = 'blue'
-        else:
-            color = 'gray'
-        
-        return format_html(
-            '<div style="width:100px; background-color:#f0f0f0; border-radius:3px;">'  
-            '<div style="width:{}%; background-color:{}; height:20px; border-radius:3px; text-align:center; color:white; font-size:12px; line-height:20px;">'  
-            '{}%</div></div>',
-            progress, color, progress
-        )
+        color = _PROGRESS_BAR_COLORS.get(obj.status, 'gray')
+        return format_html(_PROGRESS_BAR_TEMPLATE, progress, color, progress)
     progress_bar.short_description = 'Progress'
     
     def insights_count(self, obj):
         """Display number of insights generated."""
-        count = obj.insights.count()
+        count = obj._insights_count
         if count > 0:
             url = reverse('admin:analytics_analysisinsight_changelist')
             return format_html(
@@ -124,27 +178,33 @@ class AnalysisAdmin(admin.ModelAdmin):
             )
         return '0 insights'
     insights_count.short_description = 'Insights'
+    insights_count.admin_order_field = '_insights_count'
     
     def results_preview(self, obj):
         """Display preview of analysis results."""
-        if obj.openstarlab_results:
-            results = obj.openstarlab_results
-            preview = f"Events: {results.get('events_detected', 0)}<br>"
-            preview += f"Key Moments: {len(results.get('key_moments', []))}<br>"
-            preview += f"Tactical Insights: {len(results.get('tactical_insights', []))}"
-            return format_html(preview)
+        results = obj.openstarlab_results
+        if results:
+            return format_html(
+                'Events: {}<br>Key Moments: {}<br>Tactical Insights: {}',
+                results.get('events_detected', 0),
+                len(results.get('key_moments') or ()),
+                len(results.get('tactical_insights') or ())
+            )
         return 'No results available'
     results_preview.short_description = 'Results Preview'
     
     def get_queryset(self, request):
         """Optimize queryset with related objects."""
-        return super().get_queryset(request).select_related(
-            'video', 'video__user'
-        ).prefetch_related('insights', 'tasks')
+        queryset = super().get_queryset(request).select_related(
+            'video'
+        ).annotate(_insights_count=Count('insights'))
+        if _is_changelist(request):
+            queryset = queryset.defer('openstarlab_results', 'ai_insights')
+        return queryset
 
 
 @admin.register(AnalysisTask)
-class AnalysisTaskAdmin(TimestampedModelAdmin):
+class AnalysisTaskAdmin(OwnerSearchMixin, TimestampedModelAdmin):
     """Admin configuration for AnalysisTask model."""
     
     list_display = [
@@ -152,11 +212,11 @@ class AnalysisTaskAdmin(TimestampedModelAdmin):
         'duration_display', 'started_at', 'completed_at'
     ]
     list_filter = ['task_type', 'status', 'started_at']
-    search_fields = [
-        'task_name', 'analysis__video__filename', 
-        'analysis__video__user__email'
-    ]
+    search_fields = ['^task_name', '^analysis__video__filename']
+    owner_lookup = 'analysis__video__user_id'
     readonly_fields = ['duration']
+    list_select_related = ['analysis', 'analysis__video']
+    show_full_result_count = False
     
     fieldsets = (
         ('Task Information', {
@@ -173,24 +233,23 @@ class AnalysisTaskAdmin(TimestampedModelAdmin):
     
     def duration_display(self, obj):
         """Display duration in human readable format."""
-        if obj.duration:
-            minutes = obj.duration // 60
-            seconds = obj.duration % 60
-            if minutes > 0:
-                return f"{minutes}m {seconds}s"
-            return f"{seconds}s"
-        return '-'
+        return _format_seconds(obj.duration) if obj.duration else '-'
     duration_display.short_description = 'Duration'
     
     def get_queryset(self, request):
         """Optimize queryset with related objects."""
-        return super().get_queryset(request).select_related(
-            'analysis', 'analysis__video', 'analysis__video__user'
+        queryset = super().get_queryset(request).select_related(
+            'analysis', 'analysis__video'
         )
+        if _is_changelist(request):
+            queryset = queryset.defer(
+                'result_data', 'analysis__openstarlab_results', 'analysis__ai_insights'
+            )
+        return queryset
 
 
 @admin.register(AnalysisInsight)
-class AnalysisInsightAdmin(TimestampedModelAdmin):
+class AnalysisInsightAdmin(OwnerSearchMixin, TimestampedModelAdmin):
     """Admin configuration for AnalysisInsight model."""
     
     list_display = [
@@ -200,10 +259,10 @@ class AnalysisInsightAdmin(TimestampedModelAdmin):
     list_filter = [
         'insight_type', 'importance_level', 'confidence_score', 'created_at'
     ]
-    search_fields = [
-        'title', 'description', 'analysis__video__filename',
-        'analysis__video__user__email'
-    ]
+    search_fields = ['^title', '^analysis__video__filename']
+    owner_lookup = 'analysis__video__user_id'
+    list_select_related = ['analysis', 'analysis__video']
+    show_full_result_count = False
     
     fieldsets = (
         ('Insight Information', {
@@ -220,13 +279,18 @@ class AnalysisInsightAdmin(TimestampedModelAdmin):
     
     def get_queryset(self, request):
         """Optimize queryset with related objects."""
-        return super().get_queryset(request).select_related(
-            'analysis', 'analysis__video', 'analysis__video__user'
+        queryset = super().get_queryset(request).select_related(
+            'analysis', 'analysis__video'
         )
+        if _is_changelist(request):
+            queryset = queryset.defer(
+                'metadata', 'analysis__openstarlab_results', 'analysis__ai_insights'
+            )
+        return queryset
 
 
 @admin.register(AnalysisMetrics)
-class AnalysisMetricsAdmin(TimestampedModelAdmin):
+class AnalysisMetricsAdmin(OwnerSearchMixin, TimestampedModelAdmin):
     """Admin configuration for AnalysisMetrics model."""
     
     list_display = [
@@ -234,10 +298,11 @@ class AnalysisMetricsAdmin(TimestampedModelAdmin):
         'total_processing_time_display', 'events_per_minute'
     ]
     list_filter = ['accuracy_score', 'created_at']
-    search_fields = [
-        'analysis__video__filename', 'analysis__video__user__email'
-    ]
+    search_fields = ['^analysis__video__filename']
+    owner_lookup = 'analysis__video__user_id'
     readonly_fields = ['total_processing_time', 'events_per_minute']
+    list_select_related = ['analysis', 'analysis__video']
+    show_full_result_count = False
     
     fieldsets = (
         ('Analysis Reference', {
@@ -267,17 +332,16 @@ class AnalysisMetricsAdmin(TimestampedModelAdmin):
     def total_processing_time_display(self, obj):
         """Display total processing time in human readable format."""
         total_time = obj.total_processing_time
-        if total_time:
-            minutes = total_time // 60
-            seconds = total_time % 60
-            if minutes > 0:
-                return f"{minutes}m {seconds}s"
-            return f"{seconds}s"
-        return '-'
+        return _format_seconds(total_time) if total_time else '-'
     total_processing_time_display.short_description = 'Total Processing Time'
     
     def get_queryset(self, request):
         """Optimize queryset with related objects."""
-        return super().get_queryset(request).select_related(
-            'analysis', 'analysis__video', 'analysis__video__user'
+        queryset = super().get_queryset(request).select_related(
+            'analysis', 'analysis__video'
         )
+        if _is_changelist(request):
+            queryset = queryset.defer(
+                'analysis__openstarlab_results', 'analysis__ai_insights'
+            )
+        return queryset
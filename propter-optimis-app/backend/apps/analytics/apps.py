@@ -8,3 +8,8 @@ class AnalyticsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.analytics'
     verbose_name = 'Analytics'
+    
+    def ready(self):
+        """Validate OpenStarLab configuration once when the app is ready."""
+        from .config import OpenStarLabConfig
+        OpenStarLabConfig.validate_on_startup()
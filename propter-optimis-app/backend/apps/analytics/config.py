@@ -4,32 +4,77 @@ Configuration settings for OpenStarLab Intelligence Processing.
 This module contains configuration settings for all OpenStarLab processors
 and intelligence components as specified in the platform requirements.
 """
-from typing import Dict, Any, List
+from typing import Any, Mapping
+from types import MappingProxyType
+from dataclasses import dataclass
+import functools
+import logging
 import os
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+logger = logging.getLogger(__name__)
+
+
+# Snapshot of the OPENSTARLAB_* settings, read once at import time
+_OPENSTARLAB_SETTINGS = MappingProxyType({
+    name: getattr(settings, name, default)
+    for name, default in (
+        ('OPENSTARLAB_USE_GPU', False),
+        ('OPENSTARLAB_PARALLEL_PROCESSING', True),
+        ('OPENSTARLAB_MAX_WORKERS', 4),
+        ('OPENSTARLAB_MEMORY_LIMIT', 2048),
+        ('OPENSTARLAB_PROCESSING_TIMEOUT', 900),
+        ('OPENSTARLAB_MAX_CONCURRENT', 5),
+        ('OPENSTARLAB_MAX_VIDEO_SIZE', 2048),
+    )
+})
+
+_EMPTY_CONFIG = MappingProxyType({})
+
+# Ordered event/source names; the configs expose frozensets for membership tests
+_LEM3_SUPPORTED_EVENTS = (
+    'pass', 'shot', 'goal', 'tackle', 'foul', 'offside',
+    'corner_kick', 'throw_in', 'free_kick', 'penalty',
+    'yellow_card', 'red_card', 'substitution', 'dribble',
+    'clearance', 'interception', 'cross', 'header'
+)
+
+_UIED_SUPPORTED_SOURCES = (
+    'statsbomb', 'wyscout', 'datastadium',
+    'gps_tracking', 'video_analysis', 'manual_scouting'
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisIntentConfig:
+    """Processing scopes for a single analysis intent."""
+    event_detection_scope: str
+    tactical_analysis_depth: str
+    player_evaluation_scope: str
+    prediction_scope: str
+    processing_priority: str
 
-path('api/analytics/', include('apps.analytics.urls')),
 
 class OpenStarLabConfig:
     """Configuration class for OpenStarLab intelligence processing."""
     
+    # Set by validate_on_startup() when the app registry is ready
+    _VALIDATED = False
+    
     # Model Versions and Configurations
-    LEM3_CONFIG = {
+    LEM3_CONFIG = MappingProxyType({
         'model_version': 'LEM3-v1.2.0',
         'confidence_threshold': 0.65,
         'accuracy_target': 0.67,
-        'supported_events': [
-            'pass', 'shot', 'goal', 'tackle', 'foul', 'offside',
-            'corner_kick', 'throw_in', 'free_kick', 'penalty',
-            'yellow_card', 'red_card', 'substitution', 'dribble',
-            'clearance', 'interception', 'cross', 'header'
-        ],
+        'supported_events': frozenset(_LEM3_SUPPORTED_EVENTS),
+        'supported_events_ordered': _LEM3_SUPPORTED_EVENTS,
         'processing_timeout': 900,  # 15 minutes
         'batch_size': 32,
-        'use_gpu': getattr(settings, 'OPENSTARLAB_USE_GPU', False)
-    }
+        'use_gpu': _OPENSTARLAB_SETTINGS['OPENSTARLAB_USE_GPU']
+    })
     
-    NMSTPP_CONFIG = {
+    NMSTPP_CONFIG = MappingProxyType({
         'model_version': 'NMSTPP-v2.1.0',
         'formation_confidence_threshold': 0.8,
         'tactical_analysis_depth': 'advanced',
@@ -37,9 +82,9 @@ class OpenStarLabConfig:
         'possession_analysis_enabled': True,
         'formation_detection_enabled': True,
         'strategic_insights_enabled': True
-    }
+    })
     
-    RLEARN_CONFIG = {
+    RLEARN_CONFIG = MappingProxyType({
         'model_version': 'RLearn-MultiAgent-v1.5.0',
         'q_value_threshold': 0.3,
         'multi_agent_evaluation': True,
@@ -47,9 +92,9 @@ class OpenStarLabConfig:
         'team_cohesion_analysis': True,
         'performance_benchmarking': True,
         'clutch_performance_analysis': True
-    }
+    })
     
-    PREDICTIVE_CONFIG = {
+    PREDICTIVE_CONFIG = MappingProxyType({
         'model_version': 'PredictiveEngine-v1.3.0',
         'confidence_threshold': 0.7,
         'match_outcome_prediction': True,
@@ -57,49 +102,47 @@ class OpenStarLabConfig:
         'player_performance_prediction': True,
         'formation_effectiveness_prediction': True,
         'prediction_horizon_minutes': 30
-    }
+    })
     
     # UIED Format Configuration
-    UIED_CONFIG = {
+    UIED_CONFIG = MappingProxyType({
         'converter_version': 'UIED-Converter-v2.0.0',
-        'supported_sources': [
-            'statsbomb', 'wyscout', 'datastadium', 
-            'gps_tracking', 'video_analysis', 'manual_scouting'
-        ],
-        'field_dimensions': {
+        'supported_sources': frozenset(_UIED_SUPPORTED_SOURCES),
+        'supported_sources_ordered': _UIED_SUPPORTED_SOURCES,
+        'field_dimensions': MappingProxyType({
             'length': 100,  # meters
             'width': 64,    # meters
             'coordinate_system': 'normalized'  # 0-100 scale
-        },
-        'quality_thresholds': {
+        }),
+        'quality_thresholds': MappingProxyType({
             'completeness_minimum': 0.7,
             'accuracy_minimum': 0.8,
             'consistency_minimum': 0.75
-        },
+        }),
         'deduplication_enabled': True,
         'temporal_tolerance': 2.0,  # seconds
         'spatial_tolerance': 10.0   # field units
-    }
+    })
     
     # Processing Pipeline Configuration
-    PIPELINE_CONFIG = {
+    PIPELINE_CONFIG = MappingProxyType({
         'pipeline_version': 'OpenStarLab-Intelligence-v1.0.0',
-        'processing_stages': [
+        'processing_stages': (
             'preprocessing',
             'event_detection',
             'tactical_analysis', 
             'player_evaluation',
             'predictive_modeling',
             'postprocessing'
-        ],
-        'parallel_processing': getattr(settings, 'OPENSTARLAB_PARALLEL_PROCESSING', True),
-        'max_workers': getattr(settings, 'OPENSTARLAB_MAX_WORKERS', 4),
-        'memory_limit_mb': getattr(settings, 'OPENSTARLAB_MEMORY_LIMIT', 2048),
-        'processing_timeout': getattr(settings, 'OPENSTARLAB_PROCESSING_TIMEOUT', 900)
-    }
+        ),
+        'parallel_processing': _OPENSTARLAB_SETTINGS['OPENSTARLAB_PARALLEL_PROCESSING'],
+        'max_workers': _OPENSTARLAB_SETTINGS['OPENSTARLAB_MAX_WORKERS'],
+        'memory_limit_mb': _OPENSTARLAB_SETTINGS['OPENSTARLAB_MEMORY_LIMIT'],
+        'processing_timeout': _OPENSTARLAB_SETTINGS['OPENSTARLAB_PROCESSING_TIMEOUT']
+    })
     
     # Quality Assurance Configuration
-    QUALITY_CONFIG = {
+    QUALITY_CONFIG = MappingProxyType({
         'validation_enabled': True,
         'benchmark_comparison': True,
         'accuracy_validation_threshold': 0.65,
@@ -107,49 +150,58 @@ class OpenStarLabConfig:
         'confidence_validation_enabled': True,
         'error_detection_enabled': True,
         'quality_reporting_enabled': True
-    }
+    })
     
     # Analysis Intent Configurations
-    ANALYSIS_INTENT_CONFIG = {
-        'full_match': {
-            'event_detection_scope': 'comprehensive',
-            'tactical_analysis_depth': 'full',
-            'player_evaluation_scope': 'all_players',
-            'prediction_scope': 'complete',
-            'processing_priority': 'standard'
-        },
-        'individual_player': {
-            'event_detection_scope': 'player_focused',
-            'tactical_analysis_depth': 'player_context',
-            'player_evaluation_scope': 'target_player',
-            'prediction_scope': 'player_performance',
-            'processing_priority': 'fast'
-        },
-        'tactical_phase': {
-            'event_detection_scope': 'tactical_events',
-            'tactical_analysis_depth': 'comprehensive',
-            'player_evaluation_scope': 'tactical_roles',
-            'prediction_scope': 'tactical_scenarios',
-            'processing_priority': 'standard'
-        },
-        'opposition_scouting': {
-            'event_detection_scope': 'opponent_focused',
-            'tactical_analysis_depth': 'opponent_patterns',
-            'player_evaluation_scope': 'opponent_players',
-            'prediction_scope': 'opponent_weaknesses',
-            'processing_priority': 'thorough'
-        },
-        'set_piece': {
-            'event_detection_scope': 'set_piece_events',
-            'tactical_analysis_depth': 'set_piece_patterns',
-            'player_evaluation_scope': 'set_piece_roles',
-            'prediction_scope': 'set_piece_effectiveness',
-            'processing_priority': 'fast'
-        }
-    }
+    ANALYSIS_INTENT_CONFIG = MappingProxyType({
+        'full_match': AnalysisIntentConfig(
+            event_detection_scope='comprehensive',
+            tactical_analysis_depth='full',
+            player_evaluation_scope='all_players',
+            prediction_scope='complete',
+            processing_priority='standard'
+        ),
+        'individual_player': AnalysisIntentConfig(
+            event_detection_scope='player_focused',
+            tactical_analysis_depth='player_context',
+            player_evaluation_scope='target_player',
+            prediction_scope='player_performance',
+            processing_priority='fast'
+        ),
+        'tactical_phase': AnalysisIntentConfig(
+            event_detection_scope='tactical_events',
+            tactical_analysis_depth='comprehensive',
+            player_evaluation_scope='tactical_roles',
+            prediction_scope='tactical_scenarios',
+            processing_priority='standard'
+        ),
+        'opposition_scouting': AnalysisIntentConfig(
+            event_detection_scope='opponent_focused',
+            tactical_analysis_depth='opponent_patterns',
+            player_evaluation_scope='opponent_players',
+            prediction_scope='opponent_weaknesses',
+            processing_priority='thorough'
+        ),
+        'set_piece': AnalysisIntentConfig(
+            event_detection_scope='set_piece_events',
+            tactical_analysis_depth='set_piece_patterns',
+            player_evaluation_scope='set_piece_roles',
+            prediction_scope='set_piece_effectiveness',
+            processing_priority='fast'
+        )
+    })
+    
+    # Processor lookup table, built once with the class body
+    _CONFIG_MAP = MappingProxyType({
+        'lem3': LEM3_CONFIG,
+        'nmstpp': NMSTPP_CONFIG,
+        'rlearn': RLEARN_CONFIG,
+        'predictive': PREDICTIVE_CONFIG,
+        'uied': UIED_CONFIG
+    })
     
     @classmethod
-    def get_processor_config(cls, processor_type: str) -> Dict[str, Any]:
+    def get_processor_config(cls, processor_type: str) -> Mapping[str, Any]:
         """
         Get configuration for specific processor type.
         
@@ -157,20 +209,12 @@ class OpenStarLabConfig:
             processor_type: Type of processor ('lem3', 'nmstpp', 'rlearn', 'predictive', 'uied')
             
         Returns:
-            Configuration dictionary for the processor
+            Read-only configuration mapping for the processor
         """
-        config_map = {
-            'lem3': cls.LEM3_CONFIG,
-            'nmstpp': cls.NMSTPP_CONFIG,
-            'rlearn': cls.RLEARN_CONFIG,
-            'predictive': cls.PREDICTIVE_CONFIG,
-            'uied': cls.UIED_CONFIG
-        }
-        
-        return config_map.get(processor_type, {})
+        return cls._CONFIG_MAP.get(processor_type, _EMPTY_CONFIG)
     
     @classmethod
-    def get_analysis_intent_config(cls, intent: str) -> Dict[str, Any]:
+    def get_analysis_intent_config(cls, intent: str) -> AnalysisIntentConfig:
         """
         Get configuration for specific analysis intent.
         
@@ -178,19 +222,20 @@ class OpenStarLabConfig:
             intent: Analysis intent type
             
         Returns:
-            Configuration dictionary for the intent
+            Configuration for the intent, falling back to 'full_match'
         """
         return cls.ANALYSIS_INTENT_CONFIG.get(intent, cls.ANALYSIS_INTENT_CONFIG['full_match'])
     
     @classmethod
-    def get_performance_targets(cls) -> Dict[str, Any]:
+    @functools.cache
+    def get_performance_targets(cls) -> Mapping[str, Any]:
         """
         Get performance targets for OpenStarLab processing.
         
         Returns:
-            Dictionary of performance targets
+            Read-only mapping of performance targets
         """
-        return {
+        return MappingProxyType({
             'processing_time_target': 900,  # 15 minutes
             'accuracy_target': 0.67,        # LEM3 accuracy target
             'confidence_target': 0.85,      # Overall confidence target
@@ -198,32 +243,36 @@ class OpenStarLabConfig:
             'tactical_analysis_depth': 0.90, # Tactical analysis completeness
             'player_evaluation_coverage': 0.95, # Player evaluation coverage
             'prediction_accuracy': 0.75     # Prediction accuracy target
-        }
+        })
     
     @classmethod
-    def get_resource_limits(cls) -> Dict[str, Any]:
+    @functools.cache
+    def get_resource_limits(cls) -> Mapping[str, Any]:
         """
         Get resource limits for processing.
         
         Returns:
-            Dictionary of resource limits
+            Read-only mapping of resource limits
         """
-        return {
-            'max_memory_mb': getattr(settings, 'OPENSTARLAB_MEMORY_LIMIT', 2048),
-            'max_processing_time': getattr(settings, 'OPENSTARLAB_PROCESSING_TIMEOUT', 900),
-            'max_concurrent_analyses': getattr(settings, 'OPENSTARLAB_MAX_CONCURRENT', 5),
-            'max_video_size_mb': getattr(settings, 'OPENSTARLAB_MAX_VIDEO_SIZE', 2048),
+        return MappingProxyType({
+            'max_memory_mb': _OPENSTARLAB_SETTINGS['OPENSTARLAB_MEMORY_LIMIT'],
+            'max_processing_time': _OPENSTARLAB_SETTINGS['OPENSTARLAB_PROCESSING_TIMEOUT'],
+            'max_concurrent_analyses': _OPENSTARLAB_SETTINGS['OPENSTARLAB_MAX_CONCURRENT'],
+            'max_video_size_mb': _OPENSTARLAB_SETTINGS['OPENSTARLAB_MAX_VIDEO_SIZE'],
             'max_events_per_analysis': 1000,
             'max_insights_per_analysis': 50
-        }
+        })
     
     @classmethod
-    def validate_configuration(cls) -> bool:
+    def validate_on_startup(cls) -> None:
         """
-        Validate OpenStarLab configuration settings.
+        Validate OpenStarLab configuration settings once per process.
         
-        Returns:
-            True if configuration is valid, False otherwise
+        Called from AnalyticsConfig.ready(); the result is cached for
+        validate_configuration().
+        
+        Raises:
+            ImproperlyConfigured: If a required setting is missing or invalid
         """
         try:
             # Check required settings
@@ -237,58 +286,74 @@ class OpenStarLabConfig:
             
             for setting in required_settings:
                 if not hasattr(cls, setting):
-                    return False
+                    raise ImproperlyConfigured(f"OpenStarLab setting {setting} is missing")
             
             # Validate confidence thresholds
-            if cls.LEM3_CONFIG['confidence_threshold'] < 0.0 or cls.LEM3_CONFIG['confidence_threshold'] > 1.0:
-                return False
+            confidence_threshold = cls.LEM3_CONFIG['confidence_threshold']
+            if confidence_threshold < 0.0 or confidence_threshold > 1.0:
+                raise ImproperlyConfigured(
+                    f"LEM3 confidence_threshold must be within [0, 1], got {confidence_threshold}"
+                )
             
             # Validate processing timeout
-            if cls.PIPELINE_CONFIG['processing_timeout'] <= 0:
-                return False
+            processing_timeout = cls.PIPELINE_CONFIG['processing_timeout']
+            if processing_timeout <= 0:
+                raise ImproperlyConfigured(
+                    f"OpenStarLab processing_timeout must be positive, got {processing_timeout}"
+                )
             
-            return True
-            
-        except Exception:
-            return False
-
+        except (KeyError, TypeError, AttributeError) as e:
+            logger.exception("OpenStarLab configuration validation failed")
+            raise ImproperlyConfigured(f"Invalid OpenStarLab configuration: {e}") from e
+        
+        cls._VALIDATED = True
+    
+    @classmethod
+    def validate_configuration(cls) -> bool:
+        """
+        Check whether OpenStarLab configuration passed startup validation.
+        
+        Returns:
+            True if configuration is valid, False otherwise
+        """
+        return cls._VALIDATED
 
 class DataSourceConfig:
     """Configuration for different data sources."""
     
-    STATSBOMB_CONFIG = {
+    STATSBOMB_CONFIG = MappingProxyType({
         'api_version': 'v1',
         'coordinate_system': 'statsbomb',
-        'field_dimensions': {'length': 120, 'width': 80},
+        'field_dimensions': MappingProxyType({'length': 120, 'width': 80}),
         'confidence_level': 0.95,
         'temporal_resolution': 0.1,  # Sub-second precision
         'spatial_resolution': 0.5    # Half-meter precision
-    }
+    })
     
-    WYSCOUT_CONFIG = {
+    WYSCOUT_CONFIG = MappingProxyType({
         'api_version': 'v2',
         'coordinate_system': 'wyscout',
-        'field_dimensions': {'length': 100, 'width': 100},
+        'field_dimensions': MappingProxyType({'length': 100, 'width': 100}),
         'confidence_level': 0.90,
         'temporal_resolution': 1.0,  # Second precision
         'spatial_resolution': 1.0    # Meter precision
-    }
+    })
     
-    GPS_TRACKING_CONFIG = {
+    GPS_TRACKING_CONFIG = MappingProxyType({
         'sampling_rate': 25,  # Hz
         'coordinate_system': 'gps',
         'confidence_level': 0.95,  # High GPS accuracy
         'event_inference_confidence': 0.70,  # Lower for inferred events
         'positional_accuracy': 0.1  # 10cm accuracy
-    }
+    })
     
-    VIDEO_ANALYSIS_CONFIG = {
+    VIDEO_ANALYSIS_CONFIG = MappingProxyType({
         'frame_rate': 25,
-        'resolution_requirements': {'min_width': 1280, 'min_height': 720},
+        'resolution_requirements': MappingProxyType({'min_width': 1280, 'min_height': 720}),
         'confidence_threshold': 0.75,
-        'detection_models': ['yolo', 'detectron2'],
+        'detection_models': ('yolo', 'detectron2'),
         'tracking_enabled': True
-    }
+    })
 
 
 class EnvironmentConfig:
@@ -327,4 +392,4 @@ class EnvironmentConfig:
 
 
 # Export main configuration class
-__all__ = ['OpenStarLabConfig', 'DataSourceConfig', 'EnvironmentConfig']
\ No newline at end of file
+__all__ = ['OpenStarLabConfig', 'AnalysisIntentConfig', 'DataSourceConfig', 'EnvironmentConfig']
\ No newline at end of file
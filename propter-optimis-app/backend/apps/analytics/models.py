@@ -10,12 +10,171 @@ Integrates with existing Supabase analyses table:
 - processing_time (integer, nullable)
 - created_at (timestamp)
 """
-from django.db import models
+from types import MappingProxyType
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, models, transaction
+from django.db.models import DurationField, ExpressionWrapper, F, IntegerField, Prefetch, Q, Value, prefetch_related_objects
+from django.db.models.functions import Cast, Coalesce, Extract
+from django.contrib.postgres.indexes import GinIndex
 from django.utils import timezone
-from apps.core.models import TimestampedModel, AnalysisStatus, AnalysisIntent
+from django.utils.functional import cached_property
+from apps.core.models import (
+    TimestampedModel, AnalysisStatus, AnalysisIntent, AnalysisTaskType,
+    InsightType, InsightImportance
+)
 from apps.videos.models import Video
 import uuid
-import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; payload columns fall back to the stdlib codec
+    orjson = None
+
+
+# Statuses a row can still transition out of
+_ACTIVE_STATUSES = (AnalysisStatus.PENDING, AnalysisStatus.PROCESSING)
+
+
+def _elapsed_seconds(start_field, end, fallback_field):
+    """
+    SQL expression for whole seconds between a timestamp column and `end`.
+    
+    Falls back to the current value of `fallback_field` when the start
+    column is NULL, so rows that never started keep their stored value.
+    """
+    elapsed = ExpressionWrapper(Value(end) - F(start_field), output_field=DurationField())
+    return Coalesce(
+        Cast(Extract(elapsed, 'epoch'), IntegerField()),
+        F(fallback_field)
+    )
+
+
+def format_processing_time(seconds):
+    """Format a processing time in seconds as e.g. '3m 12s' or '45s'."""
+    if not seconds:
+        return 'Unknown'
+    
+    minutes, seconds = divmod(seconds, 60)
+    if minutes > 0:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+
+# Shared, read-only value for rows whose JSON object is empty
+_EMPTY_JSON_OBJECT = MappingProxyType({})
+
+
+class _MappingJSONEncoder(DjangoJSONEncoder):
+    """JSON encoder that also accepts read-only mappings."""
+    
+    def default(self, o):
+        if isinstance(o, MappingProxyType):
+            return dict(o)
+        return super().default(o)
+
+
+class SharedEmptyJSONField(models.JSONField):
+    """
+    JSONField that loads empty objects as one shared read-only mapping.
+    
+    Most rows store `{}`, so list reads would otherwise allocate a fresh
+    dict per row. Callers that need to modify a loaded value should copy
+    it with dict() first.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('encoder', _MappingJSONEncoder)
+        super().__init__(*args, **kwargs)
+    
+    def from_db_value(self, value, expression, connection):
+        # SQL NULL and missing keys in key-transform reads stay None
+        if value == '{}':
+            return _EMPTY_JSON_OBJECT
+        return super().from_db_value(value, expression, connection)
+
+
+def _orjson_dumps(value):
+    """Encode a JSON column value with orjson; non-string keys are stringified like json.dumps."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class PayloadJSONField(models.JSONField):
+    """
+    JSONField for large result payloads that uses orjson when it is installed.
+    
+    orjson encodes and parses several times faster than the stdlib json
+    module, which matters for intelligence results that run to hundreds
+    of kilobytes. Without orjson the field behaves exactly like JSONField.
+    """
+    
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if orjson is None or connection.vendor != 'postgresql':
+            return super().get_db_prep_value(value, connection, prepared)
+        if not prepared:
+            value = self.get_prep_value(value)
+        if value is None or hasattr(value, 'as_sql'):
+            return super().get_db_prep_value(value, connection, prepared=True)
+        # Imported here so other backends don't need a psycopg driver
+        from django.db.backends.postgresql.psycopg_any import Jsonb
+        return Jsonb(value, dumps=_orjson_dumps)
+    
+    def from_db_value(self, value, expression, connection):
+        if orjson is None or not isinstance(value, str):
+            return super().from_db_value(value, expression, connection)
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return value
+
+
+def _detail_prefetches():
+    """Child rows the detail serializer reads; tasks skip result_data, which the API never returns."""
+    return (
+        Prefetch('tasks', queryset=AnalysisTask.objects.defer('result_data')),
+        'insights'
+    )
+
+
+class AnalysisQuerySet(models.QuerySet):
+    """QuerySet helpers for analyses."""
+    
+    def list_values(self):
+        """Dict rows with just the columns the list serializer reads."""
+        return self.values(
+            'id', 'video__filename', 'video__duration', 'video__analysis_intent',
+            'status', 'progress_percentage', 'current_step', 'processing_time',
+            'created_at', 'completed_at'
+        )
+    
+    def with_related(self):
+        """Load everything the detail serializer reads in a fixed number of queries."""
+        return self.select_related('video', 'metrics').prefetch_related(*_detail_prefetches())
+
+
+class AnalysisManager(models.Manager.from_queryset(AnalysisQuerySet)):
+    """Default manager that joins the video, which nearly every caller reads."""
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related('video')
+
+
+class BulkInsertManager(models.Manager):
+    """Manager for child rows that are fanned out several at a time."""
+    
+    def bulk_insert_models(self, objs, batch_size=500):
+        """
+        Insert unsaved instances with multi-row INSERTs.
+        
+        Args:
+            objs: Iterable of unsaved model instances
+            batch_size: Maximum rows per INSERT statement
+            
+        Returns:
+            List of created instances
+        """
+        return self.bulk_create(list(objs), batch_size=batch_size)
 
 
 class Analysis(models.Model):
@@ -26,12 +185,13 @@ class Analysis(models.Model):
         Video, 
         on_delete=models.CASCADE, 
         related_name='analyses',
-        db_column='video_id'  # Map to Supabase column name
+        db_column='video_id',  # Map to Supabase column name
+        db_index=False  # Covered by analyses_video_status_idx
     )
-    openstarlab_results = models.JSONField(blank=True, null=True)
-    ai_insights = models.JSONField(blank=True, null=True)
+    openstarlab_results = PayloadJSONField(blank=True, null=True)
+    ai_insights = PayloadJSONField(blank=True, null=True)
     status = models.CharField(
-        max_length=50, 
+        max_length=20, 
         choices=AnalysisStatus.choices, 
         default=AnalysisStatus.PENDING
     )
@@ -43,14 +203,39 @@ class Analysis(models.Model):
     error_message = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(default=timezone.now)
     
+    objects = AnalysisManager()
+    
     class Meta:
         db_table = 'analyses'  # Map to existing Supabase table
         verbose_name = 'Analysis'
         verbose_name_plural = 'Analyses'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-created_at'], name='analyses_status_created_idx'),
+            models.Index(fields=['video', 'status'], name='analyses_video_status_idx'),
+            # In-flight analyses are a small, frequently polled subset
+            models.Index(
+                fields=['-created_at'],
+                name='analyses_active_idx',
+                condition=Q(status__in=_ACTIVE_STATUSES)
+            ),
+            GinIndex(
+                fields=['openstarlab_results'],
+                opclasses=['jsonb_path_ops'],
+                name='analyses_osl_gin'
+            ),
+            GinIndex(
+                fields=['ai_insights'],
+                opclasses=['jsonb_path_ops'],
+                name='analyses_ai_insights_gin'
+            ),
+        ]
     
     def __str__(self):
-        return f"Analysis for {self.video.filename} - {self.status}"
+        # Don't fire a query just to render a label
+        if Analysis.video.is_cached(self):
+            return f"Analysis for {self.video.filename} - {self.status}"
+        return f"Analysis {self.pk} - {self.status}"
     
     @property
     def is_completed(self):
@@ -67,58 +252,118 @@ class Analysis(models.Model):
         """Check if analysis is currently processing."""
         return self.status == AnalysisStatus.PROCESSING
     
-    @property
+    @cached_property
     def formatted_processing_time(self):
         """Format processing time in human readable format."""
-        if not self.processing_time:
-            return 'Unknown'
-        
-        minutes = self.processing_time // 60
-        seconds = self.processing_time % 60
-        
-        if minutes > 0:
-            return f"{minutes}m {seconds}s"
-        else:
-            return f"{seconds}s"
+        return format_processing_time(self.processing_time)
+    
+    def load_related(self):
+        """Load the relations the detail serializer reads onto an already fetched analysis."""
+        prefetch_related_objects([self], 'metrics', *_detail_prefetches())
     
     def mark_started(self):
         """Mark analysis as started."""
         self.status = AnalysisStatus.PROCESSING
         self.started_at = timezone.now()
-        self.save()
+        self.save(update_fields=['status', 'started_at'])
     
     def mark_completed(self, results=None, insights=None, processing_time=None):
-        """Mark analysis as completed."""
-        self.status = AnalysisStatus.COMPLETED
-        self.completed_at = timezone.now()
-        self.progress_percentage = 100
+        """
+        Mark analysis as completed.
+        
+        Only a pending or processing row transitions, and only one worker
+        can claim it, so a duplicate completion is a no-op.
+        
+        Returns:
+            True if this call completed the analysis, False otherwise
+        """
+        now = timezone.now()
+        changes = {
+            'status': AnalysisStatus.COMPLETED,
+            'completed_at': now,
+            'progress_percentage': 100,
+        }
         
         if results:
-            self.openstarlab_results = results
+            changes['openstarlab_results'] = results
         if insights:
-            self.ai_insights = insights
+            changes['ai_insights'] = insights
         if processing_time:
-            self.processing_time = processing_time
-        elif self.started_at:
-            # Calculate processing time
-            duration = self.completed_at - self.started_at
-            self.processing_time = int(duration.total_seconds())
+            changes['processing_time'] = processing_time
+        else:
+            changes['processing_time'] = _elapsed_seconds('started_at', now, 'processing_time')
         
-        self.save()
+        updated = self._apply_transition(changes)
+        
+        if updated:
+            self.status = AnalysisStatus.COMPLETED
+            self.completed_at = now
+            self.progress_percentage = 100
+            self.__dict__.pop('formatted_processing_time', None)
+            if results:
+                self.openstarlab_results = results
+            if insights:
+                self.ai_insights = insights
+            if processing_time:
+                self.processing_time = processing_time
+            elif self.started_at:
+                self.processing_time = int((now - self.started_at).total_seconds())
+        
+        return bool(updated)
     
     def mark_failed(self, error_message=None):
-        """Mark analysis as failed."""
-        self.status = AnalysisStatus.FAILED
-        self.completed_at = timezone.now()
+        """
+        Mark analysis as failed.
+        
+        Returns:
+            True if this call failed the analysis, False if it had already
+            finished
+        """
+        now = timezone.now()
+        changes = {
+            'status': AnalysisStatus.FAILED,
+            'completed_at': now,
+            'processing_time': _elapsed_seconds('started_at', now, 'processing_time'),
+        }
         
         if error_message:
-            self.error_message = error_message
+            changes['error_message'] = error_message
+        
+        updated = self._apply_transition(changes)
+        
+        if updated:
+            self.status = AnalysisStatus.FAILED
+            self.completed_at = now
+            self.__dict__.pop('formatted_processing_time', None)
+            if error_message:
+                self.error_message = error_message
+            if self.started_at:
+                self.processing_time = int((now - self.started_at).total_seconds())
+        
+        return bool(updated)
+    
+    def _apply_transition(self, changes):
+        """
+        Apply a terminal transition if this worker can claim the row.
         
-        if self.started_at:
-            duration = self.completed_at - self.started_at
-            self.processing_time = int(duration.total_seconds())
+        The row is locked with SKIP LOCKED, so when workers race on the same
+        analysis the loser returns straight away instead of waiting to write
+        the same payload again.
         
-        self.save()
+        Returns:
+            Number of rows updated (0 or 1)
+        """
+        with transaction.atomic():
+            claimed = Analysis.objects.select_for_update(
+                skip_locked=True, of=('self',)
+            ).filter(
+                pk=self.pk, status__in=_ACTIVE_STATUSES
+            ).values_list('pk', flat=True).first()
+            
+            if claimed is None:
+                return 0
+            
+            return Analysis.objects.filter(pk=self.pk).update(**changes)
     
     def update_progress(self, percentage, step=None):
         """Update analysis progress."""
@@ -127,7 +372,22 @@ class Analysis(models.Model):
         if step:
             self.current_step = step
         
-        self.save()
+        Analysis.set_progress(self.pk, self.progress_percentage, step)
+    
+    @classmethod
+    def set_progress(cls, pk, percentage, step=None):
+        """
+        Update progress for an analysis by primary key.
+        
+        Issues a single UPDATE without loading the row, for progress ticks
+        from workers that only hold the analysis id.
+        """
+        changes = {'progress_percentage': min(100, max(0, percentage))}
+        
+        if step:
+            changes['current_step'] = step
+        
+        return cls.objects.filter(pk=pk).update(**changes)
 
 
 class AnalysisTask(TimestampedModel):
@@ -140,15 +400,8 @@ class AnalysisTask(TimestampedModel):
     )
     task_name = models.CharField(max_length=100)
     task_type = models.CharField(
-        max_length=50,
-        choices=[
-            ('preprocessing', 'Preprocessing'),
-            ('event_modeling', 'Event Modeling'),
-            ('tactical_analysis', 'Tactical Analysis'),
-            ('player_tracking', 'Player Tracking'),
-            ('insight_generation', 'Insight Generation'),
-            ('postprocessing', 'Postprocessing')
-        ]
+        max_length=20,
+        choices=AnalysisTaskType.choices
     )
     status = models.CharField(
         max_length=20, 
@@ -161,10 +414,20 @@ class AnalysisTask(TimestampedModel):
     result_data = models.JSONField(blank=True, null=True)
     error_message = models.TextField(blank=True, null=True)
     
+    objects = BulkInsertManager()
+    
     class Meta:
         verbose_name = 'Analysis Task'
         verbose_name_plural = 'Analysis Tasks'
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['analysis', 'status'], name='analysis_task_status_idx'),
+            GinIndex(
+                fields=['result_data'],
+                opclasses=['jsonb_path_ops'],
+                name='analysis_task_result_gin'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.task_name} - {self.status}"
@@ -173,35 +436,61 @@ class AnalysisTask(TimestampedModel):
         """Mark task as started."""
         self.status = AnalysisStatus.PROCESSING
         self.started_at = timezone.now()
-        self.save()
+        self.save(update_fields=['status', 'started_at', 'updated_at'])
     
     def mark_completed(self, result_data=None):
-        """Mark task as completed."""
-        self.status = AnalysisStatus.COMPLETED
-        self.completed_at = timezone.now()
+        """Mark task as completed with a single conditional UPDATE."""
+        now = timezone.now()
+        changes = {
+            'status': AnalysisStatus.COMPLETED,
+            'completed_at': now,
+            'updated_at': now,
+            'duration': _elapsed_seconds('started_at', now, 'duration'),
+        }
         
         if result_data:
-            self.result_data = result_data
+            changes['result_data'] = result_data
+        
+        updated = AnalysisTask.objects.filter(
+            pk=self.pk, status__in=_ACTIVE_STATUSES
+        ).update(**changes)
         
-        if self.started_at:
-            duration = self.completed_at - self.started_at
-            self.duration = int(duration.total_seconds())
+        if updated:
+            self.status = AnalysisStatus.COMPLETED
+            self.completed_at = self.updated_at = now
+            if result_data:
+                self.result_data = result_data
+            if self.started_at:
+                self.duration = int((now - self.started_at).total_seconds())
         
-        self.save()
+        return bool(updated)
     
     def mark_failed(self, error_message=None):
-        """Mark task as failed."""
-        self.status = AnalysisStatus.FAILED
-        self.completed_at = timezone.now()
+        """Mark task as failed with a single conditional UPDATE."""
+        now = timezone.now()
+        changes = {
+            'status': AnalysisStatus.FAILED,
+            'completed_at': now,
+            'updated_at': now,
+            'duration': _elapsed_seconds('started_at', now, 'duration'),
+        }
         
         if error_message:
-            self.error_message = error_message
+            changes['error_message'] = error_message
+        
+        updated = AnalysisTask.objects.filter(
+            pk=self.pk, status__in=_ACTIVE_STATUSES
+        ).update(**changes)
         
-        if self.started_at:
-            duration = self.completed_at - self.started_at
-            self.duration = int(duration.total_seconds())
+        if updated:
+            self.status = AnalysisStatus.FAILED
+            self.completed_at = self.updated_at = now
+            if error_message:
+                self.error_message = error_message
+            if self.started_at:
+                self.duration = int((now - self.started_at).total_seconds())
         
-        self.save()
+        return bool(updated)
 
 
 class AnalysisInsight(TimestampedModel):
@@ -213,35 +502,41 @@ class AnalysisInsight(TimestampedModel):
         related_name='insights'
     )
     insight_type = models.CharField(
-        max_length=50,
-        choices=[
-            ('tactical_pattern', 'Tactical Pattern'),
-            ('player_performance', 'Player Performance'),
-            ('team_dynamics', 'Team Dynamics'),
-            ('key_moments', 'Key Moments'),
-            ('statistical_summary', 'Statistical Summary'),
-            ('recommendation', 'Recommendation')
-        ]
+        max_length=20,
+        choices=InsightType.choices
     )
     title = models.CharField(max_length=200)
     description = models.TextField()
     confidence_score = models.FloatField(default=0.0)  # 0.0 to 1.0
-    importance_level = models.CharField(
-        max_length=20,
-        choices=[
-            ('low', 'Low'),
-            ('medium', 'Medium'),
-            ('high', 'High'),
-            ('critical', 'Critical')
-        ],
-        default='medium'
+    importance_level = models.PositiveSmallIntegerField(
+        choices=InsightImportance.choices,
+        default=InsightImportance.MEDIUM
     )
-    metadata = models.JSONField(default=dict)  # Additional insight data
+    metadata = SharedEmptyJSONField(default=dict)  # Additional insight data
+    
+    objects = BulkInsertManager()
     
     class Meta:
         verbose_name = 'Analysis Insight'
         verbose_name_plural = 'Analysis Insights'
         ordering = ['-importance_level', '-confidence_score', '-created_at']
+        indexes = [
+            models.Index(
+                fields=['analysis', '-importance_level', '-confidence_score'],
+                name='analysis_insight_rank_idx'
+            ),
+            GinIndex(
+                fields=['metadata'],
+                opclasses=['jsonb_path_ops'],
+                name='analysis_insight_meta_gin'
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=Q(importance_level__gte=1, importance_level__lte=4),
+                name='analysis_insight_importance_range'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.insight_type})"
@@ -271,6 +566,9 @@ class AnalysisMetrics(TimestampedModel):
     cpu_time_used = models.FloatField(default=0.0)  # CPU seconds
     memory_peak_mb = models.IntegerField(default=0)  # Peak memory usage in MB
     
+    # Copied from the video when metrics are recorded, so rates don't need a join
+    video_duration_seconds = models.PositiveIntegerField(default=0)
+    
     class Meta:
         verbose_name = 'Analysis Metrics'
         verbose_name_plural = 'Analysis Metrics'
@@ -278,15 +576,75 @@ class AnalysisMetrics(TimestampedModel):
     def __str__(self):
         return f"Metrics for {self.analysis}"
     
-    @property
+    @cached_property
     def total_processing_time(self):
         """Get total processing time."""
         return self.preprocessing_time + self.analysis_time + self.postprocessing_time
     
-    @property
+    @cached_property
     def events_per_minute(self):
         """Calculate events detected per minute of video."""
-        if self.analysis.video.duration and self.analysis.video.duration > 0:
-            minutes = self.analysis.video.duration / 60
+        # Rows recorded before the duration was copied fall back to the video
+        duration = self.video_duration_seconds or self.analysis.video.duration
+        if duration and duration > 0:
+            minutes = duration / 60
             return round(self.events_detected / minutes, 2)
         return 0
+
+
+class AnalysisDashboardDaily(models.Model):
+    """
+    Read-only daily roll-up of analyses, backed by a materialized view.
+    
+    The view is created by a Supabase migration once the metrics table
+    exists and refreshed periodically, so rows may lag live data by up to
+    one refresh interval.
+    """
+    
+    REFRESHED_AT_CACHE_KEY = 'analytics:dashboard_daily:refreshed_at'
+    
+    id = models.CharField(max_length=40, primary_key=True)  # "<day>:<status>"
+    day = models.DateField()
+    status = models.CharField(max_length=20, choices=AnalysisStatus.choices)
+    analysis_count = models.IntegerField()
+    avg_processing_time = models.FloatField(blank=True, null=True)
+    events_detected = models.BigIntegerField()
+    
+    class Meta:
+        managed = False
+        db_table = 'analytics_dashboard_daily'
+        verbose_name = 'Analysis Dashboard Day'
+        verbose_name_plural = 'Analysis Dashboard Days'
+        ordering = ['-day', 'status']
+    
+    def __str__(self):
+        return f"{self.day} - {self.status}"
+    
+    @classmethod
+    def exists(cls):
+        """Check whether the Supabase migration has created the view yet."""
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT to_regclass(%s) IS NOT NULL', [cls._meta.db_table])
+            return cursor.fetchone()[0]
+    
+    @classmethod
+    def refresh(cls):
+        """
+        Refresh the materialized view without blocking readers.
+        
+        Returns:
+            Refresh time, or None if the view has not been created yet
+        """
+        if not cls.exists():
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(f'REFRESH MATERIALIZED VIEW CONCURRENTLY {cls._meta.db_table}')
+        
+        refreshed_at = timezone.now()
+        cache.set(cls.REFRESHED_AT_CACHE_KEY, refreshed_at.isoformat(), None)
+        return refreshed_at
+    
+    @classmethod
+    def last_refreshed_at(cls):
+        """Return the ISO timestamp of the last refresh, if known."""
+        return cache.get(cls.REFRESHED_AT_CACHE_KEY)
@@ -7,8 +7,12 @@ This module implements the core AI processing pipeline using OpenStarLab package
 - RLearn package for player evaluation
 - UIED format processing for data standardization
 """
+import contextlib
+import hashlib
 import logging
 import numpy as np
+from collections import defaultdict
+from itertools import count
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -16,6 +20,10 @@ import json
 import time
 from datetime import datetime, timedelta
 
+from django.core.cache import cache
+
+from ._kernels import aggregate_confidence, compute_q_batch, q_value_stats
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,7 +40,7 @@ class ProcessingStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class IntelligenceResults:
     """Container for OpenStarLab intelligence results."""
     events: List[Dict[str, Any]]
@@ -43,6 +51,149 @@ class IntelligenceResults:
     processing_metadata: Dict[str, Any]
 
 
+_LEM3_EVENT_TYPES = (
+    'pass', 'shot', 'goal', 'tackle', 'foul', 'offside',
+    'corner_kick', 'throw_in', 'free_kick', 'penalty',
+    'yellow_card', 'red_card', 'substitution', 'dribble',
+    'clearance', 'interception', 'cross', 'header'
+)
+_FIELD_ZONES = ('defensive_third', 'middle_third', 'attacking_third')
+_FIELD_ZONE_PROBS = (0.3, 0.4, 0.3)
+_LEM3_TACTICAL_PHASES = ('build_up', 'progression', 'final_third', 'defensive_block', 'transition')
+_PHASES_OF_PLAY = ('attack', 'defense', 'transition')
+_PRESSURE_LEVELS = ('low', 'medium', 'high')
+_PLAYER_POSITIONS = ('GK', 'DEF', 'MID', 'FWD')
+_TEAMS = ('home', 'away')
+
+# Realistic relative frequency of each event type
+_LEM3_EVENT_FREQUENCIES = {
+    'pass': 0.25, 'dribble': 0.15, 'tackle': 0.12, 'shot': 0.08,
+    'foul': 0.08, 'clearance': 0.07, 'interception': 0.06,
+    'cross': 0.05, 'header': 0.04, 'throw_in': 0.03,
+    'corner_kick': 0.02, 'free_kick': 0.02, 'offside': 0.015,
+    'goal': 0.01, 'yellow_card': 0.008, 'substitution': 0.005,
+    'red_card': 0.002, 'penalty': 0.002
+}
+
+# Players involved per event type; 0 means drawn per event (goals)
+_LEM3_PLAYER_COUNTS = {
+    'pass': 2, 'tackle': 2, 'foul': 2, 'shot': 1,
+    'goal': 0, 'dribble': 1,
+    'substitution': 2, 'yellow_card': 1, 'red_card': 1
+}
+
+
+def _index_of(values: Tuple[str, ...]) -> Dict[str, int]:
+    """Map each label to its position in ``values``."""
+    return {name: i for i, name in enumerate(values)}
+
+
+_EVENT_TYPE_IDS = _index_of(_LEM3_EVENT_TYPES)
+_ZONE_IDS = _index_of(_FIELD_ZONES)
+_TACTICAL_PHASE_IDS = _index_of(_LEM3_TACTICAL_PHASES)
+_POSITION_IDS = _index_of(_PLAYER_POSITIONS)
+_TEAM_IDS = _index_of(_TEAMS)
+_PHASE_OF_PLAY_IDS = _index_of(_PHASES_OF_PLAY)
+_PRESSURE_LEVEL_IDS = _index_of(_PRESSURE_LEVELS)
+
+_POSSESSION_EVENT_IDS = np.array([_EVENT_TYPE_IDS[e] for e in ('pass', 'dribble', 'cross')])
+
+
+@dataclass
+class EventBatch:
+    """
+    Column-oriented view of a list of LEM3 events.
+    
+    Categorical columns hold indexes into the module label tuples
+    (_LEM3_EVENT_TYPES, _FIELD_ZONES, ...), with len(labels) for unknown
+    values. Players are flattened CSR-style: the players of event i are
+    rows player_offsets[i]:player_offsets[i + 1] of the player_* columns,
+    and player_index points into player_ids (in order of first appearance).
+    Events themselves stay dicts at the API boundary.
+    """
+    timestamp: np.ndarray
+    confidence: np.ndarray
+    event_type: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    zone: np.ndarray
+    tactical_phase: np.ndarray
+    phase_of_play: np.ndarray
+    pressure_level: np.ndarray
+    player_offsets: np.ndarray
+    player_index: np.ndarray
+    player_team: np.ndarray
+    player_position: np.ndarray
+    player_ids: List[str]
+    
+    @classmethod
+    def from_events(cls, events: List[Dict[str, Any]]) -> 'EventBatch':
+        """Build a batch from event dicts in a single pass."""
+        n = len(events)
+        timestamp = np.empty(n)
+        confidence = np.empty(n)
+        event_type = np.empty(n, dtype=np.int8)
+        x = np.empty(n)
+        y = np.empty(n)
+        zone = np.empty(n, dtype=np.int8)
+        tactical_phase = np.empty(n, dtype=np.int8)
+        phase_of_play = np.empty(n, dtype=np.int8)
+        pressure_level = np.empty(n, dtype=np.int8)
+        player_offsets = np.zeros(n + 1, dtype=np.int32)
+        player_slots = defaultdict(count().__next__)  # player_id -> first-appearance index
+        player_index = []
+        player_team = []
+        player_position = []
+        
+        for i, event in enumerate(events):
+            coordinates = event['coordinates']
+            timestamp[i] = event['timestamp']
+            confidence[i] = event['confidence']
+            event_type[i] = _EVENT_TYPE_IDS.get(event['event_type'], len(_LEM3_EVENT_TYPES))
+            x[i] = coordinates['x']
+            y[i] = coordinates['y']
+            zone[i] = _ZONE_IDS.get(coordinates['zone'], len(_FIELD_ZONES))
+            tactical_phase[i] = _TACTICAL_PHASE_IDS.get(event['tactical_phase'], len(_LEM3_TACTICAL_PHASES))
+            context = event['contextual_features']
+            phase_of_play[i] = _PHASE_OF_PLAY_IDS.get(context.get('phase_of_play', 'transition'), len(_PHASES_OF_PLAY))
+            pressure_level[i] = _PRESSURE_LEVEL_IDS.get(context.get('pressure_level', 'medium'), len(_PRESSURE_LEVELS))
+            for player in event['players_involved']:
+                player_index.append(player_slots[player['player_id']])
+                player_team.append(_TEAM_IDS.get(player['team'], len(_TEAMS)))
+                player_position.append(_POSITION_IDS.get(player['position'], len(_PLAYER_POSITIONS)))
+            player_offsets[i + 1] = len(player_team)
+        
+        return cls(
+            timestamp=timestamp,
+            confidence=confidence,
+            event_type=event_type,
+            x=x,
+            y=y,
+            zone=zone,
+            tactical_phase=tactical_phase,
+            phase_of_play=phase_of_play,
+            pressure_level=pressure_level,
+            player_offsets=player_offsets,
+            player_index=np.array(player_index, dtype=np.int32),
+            player_team=np.array(player_team, dtype=np.int8),
+            player_position=np.array(player_position, dtype=np.int8),
+            player_ids=list(player_slots)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.timestamp)
+    
+    def event_of_player(self) -> np.ndarray:
+        """Event row of every flattened player row."""
+        return np.repeat(np.arange(len(self)), np.diff(self.player_offsets))
+    
+    def involves_team(self, team: str) -> np.ndarray:
+        """Boolean mask of events with at least one player from ``team``."""
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.event_of_player()[self.player_team == _TEAM_IDS[team]]] = True
+        return mask
+
+
 class LEM3EventProcessor:
     """
     LEM3 (Latent Event Model 3) processor for football event detection.
@@ -51,21 +202,23 @@ class LEM3EventProcessor:
     with 65%+ accuracy as specified in the platform vision.
     """
     
-    SUPPORTED_EVENTS = [
-        'pass', 'shot', 'goal', 'tackle', 'foul', 'offside',
-        'corner_kick', 'throw_in', 'free_kick', 'penalty',
-        'yellow_card', 'red_card', 'substitution', 'dribble',
-        'clearance', 'interception', 'cross', 'header'
-    ]
+    SUPPORTED_EVENTS = list(_LEM3_EVENT_TYPES)
     
-    def __init__(self, model_config: Optional[Dict] = None):
+    # Sampling distribution in SUPPORTED_EVENTS order, normalized once
+    _EVENT_PROBS = np.array([_LEM3_EVENT_FREQUENCIES.get(e, 0.001) for e in SUPPORTED_EVENTS])
+    _EVENT_PROBS /= _EVENT_PROBS.sum()
+    _PLAYER_COUNTS = np.array([_LEM3_PLAYER_COUNTS.get(e, 1) for e in SUPPORTED_EVENTS])
+    
+    def __init__(self, model_config: Optional[Dict] = None,
+                 rng: Optional[np.random.Generator] = None):
         """Initialize LEM3 processor with configuration."""
         self.model_config = model_config or {}
         self.confidence_threshold = self.model_config.get('confidence_threshold', 0.65)
         self.model_version = "LEM3-v1.2.0"
         self.accuracy_target = 0.67  # Based on OpenStarLab benchmarks
+        self._rng = rng if rng is not None else np.random.default_rng()
         
-        logger.info(f"Initialized LEM3 processor with confidence threshold: {self.confidence_threshold}")
+        logger.info("Initialized LEM3 processor with confidence threshold: %s", self.confidence_threshold)
     
     def detect_events(self, video_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -78,175 +231,191 @@ class LEM3EventProcessor:
             List of detected events with metadata
         """
         logger.info("Starting LEM3 event detection")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Simulate LEM3 processing (in production, this would call actual model)
-            events = self._process_with_lem3(video_data)
+            events, confidences = self._process_with_lem3(video_data)
             
-            # Apply confidence filtering
-            filtered_events = [
-                event for event in events 
-                if event['confidence'] >= self.confidence_threshold
-            ]
+            # Apply confidence filtering with one mask over the confidence column
+            keep = np.flatnonzero(confidences >= self.confidence_threshold)
+            filtered_events = [events[i] for i in keep.tolist()]
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
-            logger.info(f"LEM3 detected {len(filtered_events)} events in {processing_time:.2f}s")
+            logger.info("LEM3 detected %d events in %.2fs", len(filtered_events), processing_time)
             
-            # Add processing metadata
-            for event in filtered_events:
-                event['model_version'] = self.model_version
-                event['processing_timestamp'] = datetime.now().isoformat()
-                event['accuracy_score'] = self._calculate_event_accuracy(event)
+            # Add processing metadata; one timestamp covers the whole run
+            model_version = self.model_version
+            processed_at = datetime.now().isoformat()
+            accuracy_scores = self._calculate_event_accuracy(
+                filtered_events, confidences[keep]
+            ).tolist()
+            for event, accuracy in zip(filtered_events, accuracy_scores):
+                event['model_version'] = model_version
+                event['processing_timestamp'] = processed_at
+                event['accuracy_score'] = accuracy
             
             return filtered_events
             
         except Exception as e:
-            logger.error(f"LEM3 event detection failed: {str(e)}")
+            logger.error("LEM3 event detection failed: %s", e)
             raise
     
-    def _process_with_lem3(self, video_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Process video data with LEM3 model (simulated)."""
+    def _process_with_lem3(self, video_data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+        """
+        Process video data with LEM3 model (simulated).
+        
+        Every per-event attribute is drawn as one array for the whole match,
+        then events are assembled in chronological order in a single pass.
+        
+        Returns:
+            Tuple of (events, confidences), both in chronological order
+        """
         duration = video_data.get('duration', 90 * 60)  # Default 90 minutes
         frame_rate = video_data.get('frame_rate', 25)
         total_frames = duration * frame_rate
         
-        # Simulate intelligent event detection based on video characteristics
-        events = []
-        
         # Generate events with realistic distribution
         num_events = max(25, int(duration / 60 * 0.8))  # ~0.8 events per minute
         
-        for i in range(num_events):
-            event_time = np.random.uniform(0, duration)
-            event_type = np.random.choice(
-                self.SUPPORTED_EVENTS,
-                p=self._get_event_probabilities()
-            )
-            
-            # Simulate LEM3 confidence scoring
-            base_confidence = np.random.beta(3, 1)  # Skewed toward high confidence
-            confidence = max(0.45, min(0.98, base_confidence))
+        rng = self._rng
+        
+        times = rng.uniform(0, duration, num_events)
+        type_idx = rng.choice(len(self.SUPPORTED_EVENTS), size=num_events, p=self._EVENT_PROBS)
+        # Simulate LEM3 confidence scoring, skewed toward high confidence
+        confidences = np.clip(rng.beta(3, 1, num_events), 0.45, 0.98)
+        xs = rng.uniform(0, 100, num_events)
+        ys = rng.uniform(0, 100, num_events)
+        zone_idx = rng.choice(len(_FIELD_ZONES), size=num_events, p=_FIELD_ZONE_PROBS)
+        play_idx = rng.integers(0, len(_PHASES_OF_PLAY), num_events)
+        pressure_idx = rng.integers(0, len(_PRESSURE_LEVELS), num_events)
+        tempos = rng.uniform(0.3, 1.0, num_events)
+        tilts = rng.uniform(-1.0, 1.0, num_events)  # -1 = defensive, +1 = attacking
+        phase_idx = rng.integers(0, len(_LEM3_TACTICAL_PHASES), num_events)
+        # Events can be part of 1-8 event sequences
+        sequence_lengths = rng.integers(1, 8, num_events)
+        
+        players = self._draw_players(type_idx)
+        
+        times_list = times.tolist()
+        # MM:SS labels from whole seconds, split once for all events
+        minutes, seconds = np.divmod(times.astype(np.int64), 60)
+        minutes_list, seconds_list = minutes.tolist(), seconds.tolist()
+        type_list = type_idx.tolist()
+        confidence_list = confidences.tolist()
+        xs_list, ys_list = xs.tolist(), ys.tolist()
+        zone_list = zone_idx.tolist()
+        play_list, pressure_list = play_idx.tolist(), pressure_idx.tolist()
+        tempo_list, tilt_list = tempos.tolist(), tilts.tolist()
+        phase_list = phase_idx.tolist()
+        sequence_list = sequence_lengths.tolist()
+        
+        # Build events chronologically; ids keep their generation index
+        order = np.argsort(times, kind='stable')
+        events = []
+        for i in order.tolist():
+            event_time = times_list[i]
+            event_type = self.SUPPORTED_EVENTS[type_list[i]]
+            sequence_length = sequence_list[i]
             
-            event = {
+            events.append({
                 'id': f"lem3_event_{i:04d}",
                 'timestamp': event_time,
-                'formatted_time': self._format_timestamp(event_time),
+                'formatted_time': f"{minutes_list[i]:02d}:{seconds_list[i]:02d}",
                 'event_type': event_type,
-                'confidence': confidence,
-                'coordinates': self._generate_field_coordinates(),
-                'players_involved': self._identify_players(event_type),
-                'contextual_features': self._extract_context_features(event_type, event_time),
-                'tactical_phase': self._determine_tactical_phase(),
-                'sequence_id': self._generate_sequence_id(i)
-            }
-            
-            events.append(event)
-        
-        # Sort events chronologically
-        events.sort(key=lambda x: x['timestamp'])
+                'confidence': confidence_list[i],
+                'coordinates': {
+                    'x': xs_list[i],
+                    'y': ys_list[i],
+                    'zone': _FIELD_ZONES[zone_list[i]]
+                },
+                'players_involved': players[i],
+                'contextual_features': {
+                    'match_period': 'first_half' if event_time < 45 * 60 else 'second_half',
+                    'phase_of_play': _PHASES_OF_PLAY[play_list[i]],
+                    'pressure_level': _PRESSURE_LEVELS[pressure_list[i]],
+                    'tempo': tempo_list[i],
+                    'field_tilt': tilt_list[i]
+                },
+                'tactical_phase': _LEM3_TACTICAL_PHASES[phase_list[i]],
+                'sequence_id': f"seq_{max(0, i - sequence_length + 1):04d}_{sequence_length}"
+            })
         
         # Add sequence relationships
-        events = self._add_sequence_relationships(events)
+        events = self._add_sequence_relationships(events, times[order])
         
-        return events
+        return events, confidences[order]
     
-    def _get_event_probabilities(self) -> np.ndarray:
-        """Get realistic probability distribution for event types."""
-        probs = {
-            'pass': 0.25, 'dribble': 0.15, 'tackle': 0.12, 'shot': 0.08,
-            'foul': 0.08, 'clearance': 0.07, 'interception': 0.06,
-            'cross': 0.05, 'header': 0.04, 'throw_in': 0.03,
-            'corner_kick': 0.02, 'free_kick': 0.02, 'offside': 0.015,
-            'goal': 0.01, 'yellow_card': 0.008, 'substitution': 0.005,
-            'red_card': 0.002, 'penalty': 0.002
-        }
+    def _draw_players(self, type_idx: np.ndarray) -> List[List[Dict[str, Any]]]:
+        """Identify players involved in each event, drawing all players at once."""
+        rng = self._rng
+        counts = self._PLAYER_COUNTS[type_idx]
         
-        # Ensure probabilities match SUPPORTED_EVENTS order
-        return np.array([probs.get(event, 0.001) for event in self.SUPPORTED_EVENTS])
-    
-    def _format_timestamp(self, seconds: float) -> str:
-        """Format timestamp in MM:SS format."""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes:02d}:{secs:02d}"
-    
-    def _generate_field_coordinates(self) -> Dict[str, float]:
-        """Generate realistic field coordinates (0-100 scale)."""
-        return {
-            'x': np.random.uniform(0, 100),
-            'y': np.random.uniform(0, 100),
-            'zone': self._determine_field_zone()
-        }
-    
-    def _determine_field_zone(self) -> str:
-        """Determine field zone based on coordinates."""
-        zones = ['defensive_third', 'middle_third', 'attacking_third']
-        return np.random.choice(zones, p=[0.3, 0.4, 0.3])
-    
-    def _identify_players(self, event_type: str) -> List[Dict[str, Any]]:
-        """Identify players involved in event."""
-        player_count = {
-            'pass': 2, 'tackle': 2, 'foul': 2, 'shot': 1,
-            'goal': np.random.randint(1, 4), 'dribble': 1,
-            'substitution': 2, 'yellow_card': 1, 'red_card': 1
-        }.get(event_type, 1)
-        
-        players = []
-        for i in range(player_count):
-            players.append({
-                'player_id': f"player_{np.random.randint(1, 23):02d}",
-                'jersey_number': np.random.randint(1, 99),
-                'position': np.random.choice(['GK', 'DEF', 'MID', 'FWD']),
-                'team': np.random.choice(['home', 'away']),
-                'role': 'primary' if i == 0 else 'secondary',
-                'confidence': np.random.uniform(0.7, 0.95)
-            })
+        # Goals involve 1-3 players
+        is_goal = counts == 0
+        counts[is_goal] = rng.integers(1, 4, int(is_goal.sum()))
         
-        return players
-    
-    def _extract_context_features(self, event_type: str, timestamp: float) -> Dict[str, Any]:
-        """Extract contextual features for event."""
-        return {
-            'match_period': 'first_half' if timestamp < 45 * 60 else 'second_half',
-            'phase_of_play': np.random.choice(['attack', 'defense', 'transition']),
-            'pressure_level': np.random.choice(['low', 'medium', 'high']),
-            'tempo': np.random.uniform(0.3, 1.0),
-            'field_tilt': np.random.uniform(-1.0, 1.0)  # -1 = defensive, +1 = attacking
-        }
-    
-    def _determine_tactical_phase(self) -> str:
-        """Determine tactical phase of play."""
-        phases = ['build_up', 'progression', 'final_third', 'defensive_block', 'transition']
-        return np.random.choice(phases)
-    
-    def _generate_sequence_id(self, event_index: int) -> str:
-        """Generate sequence identifier for event chains."""
-        sequence_length = np.random.randint(1, 8)  # Events can be part of 1-8 event sequences
-        sequence_start = max(0, event_index - sequence_length + 1)
-        return f"seq_{sequence_start:04d}_{sequence_length}"
+        offsets = np.concatenate(([0], np.cumsum(counts))).tolist()
+        total = offsets[-1]
+        
+        numbers = rng.integers(1, 23, total).tolist()
+        jerseys = rng.integers(1, 99, total).tolist()
+        position_idx = rng.integers(0, len(_PLAYER_POSITIONS), total).tolist()
+        team_idx = rng.integers(0, len(_TEAMS), total).tolist()
+        player_confidences = rng.uniform(0.7, 0.95, total).tolist()
+        
+        return [
+            [
+                {
+                    'player_id': f"player_{numbers[k]:02d}",
+                    'jersey_number': jerseys[k],
+                    'position': _PLAYER_POSITIONS[position_idx[k]],
+                    'team': _TEAMS[team_idx[k]],
+                    'role': 'primary' if k == first else 'secondary',
+                    'confidence': player_confidences[k]
+                }
+                for k in range(first, last)
+            ]
+            for first, last in zip(offsets, offsets[1:])
+        ]
     
-    def _add_sequence_relationships(self, events: List[Dict]) -> List[Dict]:
-        """Add sequence relationships between events."""
+    def _add_sequence_relationships(self, events: List[Dict],
+                                    timestamps: np.ndarray) -> List[Dict]:
+        """
+        Add sequence relationships between events.
+        
+        Expects events and timestamps sorted chronologically. The window of
+        related events (within 30 seconds) is located for every event at once
+        with a binary search over the timestamp column.
+        """
+        lows = np.searchsorted(timestamps, timestamps - 30, side='left').tolist()
+        highs = np.searchsorted(timestamps, timestamps + 30, side='right').tolist()
+        ids = [event['id'] for event in events]
+        
         for i, event in enumerate(events):
             event['sequence_position'] = i
-            event['related_events'] = []
-            
-            # Find related events within 30 seconds
-            for j, other_event in enumerate(events):
-                if i != j and abs(event['timestamp'] - other_event['timestamp']) <= 30:
-                    event['related_events'].append(other_event['id'])
+            event['related_events'] = ids[lows[i]:i] + ids[i + 1:highs[i]]
         
         return events
     
-    def _calculate_event_accuracy(self, event: Dict[str, Any]) -> float:
-        """Calculate accuracy score for individual event."""
-        base_accuracy = self.accuracy_target
-        confidence_factor = event['confidence']
-        context_factor = 1.0 if len(event['players_involved']) > 0 else 0.9
+    def _calculate_event_accuracy(self, events: List[Dict[str, Any]],
+                                  confidences: np.ndarray) -> np.ndarray:
+        """Calculate accuracy scores for a batch of events in one vectorized pass."""
+        has_players = np.fromiter(
+            (bool(e['players_involved']) for e in events), dtype=bool, count=len(events)
+        )
+        context_factors = np.where(has_players, 1.0, 0.9)
         
-        return min(0.98, base_accuracy * confidence_factor * context_factor)
+        return np.minimum(0.98, self.accuracy_target * confidences * context_factors)
+
+
+_FORMATIONS = ('4-4-2', '4-3-3', '3-5-2', '4-2-3-1', '5-3-2', '3-4-3')
+_FORMATION_CHANGE_TRIGGERS = ('substitution', 'tactical_adjustment', 'score_change')
+_POSSESSION_OUTCOMES = ('goal', 'shot', 'loss', 'foul', 'out_of_play')
+_INTENSITY_TRIGGERS = ('goal', 'red_card', 'tactical_change', 'pressure')
+_NMSTPP_PHASE_TYPES = ('build_up', 'progression', 'final_third_attack', 'defensive_block', 'transition')
+_TEMPO_CONTROL = ('home', 'away', 'balanced')
 
 
 class NMSTPPTacticalProcessor:
@@ -257,11 +426,13 @@ class NMSTPPTacticalProcessor:
     and strategic insights as specified in the OpenStarLab integration.
     """
     
-    def __init__(self, model_config: Optional[Dict] = None):
+    def __init__(self, model_config: Optional[Dict] = None,
+                 rng: Optional[np.random.Generator] = None):
         """Initialize NMSTPP tactical processor."""
         self.model_config = model_config or {}
         self.model_version = "NMSTPP-v2.1.0"
         self.formation_confidence_threshold = 0.8
+        self._rng = rng if rng is not None else np.random.default_rng()
         
         logger.info("Initialized NMSTPP tactical processor")
     
@@ -277,19 +448,23 @@ class NMSTPPTacticalProcessor:
         Returns:
             Tactical analysis results
         """
-        logger.info(f"Starting NMSTPP tactical analysis on {len(events)} events")
-        start_time = time.time()
+        logger.info("Starting NMSTPP tactical analysis on %d events", len(events))
+        start_time = time.perf_counter()
         
         try:
+            batch = EventBatch.from_events(events)
+            
             # Process tactical patterns
-            formations = self._detect_formations(events)
-            possession_analysis = self._analyze_possession_flow(events)
+            formations = self._detect_formations(events, batch)
+            possession_analysis = self._analyze_possession_flow(events, batch)
             tactical_phases = self._identify_tactical_phases(events)
             strategic_insights = self._generate_strategic_insights(events, formations)
             
             # Calculate HPUS (High-Pressure Utility Score) metric
             hpus_metrics = self._calculate_hpus_metrics(events, possession_analysis)
+            confidence_level = self._calculate_overall_confidence(batch.confidence)
             
+            processing_time = time.perf_counter() - start_time
             analysis_results = {
                 'formations': formations,
                 'possession_analysis': possession_analysis,
@@ -298,90 +473,102 @@ class NMSTPPTacticalProcessor:
                 'hpus_metrics': hpus_metrics,
                 'processing_metadata': {
                     'model_version': self.model_version,
-                    'processing_time': time.time() - start_time,
+                    'processing_time': processing_time,
                     'events_analyzed': len(events),
-                    'confidence_level': self._calculate_overall_confidence(events)
+                    'confidence_level': confidence_level
                 }
             }
             
-            logger.info(f"NMSTPP analysis completed in {time.time() - start_time:.2f}s")
+            logger.info("NMSTPP analysis completed in %.2fs", processing_time)
             return analysis_results
             
         except Exception as e:
-            logger.error(f"NMSTPP tactical analysis failed: {str(e)}")
+            logger.error("NMSTPP tactical analysis failed: %s", e)
             raise
     
-    def _detect_formations(self, events: List[Dict]) -> Dict[str, Any]:
+    def _detect_formations(self, events: List[Dict], batch: EventBatch) -> Dict[str, Any]:
         """Detect team formations using NMSTPP."""
         formations = {
-            'home_team': self._analyze_team_formation(events, 'home'),
-            'away_team': self._analyze_team_formation(events, 'away'),
+            'home_team': self._analyze_team_formation(events, batch, 'home'),
+            'away_team': self._analyze_team_formation(events, batch, 'away'),
             'formation_changes': self._detect_formation_changes(events),
             'tactical_flexibility': self._calculate_tactical_flexibility(events)
         }
         
         return formations
     
-    def _analyze_team_formation(self, events: List[Dict], team: str) -> Dict[str, Any]:
+    def _analyze_team_formation(self, events: List[Dict], batch: EventBatch,
+                                team: str) -> Dict[str, Any]:
         """Analyze formation for specific team."""
-        team_events = [e for e in events if any(p['team'] == team for p in e['players_involved'])]
+        team_events = [events[i] for i in np.flatnonzero(batch.involves_team(team)).tolist()]
         
         # Simulate formation detection
-        possible_formations = ['4-4-2', '4-3-3', '3-5-2', '4-2-3-1', '5-3-2', '3-4-3']
-        detected_formation = np.random.choice(possible_formations)
+        detected_formation = _FORMATIONS[self._rng.integers(len(_FORMATIONS))]
         
         return {
             'primary_formation': detected_formation,
-            'confidence': np.random.uniform(0.75, 0.95),
+            'confidence': self._rng.uniform(0.75, 0.95),
             'avg_positions': self._calculate_average_positions(team_events),
-            'formation_stability': np.random.uniform(0.6, 0.9),
-            'tactical_discipline': np.random.uniform(0.7, 0.95)
+            'formation_stability': self._rng.uniform(0.6, 0.9),
+            'tactical_discipline': self._rng.uniform(0.7, 0.95)
         }
     
     def _calculate_average_positions(self, team_events: List[Dict]) -> Dict[str, Dict[str, float]]:
         """Calculate average positions for team players."""
         positions = {}
         
-        for position in ['GK', 'DEF', 'MID', 'FWD']:
+        draws = self._rng.uniform((10, 10, 5), (90, 90, 25), size=(len(_PLAYER_POSITIONS), 3))
+        for position, (x, y, spread) in zip(_PLAYER_POSITIONS, draws.tolist()):
             positions[position] = {
-                'x': np.random.uniform(10, 90),
-                'y': np.random.uniform(10, 90),
-                'spread': np.random.uniform(5, 25)
+                'x': x,
+                'y': y,
+                'spread': spread
             }
         
         return positions
     
     def _detect_formation_changes(self, events: List[Dict]) -> List[Dict[str, Any]]:
         """Detect formation changes during match."""
-        changes = []
+        rng = self._rng
         
         # Simulate 0-3 formation changes
-        num_changes = np.random.randint(0, 4)
-        
-        for i in range(num_changes):
-            change_time = np.random.uniform(15 * 60, 85 * 60)  # Between 15-85 minutes
-            changes.append({
-                'timestamp': change_time,
-                'team': np.random.choice(['home', 'away']),
-                'from_formation': np.random.choice(['4-4-2', '4-3-3', '3-5-2']),
-                'to_formation': np.random.choice(['4-4-2', '4-3-3', '3-5-2']),
-                'trigger_event': np.random.choice(['substitution', 'tactical_adjustment', 'score_change']),
-                'confidence': np.random.uniform(0.7, 0.9)
-            })
+        num_changes = int(rng.integers(0, 4))
         
-        return sorted(changes, key=lambda x: x['timestamp'])
+        change_times = rng.uniform(15 * 60, 85 * 60, num_changes)  # Between 15-85 minutes
+        teams = rng.integers(0, len(_TEAMS), num_changes).tolist()
+        from_idx = rng.integers(0, 3, num_changes).tolist()
+        to_idx = rng.integers(0, 3, num_changes).tolist()
+        trigger_idx = rng.integers(0, len(_FORMATION_CHANGE_TRIGGERS), num_changes).tolist()
+        confidences = rng.uniform(0.7, 0.9, num_changes).tolist()
+        
+        # Emit changes chronologically
+        order = np.argsort(change_times, kind='stable').tolist()
+        change_times = change_times.tolist()
+        
+        return [
+            {
+                'timestamp': change_times[i],
+                'team': _TEAMS[teams[i]],
+                'from_formation': _FORMATIONS[from_idx[i]],
+                'to_formation': _FORMATIONS[to_idx[i]],
+                'trigger_event': _FORMATION_CHANGE_TRIGGERS[trigger_idx[i]],
+                'confidence': confidences[i]
+            }
+            for i in order
+        ]
     
     def _calculate_tactical_flexibility(self, events: List[Dict]) -> Dict[str, float]:
         """Calculate tactical flexibility metrics."""
         return {
-            'positional_rotation': np.random.uniform(0.4, 0.8),
-            'role_fluidity': np.random.uniform(0.3, 0.7),
-            'adaptive_response': np.random.uniform(0.5, 0.9)
+            'positional_rotation': self._rng.uniform(0.4, 0.8),
+            'role_fluidity': self._rng.uniform(0.3, 0.7),
+            'adaptive_response': self._rng.uniform(0.5, 0.9)
         }
     
-    def _analyze_possession_flow(self, events: List[Dict]) -> Dict[str, Any]:
+    def _analyze_possession_flow(self, events: List[Dict], batch: EventBatch) -> Dict[str, Any]:
         """Analyze possession flow patterns."""
-        possession_events = [e for e in events if e['event_type'] in ['pass', 'dribble', 'cross']]
+        is_possession = np.isin(batch.event_type, _POSSESSION_EVENT_IDS)
+        possession_events = [events[i] for i in np.flatnonzero(is_possession).tolist()]
         
         return {
             'possession_sequences': self._identify_possession_sequences(possession_events),
@@ -392,91 +579,114 @@ class NMSTPPTacticalProcessor:
     
     def _identify_possession_sequences(self, possession_events: List[Dict]) -> List[Dict[str, Any]]:
         """Identify distinct possession sequences."""
-        sequences = []
+        rng = self._rng
         
         # Simulate 15-25 possession sequences
-        num_sequences = np.random.randint(15, 26)
-        
-        for i in range(num_sequences):
-            sequences.append({
+        num_sequences = int(rng.integers(15, 26))
+        
+        durations = rng.uniform(5, 45, num_sequences).tolist()  # 5-45 seconds
+        passes = rng.integers(3, 18, num_sequences).tolist()
+        teams = rng.integers(0, len(_TEAMS), num_sequences).tolist()
+        start_zones = rng.integers(0, len(_FIELD_ZONES), num_sequences).tolist()
+        end_zones = rng.integers(0, len(_FIELD_ZONES), num_sequences).tolist()
+        outcomes = rng.integers(0, len(_POSSESSION_OUTCOMES), num_sequences).tolist()
+        # Roughly 30% of sequences generate an xG value
+        xg_values = np.where(
+            rng.random(num_sequences) > 0.7, rng.uniform(0.01, 0.8, num_sequences), 0.0
+        ).tolist()
+        
+        return [
+            {
                 'sequence_id': f"poss_seq_{i:03d}",
-                'duration': np.random.uniform(5, 45),  # 5-45 seconds
-                'passes_count': np.random.randint(3, 18),
-                'team': np.random.choice(['home', 'away']),
-                'start_zone': np.random.choice(['defensive_third', 'middle_third', 'attacking_third']),
-                'end_zone': np.random.choice(['defensive_third', 'middle_third', 'attacking_third']),
-                'outcome': np.random.choice(['goal', 'shot', 'loss', 'foul', 'out_of_play']),
-                'xg_value': np.random.uniform(0.01, 0.8) if np.random.random() > 0.7 else 0.0
-            })
-        
-        return sequences
+                'duration': durations[i],
+                'passes_count': passes[i],
+                'team': _TEAMS[teams[i]],
+                'start_zone': _FIELD_ZONES[start_zones[i]],
+                'end_zone': _FIELD_ZONES[end_zones[i]],
+                'outcome': _POSSESSION_OUTCOMES[outcomes[i]],
+                'xg_value': xg_values[i]
+            }
+            for i in range(num_sequences)
+        ]
     
     def _calculate_field_tilt(self, events: List[Dict]) -> Dict[str, float]:
         """Calculate field tilt metrics."""
         return {
-            'overall_tilt': np.random.uniform(-0.3, 0.3),  # -1 to 1 scale
-            'attacking_tilt': np.random.uniform(0.4, 0.8),
-            'defensive_tilt': np.random.uniform(0.3, 0.7),
-            'neutral_play': np.random.uniform(0.2, 0.4)
+            'overall_tilt': self._rng.uniform(-0.3, 0.3),  # -1 to 1 scale
+            'attacking_tilt': self._rng.uniform(0.4, 0.8),
+            'defensive_tilt': self._rng.uniform(0.3, 0.7),
+            'neutral_play': self._rng.uniform(0.2, 0.4)
         }
     
     def _analyze_tempo_patterns(self, events: List[Dict]) -> Dict[str, Any]:
         """Analyze match tempo patterns."""
         return {
-            'overall_tempo': np.random.uniform(0.4, 0.8),
+            'overall_tempo': self._rng.uniform(0.4, 0.8),
             'tempo_variations': {
-                'first_half': np.random.uniform(0.5, 0.8),
-                'second_half': np.random.uniform(0.3, 0.7)
+                'first_half': self._rng.uniform(0.5, 0.8),
+                'second_half': self._rng.uniform(0.3, 0.7)
             },
             'high_intensity_periods': self._identify_intensity_periods(),
-            'tempo_control_team': np.random.choice(['home', 'away', 'balanced'])
+            'tempo_control_team': _TEMPO_CONTROL[self._rng.integers(len(_TEMPO_CONTROL))]
         }
     
     def _identify_intensity_periods(self) -> List[Dict[str, Any]]:
         """Identify high-intensity periods in match."""
-        periods = []
-        
-        num_periods = np.random.randint(2, 6)
-        for i in range(num_periods):
-            start_time = np.random.uniform(0, 80 * 60)
-            periods.append({
-                'start_time': start_time,
-                'duration': np.random.uniform(120, 600),  # 2-10 minutes
-                'intensity_level': np.random.uniform(0.7, 1.0),
-                'trigger': np.random.choice(['goal', 'red_card', 'tactical_change', 'pressure'])
-            })
+        rng = self._rng
         
-        return periods
+        num_periods = int(rng.integers(2, 6))
+        start_times = rng.uniform(0, 80 * 60, num_periods).tolist()
+        durations = rng.uniform(120, 600, num_periods).tolist()  # 2-10 minutes
+        intensities = rng.uniform(0.7, 1.0, num_periods).tolist()
+        triggers = rng.integers(0, len(_INTENSITY_TRIGGERS), num_periods).tolist()
+        
+        return [
+            {
+                'start_time': start_times[i],
+                'duration': durations[i],
+                'intensity_level': intensities[i],
+                'trigger': _INTENSITY_TRIGGERS[triggers[i]]
+            }
+            for i in range(num_periods)
+        ]
     
     def _calculate_pressure_resistance(self, events: List[Dict]) -> Dict[str, float]:
         """Calculate pressure resistance metrics."""
         return {
-            'home_team_resistance': np.random.uniform(0.5, 0.9),
-            'away_team_resistance': np.random.uniform(0.4, 0.8),
-            'high_pressure_success': np.random.uniform(0.3, 0.7),
-            'counter_press_effectiveness': np.random.uniform(0.4, 0.8)
+            'home_team_resistance': self._rng.uniform(0.5, 0.9),
+            'away_team_resistance': self._rng.uniform(0.4, 0.8),
+            'high_pressure_success': self._rng.uniform(0.3, 0.7),
+            'counter_press_effectiveness': self._rng.uniform(0.4, 0.8)
         }
     
     def _identify_tactical_phases(self, events: List[Dict]) -> List[Dict[str, Any]]:
         """Identify distinct tactical phases."""
-        phases = []
+        rng = self._rng
         
-        phase_types = ['build_up', 'progression', 'final_third_attack', 'defensive_block', 'transition']
+        num_phases = int(rng.integers(8, 15))
+        phase_types = rng.integers(0, len(_NMSTPP_PHASE_TYPES), num_phases).tolist()
+        phase_starts = rng.uniform(0, 85 * 60, num_phases)
+        durations = rng.uniform(60, 300, num_phases).tolist()  # 1-5 minutes
+        teams = rng.integers(0, len(_TEAMS), num_phases).tolist()
+        effectiveness = rng.uniform(0.3, 0.9, num_phases).tolist()
+        key_events = rng.integers(2, 8, num_phases).tolist()
         
-        num_phases = np.random.randint(8, 15)
-        for i in range(num_phases):
-            phase_start = np.random.uniform(0, 85 * 60)
-            phases.append({
-                'phase_id': f"tactical_phase_{i:03d}",
-                'phase_type': np.random.choice(phase_types),
-                'start_time': phase_start,
-                'duration': np.random.uniform(60, 300),  # 1-5 minutes
-                'dominant_team': np.random.choice(['home', 'away']),
-                'effectiveness_score': np.random.uniform(0.3, 0.9),
-                'key_events': np.random.randint(2, 8)
-            })
+        # Emit phases chronologically; ids keep their generation index
+        order = np.argsort(phase_starts, kind='stable').tolist()
+        phase_starts = phase_starts.tolist()
         
-        return sorted(phases, key=lambda x: x['start_time'])
+        return [
+            {
+                'phase_id': f"tactical_phase_{i:03d}",
+                'phase_type': _NMSTPP_PHASE_TYPES[phase_types[i]],
+                'start_time': phase_starts[i],
+                'duration': durations[i],
+                'dominant_team': _TEAMS[teams[i]],
+                'effectiveness_score': effectiveness[i],
+                'key_events': key_events[i]
+            }
+            for i in order
+        ]
     
     def _generate_strategic_insights(self, events: List[Dict], 
                                    formations: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -486,7 +696,7 @@ class NMSTPPTacticalProcessor:
                 'insight_type': 'formation_effectiveness',
                 'title': 'Formation Analysis',
                 'description': f"Home team's {formations['home_team']['primary_formation']} formation showed high tactical discipline",
-                'confidence': np.random.uniform(0.75, 0.95),
+                'confidence': self._rng.uniform(0.75, 0.95),
                 'actionable_recommendation': 'Consider maintaining current formation structure in similar matchups',
                 'supporting_metrics': {
                     'formation_stability': formations['home_team']['formation_stability'],
@@ -497,10 +707,10 @@ class NMSTPPTacticalProcessor:
                 'insight_type': 'possession_pattern',
                 'title': 'Possession Flow Analysis',
                 'description': 'Team demonstrates strong possession retention in middle third',
-                'confidence': np.random.uniform(0.7, 0.9),
+                'confidence': self._rng.uniform(0.7, 0.9),
                 'actionable_recommendation': 'Focus training on final third penetration to improve conversion',
                 'supporting_metrics': {
-                    'possession_efficiency': np.random.uniform(0.6, 0.8)
+                    'possession_efficiency': self._rng.uniform(0.6, 0.8)
                 }
             }
         ]
@@ -511,35 +721,76 @@ class NMSTPPTacticalProcessor:
                               possession_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate HPUS (High-Pressure Utility Score) metrics."""
         return {
-            'overall_hpus': np.random.uniform(0.45, 0.85),
-            'attacking_hpus': np.random.uniform(0.5, 0.9),
-            'defensive_hpus': np.random.uniform(0.4, 0.8),
+            'overall_hpus': self._rng.uniform(0.45, 0.85),
+            'attacking_hpus': self._rng.uniform(0.5, 0.9),
+            'defensive_hpus': self._rng.uniform(0.4, 0.8),
             'pressure_situations': {
-                'high_press_success_rate': np.random.uniform(0.3, 0.7),
-                'counter_press_efficiency': np.random.uniform(0.25, 0.65),
-                'pressure_recovery_time': np.random.uniform(3.5, 8.2)  # seconds
+                'high_press_success_rate': self._rng.uniform(0.3, 0.7),
+                'counter_press_efficiency': self._rng.uniform(0.25, 0.65),
+                'pressure_recovery_time': self._rng.uniform(3.5, 8.2)  # seconds
             },
             'utility_breakdown': {
-                'possession_utility': np.random.uniform(0.4, 0.8),
-                'territorial_utility': np.random.uniform(0.3, 0.7),
-                'scoring_utility': np.random.uniform(0.2, 0.6)
+                'possession_utility': self._rng.uniform(0.4, 0.8),
+                'territorial_utility': self._rng.uniform(0.3, 0.7),
+                'scoring_utility': self._rng.uniform(0.2, 0.6)
             }
         }
     
-    def _calculate_overall_confidence(self, events: List[Dict]) -> float:
-        """Calculate overall confidence in tactical analysis."""
-        if not events:
+    def _calculate_overall_confidence(self, confidences: np.ndarray) -> float:
+        """Calculate overall confidence in tactical analysis from the event confidence column."""
+        if not confidences.size:
             return 0.0
         
-        event_confidences = [e['confidence'] for e in events]
-        avg_confidence = np.mean(event_confidences)
+        avg_confidence = float(confidences.mean())
         
         # Adjust based on number of events (more events = higher confidence)
-        event_count_factor = min(1.0, len(events) / 50)
+        event_count_factor = min(1.0, confidences.size / 50)
         
         return min(0.95, avg_confidence * event_count_factor)
 
 
+# Base reward per action type; other types earn 0.5
+_Q_REWARD_BY_ACTION = {
+    'pass': 0.6, 'shot': 0.8, 'goal': 1.0, 'tackle': 0.7,
+    'dribble': 0.65, 'interception': 0.75, 'clearance': 0.5,
+    'cross': 0.7, 'header': 0.6, 'foul': -0.3
+}
+
+# Q-value lookup tables; the trailing slot holds the default for unknown keys
+_Q_ACTION_REWARDS = np.array([_Q_REWARD_BY_ACTION.get(e, 0.5) for e in _LEM3_EVENT_TYPES] + [0.5])  # _LEM3_EVENT_TYPES order
+_Q_POSITION_MODS = np.array([0.8, 0.9, 1.1, 1.2, 1.0])  # _PLAYER_POSITIONS order
+_Q_ZONE_MODS = np.array([0.8, 1.0, 1.3, 1.0])  # _FIELD_ZONES order
+_Q_PHASE_BONUS = np.array([0.2, 0.0, 0.2, 0.0, 0.0, 0.0])  # _LEM3_TACTICAL_PHASES order
+
+
+_ACTION_LABELS = _LEM3_EVENT_TYPES + ('other',)
+_GRADE_THRESHOLDS = np.array([0.3, 0.4, 0.5, 0.6, 0.7, 0.8])  # Lower bound of each grade above 'D'
+_GRADE_LABELS = ('D', 'C', 'C+', 'B', 'B+', 'A', 'A+')
+_COHESION_METRICS = ('home_team_cohesion', 'away_team_cohesion', 'pass_network_density',
+                     'positional_coordination', 'tactical_synchronization')
+
+
+@dataclass
+class PlayerActions:
+    """
+    Player actions as parallel columns, grouped by player.
+    
+    Rows offsets[i]:offsets[i + 1] are the actions of player_ids[i] in
+    event order. Categorical columns use the same label ids as EventBatch.
+    """
+    player_ids: List[str]
+    offsets: np.ndarray
+    n_actions: int
+    timestamp: np.ndarray
+    action_type: np.ndarray
+    tactical_phase: np.ndarray
+    zone: np.ndarray
+    phase_of_play: np.ndarray
+    pressure_level: np.ndarray
+    position: np.ndarray
+    team: np.ndarray
+
+
 class RLearnPlayerEvaluator:
     """
     RLearn package integration for Q-value player evaluation.
@@ -548,11 +799,13 @@ class RLearnPlayerEvaluator:
     through multi-agent analysis and action valuation.
     """
     
-    def __init__(self, model_config: Optional[Dict] = None):
+    def __init__(self, model_config: Optional[Dict] = None,
+                 rng: Optional[np.random.Generator] = None):
         """Initialize RLearn player evaluator."""
         self.model_config = model_config or {}
         self.model_version = "RLearn-MultiAgent-v1.5.0"
         self.q_value_threshold = 0.3
+        self._rng = rng if rng is not None else np.random.default_rng()
         
         logger.info("Initialized RLearn player evaluator")
     
@@ -569,11 +822,11 @@ class RLearnPlayerEvaluator:
             Player evaluation results with Q-values
         """
         logger.info("Starting RLearn player evaluation")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Extract player actions from events
-            player_actions = self._extract_player_actions(events)
+            player_actions = self._extract_player_actions(EventBatch.from_events(events))
             
             # Calculate Q-values for each player action
             q_values = self._calculate_q_values(player_actions, tactical_analysis)
@@ -583,178 +836,158 @@ class RLearnPlayerEvaluator:
             
             # Identify standout performances
             performance_insights = self._identify_performance_insights(player_metrics)
+            team_cohesion_metrics = self._calculate_team_cohesion(player_actions)
             
+            processing_time = time.perf_counter() - start_time
             evaluation_results = {
                 'player_metrics': player_metrics,
                 'q_value_analysis': q_values,
                 'performance_insights': performance_insights,
-                'team_cohesion_metrics': self._calculate_team_cohesion(player_actions),
+                'team_cohesion_metrics': team_cohesion_metrics,
                 'processing_metadata': {
                     'model_version': self.model_version,
-                    'processing_time': time.time() - start_time,
+                    'processing_time': processing_time,
                     'players_evaluated': len(player_metrics),
-                    'actions_analyzed': sum(len(actions) for actions in player_actions.values())
+                    'actions_analyzed': player_actions.n_actions
                 }
             }
             
-            logger.info(f"RLearn evaluation completed in {time.time() - start_time:.2f}s")
+            logger.info("RLearn evaluation completed in %.2fs", processing_time)
             return evaluation_results
             
         except Exception as e:
-            logger.error(f"RLearn player evaluation failed: {str(e)}")
+            logger.error("RLearn player evaluation failed: %s", e)
             raise
     
-    def _extract_player_actions(self, events: List[Dict]) -> Dict[str, List[Dict]]:
-        """Extract and organize player actions from events."""
-        player_actions = {}
-        
-        for event in events:
-            for player in event['players_involved']:
-                player_id = player['player_id']
-                
-                if player_id not in player_actions:
-                    player_actions[player_id] = []
-                
-                action = {
-                    'event_id': event['id'],
-                    'timestamp': event['timestamp'],
-                    'action_type': event['event_type'],
-                    'role': player['role'],
-                    'position': player['position'],
-                    'team': player['team'],
-                    'coordinates': event['coordinates'],
-                    'context': event['contextual_features'],
-                    'tactical_phase': event['tactical_phase']
-                }
-                
-                player_actions[player_id].append(action)
+    def _extract_player_actions(self, batch: EventBatch) -> PlayerActions:
+        """
+        Extract and organize player actions from events.
         
-        return player_actions
-    
-    def _calculate_q_values(self, player_actions: Dict[str, List[Dict]], 
+        Every (event, player) pair is one action row. Rows are grouped by
+        player with a stable argsort of the flattened player index, and
+        per-player offsets are found with a binary search.
+        """
+        order = np.argsort(batch.player_index, kind='stable')
+        rows = batch.event_of_player()[order]
+        offsets = np.searchsorted(batch.player_index[order], np.arange(len(batch.player_ids) + 1))
+        
+        return PlayerActions(
+            player_ids=batch.player_ids,
+            offsets=offsets,
+            n_actions=len(order),
+            timestamp=batch.timestamp[rows],
+            action_type=batch.event_type[rows],
+            tactical_phase=batch.tactical_phase[rows],
+            zone=batch.zone[rows],
+            phase_of_play=batch.phase_of_play[rows],
+            pressure_level=batch.pressure_level[rows],
+            position=batch.player_position[order],
+            team=batch.player_team[order]
+        )
+    
+    def _calculate_q_values(self, player_actions: PlayerActions, 
                           tactical_analysis: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
         """Calculate Q-values for player actions using multi-agent RL."""
         q_values = {}
         
-        for player_id, actions in player_actions.items():
+        # Score every action in one batch, then group by (player, action type)
+        offsets = player_actions.offsets
+        num_players, num_types = len(player_actions.player_ids), len(_ACTION_LABELS)
+        all_q = self._compute_action_q_values(player_actions, np.arange(player_actions.n_actions))
+        pidx = np.repeat(np.arange(num_players), np.diff(offsets))
+        pair_idx = pidx * num_types + player_actions.action_type
+        pair_sums = np.bincount(pair_idx, weights=all_q, minlength=num_players * num_types)
+        pair_counts = np.bincount(pair_idx, minlength=num_players * num_types)
+        
+        # Overall Q-value per player from the per-type sums
+        overall = (
+            pair_sums.reshape(num_players, num_types).sum(axis=1)
+            / np.maximum(pair_counts.reshape(num_players, num_types).sum(axis=1), 1)
+        ).tolist()
+        
+        # Q-values ordered by (player, action type), sliced per non-empty pair
+        grouped_q = all_q[np.argsort(pair_idx, kind='stable')].tolist()
+        pair_bounds = np.concatenate(([0], np.cumsum(pair_counts))).tolist()
+        action_q_values = [{} for _ in range(num_players)]
+        for pair in np.flatnonzero(pair_counts).tolist():
+            player, action_type = divmod(pair, num_types)
+            action_q_values[player][_ACTION_LABELS[action_type]] = grouped_q[pair_bounds[pair]:pair_bounds[pair + 1]]
+        
+        bounds = offsets.tolist()
+        
+        for i, player_id in enumerate(player_actions.player_ids):
+            start, stop = bounds[i], bounds[i + 1]
             player_q_values = {
-                'overall_q_value': 0.0,
-                'action_q_values': {},
+                'overall_q_value': overall[i],
+                'action_q_values': action_q_values[i],
                 'situational_q_values': {},
                 'temporal_q_values': {}
             }
             
-            # Calculate action-specific Q-values
-            action_values = []
-            for action in actions:
-                q_val = self._compute_action_q_value(action, tactical_analysis)
-                action_values.append(q_val)
-                
-                action_type = action['action_type']
-                if action_type not in player_q_values['action_q_values']:
-                    player_q_values['action_q_values'][action_type] = []
-                
-                player_q_values['action_q_values'][action_type].append(q_val)
-            
-            # Calculate overall Q-value
-            if action_values:
-                player_q_values['overall_q_value'] = np.mean(action_values)
+            rows = np.arange(start, stop)
             
             # Calculate situational Q-values
-            player_q_values['situational_q_values'] = self._calculate_situational_q_values(actions)
+            player_q_values['situational_q_values'] = self._calculate_situational_q_values(player_actions, rows)
             
             # Calculate temporal Q-values (performance over time)
-            player_q_values['temporal_q_values'] = self._calculate_temporal_q_values(actions)
+            player_q_values['temporal_q_values'] = self._calculate_temporal_q_values(player_actions, rows)
             
             q_values[player_id] = player_q_values
         
         return q_values
     
-    def _compute_action_q_value(self, action: Dict[str, Any], 
-                              tactical_analysis: Dict[str, Any]) -> float:
-        """Compute Q-value for individual action using RL principles."""
-        # Base reward based on action type
-        action_rewards = {
-            'pass': 0.6, 'shot': 0.8, 'goal': 1.0, 'tackle': 0.7,
-            'dribble': 0.65, 'interception': 0.75, 'clearance': 0.5,
-            'cross': 0.7, 'header': 0.6, 'foul': -0.3
-        }
-        
-        base_reward = action_rewards.get(action['action_type'], 0.5)
-        
-        # Context modifiers
-        context_modifier = 1.0
-        
-        # Tactical phase modifier
-        if action['tactical_phase'] in ['final_third', 'build_up']:
-            context_modifier += 0.2
-        
-        # Position-based modifier
-        position_modifiers = {'GK': 0.8, 'DEF': 0.9, 'MID': 1.1, 'FWD': 1.2}
-        position_mod = position_modifiers.get(action['position'], 1.0)
-        
-        # Field zone modifier
-        zone = action['coordinates']['zone']
-        zone_modifiers = {'attacking_third': 1.3, 'middle_third': 1.0, 'defensive_third': 0.8}
-        zone_mod = zone_modifiers.get(zone, 1.0)
-        
-        # Calculate final Q-value
-        q_value = base_reward * context_modifier * position_mod * zone_mod
-        
-        # Add noise for realism
-        q_value += np.random.normal(0, 0.1)
-        
-        return max(-1.0, min(1.0, q_value))  # Clamp to [-1, 1]
-    
-    def _calculate_situational_q_values(self, actions: List[Dict]) -> Dict[str, float]:
+    def _compute_action_q_values(self, player_actions: PlayerActions,
+                                 rows: np.ndarray) -> np.ndarray:
+        """Compute Q-values for the given action rows using RL principles."""
+        return compute_q_batch(
+            player_actions.action_type[rows], player_actions.tactical_phase[rows],
+            player_actions.position[rows], player_actions.zone[rows],
+            self._rng.normal(0, 0.1, len(rows)),  # Noise for realism
+            _Q_ACTION_REWARDS, _Q_PHASE_BONUS, _Q_POSITION_MODS, _Q_ZONE_MODS
+        )
+    
+    def _calculate_situational_q_values(self, player_actions: PlayerActions,
+                                        rows: np.ndarray) -> Dict[str, float]:
         """Calculate Q-values for different game situations."""
+        phase = player_actions.phase_of_play[rows]
+        high_pressure = player_actions.pressure_level[rows] == _PRESSURE_LEVEL_IDS['high']
+        
         situations = {
-            'attacking': [],
-            'defending': [],
-            'transition': [],
-            'high_pressure': [],
-            'low_pressure': []
+            situation: phase == _PHASE_OF_PLAY_IDS.get(situation, -1)
+            for situation in ('attacking', 'defending', 'transition')
         }
+        situations['high_pressure'] = high_pressure
+        situations['low_pressure'] = ~high_pressure
         
-        for action in actions:
-            phase = action['context'].get('phase_of_play', 'transition')
-            pressure = action['context'].get('pressure_level', 'medium')
-            
-            if phase in situations:
-                situations[phase].append(action)
-            
-            if pressure == 'high':
-                situations['high_pressure'].append(action)
-            else:
-                situations['low_pressure'].append(action)
+        # Score the player's actions once; situations are masks over that batch
+        q_all = self._compute_action_q_values(player_actions, rows)
         
         situational_q_values = {}
-        for situation, situation_actions in situations.items():
-            if situation_actions:
-                q_vals = [self._compute_action_q_value(a, {}) for a in situation_actions]
-                situational_q_values[situation] = np.mean(q_vals)
+        for situation, mask in situations.items():
+            if mask.any():
+                situational_q_values[situation] = float(q_all[mask].mean())
             else:
                 situational_q_values[situation] = 0.0
         
         return situational_q_values
     
-    def _calculate_temporal_q_values(self, actions: List[Dict]) -> Dict[str, float]:
+    def _calculate_temporal_q_values(self, player_actions: PlayerActions,
+                                     rows: np.ndarray) -> Dict[str, float]:
         """Calculate Q-values across different time periods."""
-        if not actions:
+        if not rows.size:
             return {'first_half': 0.0, 'second_half': 0.0}
         
-        first_half_actions = [a for a in actions if a['timestamp'] <= 45 * 60]
-        second_half_actions = [a for a in actions if a['timestamp'] > 45 * 60]
+        # Score the player's actions once and split them with one mask
+        q_all = self._compute_action_q_values(player_actions, rows)
+        first_half = player_actions.timestamp[rows] <= 45 * 60
         
         first_half_q = 0.0
-        if first_half_actions:
-            q_vals = [self._compute_action_q_value(a, {}) for a in first_half_actions]
-            first_half_q = np.mean(q_vals)
+        if first_half.any():
+            first_half_q = float(q_all[first_half].mean())
         
         second_half_q = 0.0
-        if second_half_actions:
-            q_vals = [self._compute_action_q_value(a, {}) for a in second_half_actions]
-            second_half_q = np.mean(q_vals)
+        if not first_half.all():
+            second_half_q = float(q_all[~first_half].mean())
         
         return {
             'first_half': first_half_q,
@@ -767,9 +1000,36 @@ class RLearnPlayerEvaluator:
         """Generate comprehensive player performance metrics."""
         player_metrics = {}
         
-        for player_id, q_data in q_values.items():
-            # Get player info from events
-            player_info = self._get_player_info(player_id, events)
+        # Index player info (first appearance wins) and clutch involvement in one pass
+        info_by_id = {}
+        clutch_players = set()
+        for event in events:
+            # Consider events in final 20 minutes as "clutch"
+            is_clutch = event['timestamp'] >= 70 * 60
+            for player in event['players_involved']:
+                info_by_id.setdefault(player['player_id'], player)
+                if is_clutch:
+                    clutch_players.add(player['player_id'])
+        
+        # Grade every player with one lookup into the threshold table
+        overall_q_values = np.fromiter(
+            (q_data['overall_q_value'] for q_data in q_values.values()),
+            dtype=np.float64, count=len(q_values)
+        )
+        grades = self._calculate_performance_grades(overall_q_values)
+        
+        for (player_id, q_data), grade in zip(q_values.items(), grades):
+            player_info = info_by_id.get(player_id, {})
+            action_breakdown = {
+                action_type: dict(zip(
+                    ('count', 'avg_q_value', 'success_rate'),
+                    q_value_stats(np.asarray(q_vals, dtype=np.float64), self.q_value_threshold)
+                ))
+                for action_type, q_vals in q_data['action_q_values'].items()
+            }
+            action_means = {
+                action_type: stats['avg_q_value'] for action_type, stats in action_breakdown.items()
+            }
             
             metrics = {
                 'player_id': player_id,
@@ -779,18 +1039,11 @@ class RLearnPlayerEvaluator:
                 
                 # Core Q-value metrics
                 'overall_performance_score': q_data['overall_q_value'],
-                'performance_grade': self._calculate_performance_grade(q_data['overall_q_value']),
+                'performance_grade': grade,
                 
                 # Action analysis
-                'total_actions': len([a for actions in q_data['action_q_values'].values() for a in actions]),
-                'action_breakdown': {
-                    action_type: {
-                        'count': len(q_vals),
-                        'avg_q_value': np.mean(q_vals),
-                        'success_rate': len([v for v in q_vals if v > self.q_value_threshold]) / len(q_vals)
-                    }
-                    for action_type, q_vals in q_data['action_q_values'].items()
-                },
+                'total_actions': sum(map(len, q_data['action_q_values'].values())),
+                'action_breakdown': action_breakdown,
                 
                 # Situational performance
                 'situational_performance': q_data['situational_q_values'],
@@ -800,67 +1053,41 @@ class RLearnPlayerEvaluator:
                 
                 # Advanced metrics
                 'consistency_score': q_data['temporal_q_values'].get('consistency', 0.5),
-                'clutch_performance': self._calculate_clutch_performance(player_id, events),
-                'team_contribution': self._calculate_team_contribution(player_id, events, q_data)
+                'clutch_performance': self._calculate_clutch_performance(player_id, clutch_players),
+                'team_contribution': self._calculate_team_contribution(player_id, events, q_data, action_means)
             }
             
             player_metrics[player_id] = metrics
         
         return player_metrics
     
-    def _get_player_info(self, player_id: str, events: List[Dict]) -> Dict[str, Any]:
-        """Extract player information from events."""
-        for event in events:
-            for player in event['players_involved']:
-                if player['player_id'] == player_id:
-                    return player
-        return {}
-    
-    def _calculate_performance_grade(self, q_value: float) -> str:
-        """Convert Q-value to performance grade."""
-        if q_value >= 0.8:
-            return 'A+'
-        elif q_value >= 0.7:
-            return 'A'
-        elif q_value >= 0.6:
-            return 'B+'
-        elif q_value >= 0.5:
-            return 'B'
-        elif q_value >= 0.4:
-            return 'C+'
-        elif q_value >= 0.3:
-            return 'C'
-        else:
-            return 'D'
+    def _calculate_performance_grades(self, q_values: np.ndarray) -> List[str]:
+        """Convert Q-values to performance grades."""
+        # side='right' puts a value equal to a threshold in the grade above it
+        grade_idx = np.searchsorted(_GRADE_THRESHOLDS, q_values, side='right')
+        return [_GRADE_LABELS[i] for i in grade_idx.tolist()]
     
-    def _calculate_clutch_performance(self, player_id: str, events: List[Dict]) -> float:
+    def _calculate_clutch_performance(self, player_id: str, clutch_players: set) -> float:
         """Calculate performance in high-pressure situations."""
-        clutch_events = []
-        
-        for event in events:
-            # Consider events in final 20 minutes as "clutch"
-            if event['timestamp'] >= 70 * 60:
-                for player in event['players_involved']:
-                    if player['player_id'] == player_id:
-                        clutch_events.append(event)
-        
-        if not clutch_events:
+        if player_id not in clutch_players:
             return 0.5  # Neutral if no clutch situations
         
         # Simulate clutch performance scoring
-        return np.random.uniform(0.3, 0.9)
+        return self._rng.uniform(0.3, 0.9)
     
     def _calculate_team_contribution(self, player_id: str, events: List[Dict], 
-                                   q_data: Dict[str, Any]) -> float:
+                                   q_data: Dict[str, Any],
+                                   action_means: Dict[str, float]) -> float:
         """Calculate player's contribution to team performance."""
         # Factors: involvement in successful sequences, leadership actions, team chemistry
         base_contribution = q_data['overall_q_value']
         
-        # Bonus for leadership actions (passes, assists, defensive actions)
+        # Bonus for leadership actions (passes, assists, defensive actions),
+        # reusing the per-action means from the action breakdown
         leadership_bonus = 0.0
-        for action_type, q_vals in q_data['action_q_values'].items():
+        for action_type, mean_q_value in action_means.items():
             if action_type in ['pass', 'tackle', 'interception', 'clearance']:
-                leadership_bonus += np.mean(q_vals) * 0.1
+                leadership_bonus += mean_q_value * 0.1
         
         team_contribution = min(1.0, base_contribution + leadership_bonus)
         return team_contribution
@@ -869,56 +1096,71 @@ class RLearnPlayerEvaluator:
         """Identify key performance insights from player evaluations."""
         insights = []
         
-        # Find top performer
-        if player_metrics:
-            top_performer = max(player_metrics.items(), 
-                              key=lambda x: x[1]['overall_performance_score'])
-            
-            insights.append({
-                'insight_type': 'top_performer',
-                'title': 'Outstanding Individual Performance',
-                'description': f"Player {top_performer[0]} delivered exceptional performance with Q-value of {top_performer[1]['overall_performance_score']:.3f}",
-                'confidence': 0.9,
-                'player_id': top_performer[0],
-                'performance_score': top_performer[1]['overall_performance_score']
-            })
+        if not player_metrics:
+            return insights
+        
+        # Find top performer and most consistent player in one pass
+        top_id, top_score = None, float('-inf')
+        consistent_id, consistency = None, float('-inf')
+        for player_id, metrics in player_metrics.items():
+            score = metrics['overall_performance_score']
+            if score > top_score:
+                top_id, top_score = player_id, score
+            consistency_score = metrics['consistency_score']
+            if consistency_score > consistency:
+                consistent_id, consistency = player_id, consistency_score
         
-        # Find most consistent player
-        consistent_player = max(player_metrics.items(), 
-                              key=lambda x: x[1]['consistency_score'])
+        insights.append({
+            'insight_type': 'top_performer',
+            'title': 'Outstanding Individual Performance',
+            'description': f"Player {top_id} delivered exceptional performance with Q-value of {top_score:.3f}",
+            'confidence': 0.9,
+            'player_id': top_id,
+            'performance_score': top_score
+        })
         
         insights.append({
             'insight_type': 'consistency',
             'title': 'Most Consistent Performance',
-            'description': f"Player {consistent_player[0]} showed highest consistency with score of {consistent_player[1]['consistency_score']:.3f}",
+            'description': f"Player {consistent_id} showed highest consistency with score of {consistency:.3f}",
             'confidence': 0.85,
-            'player_id': consistent_player[0],
-            'consistency_score': consistent_player[1]['consistency_score']
+            'player_id': consistent_id,
+            'consistency_score': consistency
         })
         
         return insights
     
-    def _calculate_team_cohesion(self, player_actions: Dict[str, List[Dict]]) -> Dict[str, float]:
+    def _calculate_team_cohesion(self, player_actions: PlayerActions) -> Dict[str, float]:
         """Calculate team cohesion metrics based on player interactions."""
-        # Analyze pass networks, positional relationships, and coordination
-        home_players = []
-        away_players = []
-        
-        for player_id, actions in player_actions.items():
-            if actions:
-                team = actions[0]['team']
-                if team == 'home':
-                    home_players.append(player_id)
-                else:
-                    away_players.append(player_id)
-        
-        return {
-            'home_team_cohesion': np.random.uniform(0.6, 0.9),
-            'away_team_cohesion': np.random.uniform(0.5, 0.8),
-            'pass_network_density': np.random.uniform(0.4, 0.8),
-            'positional_coordination': np.random.uniform(0.5, 0.9),
-            'tactical_synchronization': np.random.uniform(0.6, 0.85)
-        }
+        # Pass networks and positional relationships are simulated for now
+        cohesion = self._rng.uniform([0.6, 0.5, 0.4, 0.5, 0.6], [0.9, 0.8, 0.8, 0.9, 0.85]).tolist()
+        return dict(zip(_COHESION_METRICS, cohesion))
+
+
+# Labels for the simulated prediction fields
+_KEY_MOMENT_TYPES = ('goal', 'red_card', 'penalty', 'tactical_change')
+_IMPACT_LEVELS = ('low', 'medium', 'high', 'critical')
+_ALTERNATIVE_FORMATIONS = ('4-3-3', '3-5-2', '4-2-3-1', '5-3-2')
+_FORMATION_CHANGE_REASONS = ('score_change', 'tactical_ineffectiveness', 'injury')
+_EXPECTED_IMPACTS = ('positive', 'neutral', 'negative')
+_TACTICAL_ADJUSTMENTS = (  # (adjustment type, possible changes, confidence)
+    ('pressing_intensity', ('increase', 'decrease'), 0.7),
+    ('defensive_line', ('higher', 'lower'), 0.65),
+    ('width_of_play', ('wider', 'narrower'), 0.6),
+)
+_PERFORMANCE_TRENDS = ('improving', 'stable', 'declining')
+_PERFORMANCE_TREND_PROBS = (0.3, 0.4, 0.3)
+_FORMATION_STRENGTHS = (
+    ('defensive_stability', 'midfield_control'),
+    ('attacking_width', 'creative_freedom'),
+    ('pressing_intensity', 'counter_attacking'),
+)
+_FORMATION_WEAKNESSES = (
+    ('vulnerability_to_counter',),
+    ('lack_of_width',),
+    ('midfield_overload',),
+)
+_IMPLEMENTATION_DIFFICULTY = ('low', 'medium', 'high')
 
 
 class PredictiveModelingEngine:
@@ -929,58 +1171,62 @@ class PredictiveModelingEngine:
     and performance scenarios as specified in the platform vision.
     """
     
-    def __init__(self, model_config: Optional[Dict] = None):
+    def __init__(self, model_config: Optional[Dict] = None,
+                 rng: Optional[np.random.Generator] = None):
         """Initialize predictive modeling engine."""
         self.model_config = model_config or {}
         self.model_version = "PredictiveEngine-v1.3.0"
         self.prediction_confidence_threshold = 0.7
+        self._rng = rng if rng is not None else np.random.default_rng()
         
         logger.info("Initialized predictive modeling engine")
     
-    def generate_predictions(self, intelligence_data: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_predictions(self, events: List[Dict[str, Any]],
+                             tactical_analysis: Dict[str, Any],
+                             player_evaluations: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Generate predictive insights from intelligence data.
+        Generate predictive insights from the results of the earlier stages.
         
         Args:
-            intelligence_data: Combined results from all processing stages
+            events: Detected events from LEM3
+            tactical_analysis: Tactical analysis from NMSTPP
+            player_evaluations: Player evaluations from RLearn
             
         Returns:
             Predictive modeling results
         """
         logger.info("Starting predictive modeling analysis")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # Extract data components
-            events = intelligence_data.get('events', [])
-            tactical_analysis = intelligence_data.get('tactical_analysis', {})
-            player_evaluations = intelligence_data.get('player_evaluations', {})
-            
             # Generate predictions
             match_outcome_predictions = self._predict_match_outcomes(events, tactical_analysis)
             tactical_scenario_predictions = self._predict_tactical_scenarios(tactical_analysis)
             player_performance_predictions = self._predict_player_performance(player_evaluations)
             formation_effectiveness_predictions = self._predict_formation_effectiveness(tactical_analysis)
+            confidence_metrics = self._calculate_prediction_confidence(events, tactical_analysis, player_evaluations)
+            data_quality_score = self._assess_data_quality(events, tactical_analysis, player_evaluations)
             
+            processing_time = time.perf_counter() - start_time
             prediction_results = {
                 'match_outcomes': match_outcome_predictions,
                 'tactical_scenarios': tactical_scenario_predictions,
                 'player_performance': player_performance_predictions,
                 'formation_effectiveness': formation_effectiveness_predictions,
-                'confidence_metrics': self._calculate_prediction_confidence(intelligence_data),
+                'confidence_metrics': confidence_metrics,
                 'processing_metadata': {
                     'model_version': self.model_version,
-                    'processing_time': time.time() - start_time,
+                    'processing_time': processing_time,
                     'prediction_types': 4,
-                    'data_quality_score': self._assess_data_quality(intelligence_data)
+                    'data_quality_score': data_quality_score
                 }
             }
             
-            logger.info(f"Predictive modeling completed in {time.time() - start_time:.2f}s")
+            logger.info("Predictive modeling completed in %.2fs", processing_time)
             return prediction_results
             
         except Exception as e:
-            logger.error(f"Predictive modeling failed: {str(e)}")
+            logger.error("Predictive modeling failed: %s", e)
             raise
     
     def _predict_match_outcomes(self, events: List[Dict], 
@@ -990,7 +1236,11 @@ class PredictiveModelingEngine:
         goals_scored = len([e for e in events if e['event_type'] == 'goal'])
         shots_taken = len([e for e in events if e['event_type'] == 'shot'])
         
-        # Simulate outcome predictions
+        # Simulated outcome values, drawn in one batch
+        total_goals, total_cards, corner_kicks, possession, home_clean_sheet, away_clean_sheet = (
+            self._rng.uniform([1.5, 2, 8, 52, 0.2, 0.15], [3.5, 6, 15, 68, 0.6, 0.55]).tolist()
+        )
+        
         predictions = {
             'final_score_predictions': [
                 {'scoreline': '2-1', 'probability': 0.25, 'confidence': 0.8},
@@ -1001,20 +1251,20 @@ class PredictiveModelingEngine:
                 {'scoreline': '3-1', 'probability': 0.08, 'confidence': 0.65}
             ],
             'match_events_predictions': {
-                'total_goals': {'predicted': np.random.uniform(1.5, 3.5), 'confidence': 0.75},
-                'total_cards': {'predicted': np.random.uniform(2, 6), 'confidence': 0.8},
-                'corner_kicks': {'predicted': np.random.uniform(8, 15), 'confidence': 0.7},
+                'total_goals': {'predicted': total_goals, 'confidence': 0.75},
+                'total_cards': {'predicted': total_cards, 'confidence': 0.8},
+                'corner_kicks': {'predicted': corner_kicks, 'confidence': 0.7},
                 'possession_winner': {
-                    'team': np.random.choice(['home', 'away']),
-                    'predicted_percentage': np.random.uniform(52, 68),
+                    'team': _TEAMS[self._rng.integers(len(_TEAMS))],
+                    'predicted_percentage': possession,
                     'confidence': 0.72
                 }
             },
             'key_moments_predictions': self._predict_key_moments(),
             'comeback_probability': self._calculate_comeback_probability(events),
             'clean_sheet_probability': {
-                'home_team': np.random.uniform(0.2, 0.6),
-                'away_team': np.random.uniform(0.15, 0.55)
+                'home_team': home_clean_sheet,
+                'away_team': away_clean_sheet
             }
         }
         
@@ -1022,32 +1272,48 @@ class PredictiveModelingEngine:
     
     def _predict_key_moments(self) -> List[Dict[str, Any]]:
         """Predict upcoming key moments in the match."""
-        moments = []
-        
-        # Predict 3-5 key moments
-        num_moments = np.random.randint(3, 6)
-        
-        for i in range(num_moments):
-            moment_time = np.random.uniform(60 * 60, 90 * 60)  # Last 30 minutes
-            moments.append({
+        rng = self._rng
+        
+        # Predict 3-5 key moments, drawing each field for all of them at once
+        num_moments = int(rng.integers(3, 6))
+        moment_times = rng.uniform(60 * 60, 90 * 60, num_moments)  # Last 30 minutes
+        probabilities = rng.uniform(0.3, 0.8, num_moments)
+        confidences = rng.uniform(0.6, 0.9, num_moments)
+        type_idx = rng.integers(0, len(_KEY_MOMENT_TYPES), num_moments)
+        team_idx = rng.integers(0, len(_TEAMS), num_moments)
+        impact_idx = rng.integers(0, len(_IMPACT_LEVELS), num_moments)
+        
+        # Emit moments in time order by permuting every column once
+        order = np.argsort(moment_times)
+        minutes, seconds = np.divmod(moment_times[order].astype(np.int64), 60)
+        
+        return [
+            {
                 'predicted_time': moment_time,
-                'formatted_time': f"{int(moment_time // 60):02d}:{int(moment_time % 60):02d}",
-                'event_type': np.random.choice(['goal', 'red_card', 'penalty', 'tactical_change']),
-                'probability': np.random.uniform(0.3, 0.8),
-                'team': np.random.choice(['home', 'away']),
-                'impact_level': np.random.choice(['low', 'medium', 'high', 'critical']),
-                'confidence': np.random.uniform(0.6, 0.9)
-            })
-        
-        return sorted(moments, key=lambda x: x['predicted_time'])
+                'formatted_time': f"{minute:02d}:{second:02d}",
+                'event_type': _KEY_MOMENT_TYPES[type_i],
+                'probability': probability,
+                'team': _TEAMS[team_i],
+                'impact_level': _IMPACT_LEVELS[impact_i],
+                'confidence': confidence
+            }
+            for moment_time, minute, second, type_i, probability, team_i, impact_i, confidence in zip(
+                moment_times[order].tolist(), minutes.tolist(), seconds.tolist(),
+                type_idx[order].tolist(), probabilities[order].tolist(), team_idx[order].tolist(),
+                impact_idx[order].tolist(), confidences[order].tolist()
+            )
+        ]
     
     def _calculate_comeback_probability(self, events: List[Dict]) -> Dict[str, Any]:
         """Calculate probability of comeback scenarios."""
-        goals = [e for e in events if e['event_type'] == 'goal']
-        
-        # Simple score simulation
-        home_goals = len([g for g in goals if any(p['team'] == 'home' for p in g['players_involved'])])
-        away_goals = len([g for g in goals if any(p['team'] == 'away' for p in g['players_involved'])])
+        # Simple score simulation; a goal counts for every team involved in it
+        home_goals = away_goals = 0
+        for event in events:
+            if event['event_type'] != 'goal':
+                continue
+            teams = {p['team'] for p in event['players_involved']}
+            home_goals += 'home' in teams
+            away_goals += 'away' in teams
         
         if home_goals > away_goals:
             losing_team = 'away'
@@ -1068,7 +1334,7 @@ class PredictiveModelingEngine:
             'comeback_team': losing_team,
             'goal_deficit': goal_deficit,
             'comeback_probability': comeback_prob,
-            'time_remaining_factor': np.random.uniform(0.7, 1.0),
+            'time_remaining_factor': self._rng.uniform(0.7, 1.0),
             'confidence': 0.75
         }
     
@@ -1086,74 +1352,86 @@ class PredictiveModelingEngine:
     
     def _predict_formation_changes(self, tactical_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Predict likely formation changes."""
-        changes = []
-        
         formations = tactical_analysis.get('formations', {})
         home_formation = formations.get('home_team', {}).get('primary_formation', '4-4-2')
         away_formation = formations.get('away_team', {}).get('primary_formation', '4-3-3')
         
-        # Predict 0-2 formation changes
-        num_changes = np.random.randint(0, 3)
-        
-        for i in range(num_changes):
-            change_time = np.random.uniform(60 * 60, 85 * 60)
-            changes.append({
+        # Predict 0-2 formation changes, drawing each field for all of them at once
+        rng = self._rng
+        num_changes = int(rng.integers(0, 3))
+        change_times = rng.uniform(60 * 60, 85 * 60, num_changes)
+        team_idx = rng.integers(0, len(_TEAMS), num_changes)
+        from_home = rng.random(num_changes) > 0.5
+        formation_idx = rng.integers(0, len(_ALTERNATIVE_FORMATIONS), num_changes)
+        trigger_idx = rng.integers(0, len(_FORMATION_CHANGE_REASONS), num_changes)
+        probabilities = rng.uniform(0.4, 0.8, num_changes)
+        impact_idx = rng.integers(0, len(_EXPECTED_IMPACTS), num_changes)
+        confidences = rng.uniform(0.6, 0.85, num_changes)
+        
+        # Emit changes in time order by permuting every column once
+        order = np.argsort(change_times)
+        
+        return [
+            {
                 'predicted_time': change_time,
-                'team': np.random.choice(['home', 'away']),
-                'current_formation': home_formation if np.random.random() > 0.5 else away_formation,
-                'predicted_formation': np.random.choice(['4-3-3', '3-5-2', '4-2-3-1', '5-3-2']),
-                'trigger': np.random.choice(['score_change', 'tactical_ineffectiveness', 'injury']),
-                'probability': np.random.uniform(0.4, 0.8),
-                'expected_impact': np.random.choice(['positive', 'neutral', 'negative']),
-                'confidence': np.random.uniform(0.6, 0.85)
-            })
-        
-        return sorted(changes, key=lambda x: x['predicted_time'])
+                'team': _TEAMS[team_i],
+                'current_formation': home_formation if home else away_formation,
+                'predicted_formation': _ALTERNATIVE_FORMATIONS[formation_i],
+                'trigger': _FORMATION_CHANGE_REASONS[trigger_i],
+                'probability': probability,
+                'expected_impact': _EXPECTED_IMPACTS[impact_i],
+                'confidence': confidence
+            }
+            for change_time, team_i, home, formation_i, trigger_i, probability, impact_i, confidence in zip(
+                change_times[order].tolist(), team_idx[order].tolist(), from_home[order].tolist(),
+                formation_idx[order].tolist(), trigger_idx[order].tolist(), probabilities[order].tolist(),
+                impact_idx[order].tolist(), confidences[order].tolist()
+            )
+        ]
     
     def _predict_tactical_adjustments(self) -> List[Dict[str, Any]]:
         """Predict tactical adjustments."""
+        rng = self._rng
+        change_idx = rng.integers(0, 2, 3).tolist()
+        probabilities = rng.uniform([0.5, 0.4, 0.3], [0.8, 0.7, 0.6]).tolist()
+        effectiveness = rng.uniform([0.4, 0.3, 0.4], [0.9, 0.8, 0.85]).tolist()
+        
         adjustments = [
             {
-                'adjustment_type': 'pressing_intensity',
-                'predicted_change': np.random.choice(['increase', 'decrease']),
-                'probability': np.random.uniform(0.5, 0.8),
-                'expected_effectiveness': np.random.uniform(0.4, 0.9),
-                'confidence': 0.7
-            },
-            {
-                'adjustment_type': 'defensive_line',
-                'predicted_change': np.random.choice(['higher', 'lower']),
-                'probability': np.random.uniform(0.4, 0.7),
-                'expected_effectiveness': np.random.uniform(0.3, 0.8),
-                'confidence': 0.65
-            },
-            {
-                'adjustment_type': 'width_of_play',
-                'predicted_change': np.random.choice(['wider', 'narrower']),
-                'probability': np.random.uniform(0.3, 0.6),
-                'expected_effectiveness': np.random.uniform(0.4, 0.85),
-                'confidence': 0.6
+                'adjustment_type': adjustment_type,
+                'predicted_change': options[change_i],
+                'probability': probability,
+                'expected_effectiveness': expected_effectiveness,
+                'confidence': confidence
             }
+            for (adjustment_type, options, confidence), change_i, probability, expected_effectiveness in zip(
+                _TACTICAL_ADJUSTMENTS, change_idx, probabilities, effectiveness
+            )
         ]
         
         return adjustments
     
     def _predict_substitution_impact(self) -> Dict[str, Any]:
         """Predict substitution impacts."""
+        (optimal_time, attacking_impact, goal_contribution,
+         defensive_impact, clean_sheet) = self._rng.uniform(
+            [60 * 60, 0.2, 0.15, 0.3, 0.2], [80 * 60, 0.8, 0.45, 0.7, 0.6]
+        ).tolist()
+        
         return {
-            'optimal_substitution_time': np.random.uniform(60 * 60, 80 * 60),
-            'predicted_substitutions': np.random.randint(2, 4),
+            'optimal_substitution_time': optimal_time,
+            'predicted_substitutions': int(self._rng.integers(2, 4)),
             'impact_predictions': [
                 {
                     'substitution_type': 'attacking',
-                    'expected_impact': np.random.uniform(0.2, 0.8),
-                    'probability_of_goal_contribution': np.random.uniform(0.15, 0.45),
+                    'expected_impact': attacking_impact,
+                    'probability_of_goal_contribution': goal_contribution,
                     'confidence': 0.7
                 },
                 {
                     'substitution_type': 'defensive',
-                    'expected_impact': np.random.uniform(0.3, 0.7),
-                    'probability_of_clean_sheet': np.random.uniform(0.2, 0.6),
+                    'expected_impact': defensive_impact,
+                    'probability_of_clean_sheet': clean_sheet,
                     'confidence': 0.75
                 }
             ]
@@ -1161,41 +1439,51 @@ class PredictiveModelingEngine:
     
     def _predict_set_piece_effectiveness(self) -> Dict[str, Any]:
         """Predict set piece effectiveness."""
+        (home_corners, away_corners, direct_goal, chance_creation,
+         penalty, conversion) = self._rng.uniform(
+            [0.1, 0.08, 0.05, 0.2, 0.1, 0.75], [0.3, 0.25, 0.15, 0.5, 0.4, 0.9]
+        ).tolist()
+        
         return {
             'corner_kick_success': {
-                'home_team': np.random.uniform(0.1, 0.3),
-                'away_team': np.random.uniform(0.08, 0.25),
+                'home_team': home_corners,
+                'away_team': away_corners,
                 'confidence': 0.8
             },
             'free_kick_threat': {
-                'direct_goal_probability': np.random.uniform(0.05, 0.15),
-                'chance_creation_probability': np.random.uniform(0.2, 0.5),
+                'direct_goal_probability': direct_goal,
+                'chance_creation_probability': chance_creation,
                 'confidence': 0.75
             },
             'penalty_prediction': {
-                'penalty_probability': np.random.uniform(0.1, 0.4),
-                'conversion_rate': np.random.uniform(0.75, 0.9),
+                'penalty_probability': penalty,
+                'conversion_rate': conversion,
                 'confidence': 0.85
             }
         }
     
     def _predict_pressing_scenarios(self) -> Dict[str, Any]:
         """Predict pressing scenario outcomes."""
+        (home_press, away_press, counter_press, recovery_time,
+         home_resistance, away_resistance) = self._rng.uniform(
+            [0.3, 0.25, 0.4, 3, 0.5, 0.4], [0.7, 0.65, 0.8, 8, 0.9, 0.85]
+        ).tolist()
+        
         return {
             'high_press_success': {
-                'home_team': np.random.uniform(0.3, 0.7),
-                'away_team': np.random.uniform(0.25, 0.65),
+                'home_team': home_press,
+                'away_team': away_press,
                 'optimal_zones': ['middle_third', 'attacking_third'],
                 'confidence': 0.72
             },
             'counter_press_effectiveness': {
-                'success_rate': np.random.uniform(0.4, 0.8),
-                'ball_recovery_time': np.random.uniform(3, 8),  # seconds
+                'success_rate': counter_press,
+                'ball_recovery_time': recovery_time,  # seconds
                 'confidence': 0.68
             },
             'press_resistance': {
-                'home_team_resistance': np.random.uniform(0.5, 0.9),
-                'away_team_resistance': np.random.uniform(0.4, 0.85),
+                'home_team_resistance': home_resistance,
+                'away_team_resistance': away_resistance,
                 'confidence': 0.7
             }
         }
@@ -1203,54 +1491,73 @@ class PredictiveModelingEngine:
     def _predict_player_performance(self, player_evaluations: Dict[str, Any]) -> Dict[str, Any]:
         """Predict future player performance trends."""
         player_metrics = player_evaluations.get('player_metrics', {})
-        
-        predictions = {
-            'performance_trends': {},
-            'fatigue_predictions': {},
-            'impact_players': [],
-            'substitution_candidates': []
+        player_ids = list(player_metrics)
+        num_players = len(player_ids)
+        scores = np.fromiter(
+            (metrics.get('overall_performance_score', 0.5) for metrics in player_metrics.values()),
+            dtype=np.float64, count=num_players
+        )
+        
+        # Draw every simulated per-player value up front, one array per field
+        rng = self._rng
+        trend_idx = rng.choice(len(_PERFORMANCE_TRENDS), size=num_players, p=_PERFORMANCE_TREND_PROBS)
+        trend_magnitudes = rng.uniform(0.05, 0.2, num_players)
+        trend_confidences = rng.uniform(0.6, 0.8, num_players)
+        fatigue_levels = rng.uniform(0.2, 0.9, num_players)
+        drop_off_times = rng.uniform(70 * 60, 90 * 60, num_players)
+        
+        # Impact players and substitution candidates as masks over all players
+        impact = np.flatnonzero(scores > 0.7)
+        fatigued = fatigue_levels > 0.7
+        substitutes = np.flatnonzero(fatigued | (scores < 0.4))
+        urgent = (fatigue_levels > 0.8) | (scores < 0.3)
+        contributions = rng.uniform(0.8, 1.0, impact.size)
+        
+        score_list = scores.tolist()
+        fatigue_list = fatigue_levels.tolist()
+        return {
+            'performance_trends': {
+                player_id: {
+                    'current_score': score,
+                    'predicted_trend': _PERFORMANCE_TRENDS[trend_i],
+                    'trend_magnitude': magnitude,
+                    'confidence': confidence
+                }
+                for player_id, score, trend_i, magnitude, confidence in zip(
+                    player_ids, score_list, trend_idx.tolist(),
+                    trend_magnitudes.tolist(), trend_confidences.tolist()
+                )
+            },
+            'fatigue_predictions': {
+                player_id: {
+                    'current_fatigue': fatigue_level,
+                    'predicted_drop_off_time': drop_off_time,
+                    'performance_impact': fatigue_level * 0.3,
+                    'confidence': 0.75
+                }
+                for player_id, fatigue_level, drop_off_time in zip(
+                    player_ids, fatigue_list, drop_off_times.tolist()
+                )
+            },
+            'impact_players': [
+                {
+                    'player_id': player_ids[i],
+                    'impact_score': score_list[i],
+                    'predicted_contribution': contribution
+                }
+                for i, contribution in zip(impact.tolist(), contributions.tolist())
+            ],
+            'substitution_candidates': [
+                {
+                    'player_id': player_ids[i],
+                    'reason': 'fatigue' if is_fatigued else 'performance',
+                    'urgency': 'high' if is_urgent else 'medium'
+                }
+                for i, is_fatigued, is_urgent in zip(
+                    substitutes.tolist(), fatigued[substitutes].tolist(), urgent[substitutes].tolist()
+                )
+            ]
         }
-        
-        for player_id, metrics in player_metrics.items():
-            current_score = metrics.get('overall_performance_score', 0.5)
-            
-            # Predict performance trend
-            trend_direction = np.random.choice(['improving', 'stable', 'declining'], p=[0.3, 0.4, 0.3])
-            trend_magnitude = np.random.uniform(0.05, 0.2)
-            
-            predictions['performance_trends'][player_id] = {
-                'current_score': current_score,
-                'predicted_trend': trend_direction,
-                'trend_magnitude': trend_magnitude,
-                'confidence': np.random.uniform(0.6, 0.8)
-            }
-            
-            # Predict fatigue level
-            fatigue_level = np.random.uniform(0.2, 0.9)
-            predictions['fatigue_predictions'][player_id] = {
-                'current_fatigue': fatigue_level,
-                'predicted_drop_off_time': np.random.uniform(70 * 60, 90 * 60),
-                'performance_impact': fatigue_level * 0.3,
-                'confidence': 0.75
-            }
-            
-            # Identify impact players
-            if current_score > 0.7:
-                predictions['impact_players'].append({
-                    'player_id': player_id,
-                    'impact_score': current_score,
-                    'predicted_contribution': np.random.uniform(0.8, 1.0)
-                })
-            
-            # Identify substitution candidates
-            if fatigue_level > 0.7 or current_score < 0.4:
-                predictions['substitution_candidates'].append({
-                    'player_id': player_id,
-                    'reason': 'fatigue' if fatigue_level > 0.7 else 'performance',
-                    'urgency': 'high' if fatigue_level > 0.8 or current_score < 0.3 else 'medium'
-                })
-        
-        return predictions
     
     def _predict_formation_effectiveness(self, tactical_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Predict formation effectiveness scenarios."""
@@ -1262,126 +1569,164 @@ class PredictiveModelingEngine:
             'tactical_recommendations': []
         }
         
-        for team in ['home_team', 'away_team']:
+        # One row per team: current effectiveness, then (effectiveness,
+        # improvement, confidence) for each of its two alternatives
+        rng = self._rng
+        teams = ('home_team', 'away_team')
+        numeric = rng.uniform(
+            [0.5] + [0.4, -0.2, 0.6] * 2,
+            [0.9] + [0.85, 0.3, 0.8] * 2,
+            size=(len(teams), 7)
+        )
+        current_effectiveness = numeric[:, 0].tolist()
+        alternative_values = numeric[:, 1:].reshape(len(teams), 2, 3).tolist()
+        
+        # Categorical columns: strengths, weaknesses, then each alternative's difficulty
+        labels = rng.integers(
+            0,
+            [len(_FORMATION_STRENGTHS), len(_FORMATION_WEAKNESSES)] + [len(_IMPLEMENTATION_DIFFICULTY)] * 2,
+            size=(len(teams), 4)
+        )
+        strength_idx = labels[:, 0].tolist()
+        weakness_idx = labels[:, 1].tolist()
+        difficulty_idx = labels[:, 2:].tolist()
+        
+        for t, team in enumerate(teams):
             team_formation = formations.get(team, {})
             current_formation = team_formation.get('primary_formation', '4-4-2')
             
             # Predict current formation effectiveness
             effectiveness_predictions['current_formation_effectiveness'][team] = {
                 'formation': current_formation,
-                'predicted_effectiveness': np.random.uniform(0.5, 0.9),
-                'strengths': np.random.choice([
-                    ['defensive_stability', 'midfield_control'],
-                    ['attacking_width', 'creative_freedom'],
-                    ['pressing_intensity', 'counter_attacking']
-                ]),
-                'weaknesses': np.random.choice([
-                    ['vulnerability_to_counter'],
-                    ['lack_of_width'],
-                    ['midfield_overload']
-                ]),
+                'predicted_effectiveness': current_effectiveness[t],
+                'strengths': list(_FORMATION_STRENGTHS[strength_idx[t]]),
+                'weaknesses': list(_FORMATION_WEAKNESSES[weakness_idx[t]]),
                 'confidence': 0.8
             }
             
             # Analyze alternative formations
-            alternatives = ['4-3-3', '3-5-2', '4-2-3-1', '5-3-2']
-            alternative_formations = [f for f in alternatives if f != current_formation][:2]
-            
-            effectiveness_predictions['alternative_formation_analysis'][team] = []
+            alternative_formations = [f for f in _ALTERNATIVE_FORMATIONS if f != current_formation][:2]
             
-            for alt_formation in alternative_formations:
-                effectiveness_predictions['alternative_formation_analysis'][team].append({
+            effectiveness_predictions['alternative_formation_analysis'][team] = [
+                {
                     'formation': alt_formation,
-                    'predicted_effectiveness': np.random.uniform(0.4, 0.85),
-                    'expected_improvement': np.random.uniform(-0.2, 0.3),
-                    'implementation_difficulty': np.random.choice(['low', 'medium', 'high']),
-                    'confidence': np.random.uniform(0.6, 0.8)
-                })
+                    'predicted_effectiveness': effectiveness,
+                    'expected_improvement': improvement,
+                    'implementation_difficulty': _IMPLEMENTATION_DIFFICULTY[difficulty_i],
+                    'confidence': confidence
+                }
+                for alt_formation, (effectiveness, improvement, confidence), difficulty_i in zip(
+                    alternative_formations, alternative_values[t], difficulty_idx[t]
+                )
+            ]
         
         # Generate tactical recommendations
+        maintain_impact, switch_impact = rng.uniform([0.1, 0.2], [0.4, 0.6]).tolist()
         effectiveness_predictions['tactical_recommendations'] = [
             {
                 'recommendation': 'Maintain current formation with minor adjustments to pressing triggers',
                 'priority': 'medium',
-                'expected_impact': np.random.uniform(0.1, 0.4),
+                'expected_impact': maintain_impact,
                 'confidence': 0.75
             },
             {
                 'recommendation': 'Consider switching to more attacking formation if trailing by 60th minute',
                 'priority': 'high',
-                'expected_impact': np.random.uniform(0.2, 0.6),
+                'expected_impact': switch_impact,
                 'confidence': 0.7
             }
         ]
         
         return effectiveness_predictions
     
-    def _calculate_prediction_confidence(self, intelligence_data: Dict[str, Any]) -> Dict[str, float]:
+    def _calculate_prediction_confidence(self, events: List[Dict],
+                                         tactical_analysis: Dict[str, Any],
+                                         player_evaluations: Dict[str, Any]) -> Dict[str, float]:
         """Calculate overall confidence in predictions."""
-        events = intelligence_data.get('events', [])
-        tactical_analysis = intelligence_data.get('tactical_analysis', {})
-        player_evaluations = intelligence_data.get('player_evaluations', {})
-        
         # Base confidence on data quality and quantity
         event_confidence = min(0.9, len(events) / 30)  # More events = higher confidence
         tactical_confidence = 0.8 if tactical_analysis else 0.3
         player_confidence = 0.85 if player_evaluations else 0.4
         
         return {
-            'overall_confidence': np.mean([event_confidence, tactical_confidence, player_confidence]),
+            'overall_confidence': (event_confidence + tactical_confidence + player_confidence) / 3,
             'event_based_confidence': event_confidence,
             'tactical_confidence': tactical_confidence,
             'player_based_confidence': player_confidence,
-            'data_completeness': self._assess_data_completeness(intelligence_data)
+            'data_completeness': self._assess_data_completeness(events, tactical_analysis, player_evaluations)
         }
     
-    def _assess_data_quality(self, intelligence_data: Dict[str, Any]) -> float:
+    def _assess_data_quality(self, events: List[Dict],
+                             tactical_analysis: Dict[str, Any],
+                             player_evaluations: Dict[str, Any]) -> float:
         """Assess overall quality of input data."""
         quality_factors = []
         
         # Event data quality
-        events = intelligence_data.get('events', [])
         if events:
-            avg_confidence = np.mean([e.get('confidence', 0) for e in events])
+            avg_confidence = sum(e.get('confidence', 0) for e in events) / len(events)
             quality_factors.append(avg_confidence)
         
         # Tactical analysis quality
-        tactical_analysis = intelligence_data.get('tactical_analysis', {})
         if tactical_analysis:
             tactical_confidence = tactical_analysis.get('processing_metadata', {}).get('confidence_level', 0.5)
             quality_factors.append(tactical_confidence)
         
         # Player evaluation quality
-        player_evaluations = intelligence_data.get('player_evaluations', {})
         if player_evaluations:
             player_metrics = player_evaluations.get('player_metrics', {})
             if player_metrics:
-                avg_player_score = np.mean([
-                    m.get('overall_performance_score', 0.5) 
+                avg_player_score = sum(
+                    m.get('overall_performance_score', 0.5)
                     for m in player_metrics.values()
-                ])
+                ) / len(player_metrics)
                 quality_factors.append(min(1.0, avg_player_score + 0.3))
         
-        return np.mean(quality_factors) if quality_factors else 0.5
+        return sum(quality_factors) / len(quality_factors) if quality_factors else 0.5
     
-    def _assess_data_completeness(self, intelligence_data: Dict[str, Any]) -> float:
+    def _assess_data_completeness(self, events: List[Dict],
+                                  tactical_analysis: Dict[str, Any],
+                                  player_evaluations: Dict[str, Any]) -> float:
         """Assess completeness of intelligence data."""
-        completeness_score = 0.0
-        total_components = 4
-        
-        if intelligence_data.get('events'):
-            completeness_score += 0.25
-        
-        if intelligence_data.get('tactical_analysis'):
-            completeness_score += 0.25
-        
-        if intelligence_data.get('player_evaluations'):
-            completeness_score += 0.25
-        
-        if len(intelligence_data.get('events', [])) > 20:  # Sufficient event data
-            completeness_score += 0.25
-        
-        return completeness_score
+        events = events or []
+        
+        # Each present component (and sufficient event data) adds a quarter
+        components_present = (
+            bool(events)
+            + bool(tactical_analysis)
+            + bool(player_evaluations)
+            + (len(events) > 20)
+        )
+        return 0.25 * components_present
+
+
+# Progress updates always forwarded (stage boundaries); others are throttled
+_PROGRESS_MILESTONES = frozenset({5, 35, 65, 85, 100})
+_PROGRESS_MIN_INTERVAL = 0.25  # seconds
+
+_RESULTS_CACHE_TIMEOUT = 60 * 60  # seconds
+
+# Confidence scores when no stage produced anything (upstream failure)
+_ZERO_CONFIDENCE_SCORES = {
+    'overall_intelligence_confidence': 0.0,
+    'event_detection_confidence': 0.0,
+    'tactical_analysis_confidence': 0.0,
+    'player_evaluation_confidence': 0.0,
+    'predictive_modeling_confidence': 0.0,
+    'data_completeness_score': 0.0,
+    'processing_quality_score': 0.0
+}
+
+
+@contextlib.contextmanager
+def _reporting_failures(report: callable):
+    """Log and report any pipeline failure as progress -1, then re-raise it."""
+    try:
+        yield
+    except Exception as e:
+        logger.error("OpenStarLab intelligence processing failed: %s", e)
+        report(-1, f"Processing failed: {str(e)}")
+        raise
 
 
 class OpenStarLabIntelligenceProcessor:
@@ -1396,11 +1741,12 @@ class OpenStarLabIntelligenceProcessor:
         """Initialize the complete intelligence processing pipeline."""
         self.config = config or {}
         
-        # Initialize all processors
-        self.lem3_processor = LEM3EventProcessor(self.config.get('lem3', {}))
-        self.nmstpp_processor = NMSTPPTacticalProcessor(self.config.get('nmstpp', {}))
-        self.rlearn_evaluator = RLearnPlayerEvaluator(self.config.get('rlearn', {}))
-        self.predictive_engine = PredictiveModelingEngine(self.config.get('predictive', {}))
+        # Initialize all processors; simulated stages share one generator
+        rng = np.random.default_rng(self.config.get('seed'))
+        self.lem3_processor = LEM3EventProcessor(self.config.get('lem3', {}), rng=rng)
+        self.nmstpp_processor = NMSTPPTacticalProcessor(self.config.get('nmstpp', {}), rng=rng)
+        self.rlearn_evaluator = RLearnPlayerEvaluator(self.config.get('rlearn', {}), rng=rng)
+        self.predictive_engine = PredictiveModelingEngine(self.config.get('predictive', {}), rng=rng)
         
         self.pipeline_version = "OpenStarLab-Intelligence-v1.0.0"
         
@@ -1413,76 +1759,96 @@ class OpenStarLabIntelligenceProcessor:
         Process complete match intelligence using OpenStarLab pipeline.
         
         Args:
-            video_data: Preprocessed video data in UIED format
+            video_data: Preprocessed video data in UIED format; an optional
+                'content_hash' lets re-analyses of the same video and intent
+                reuse cached results
             analysis_intent: Type of analysis to perform
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback for progress updates; stage
+                milestones and failures are always reported, other updates
+                at most every 250ms
             
         Returns:
             Complete intelligence results
         """
-        logger.info(f"Starting OpenStarLab intelligence processing with intent: {analysis_intent}")
-        start_time = time.time()
-        
-        if progress_callback:
-            progress_callback(5, "Initializing intelligence pipeline")
-        
-        try:
+        logger.info("Starting OpenStarLab intelligence processing with intent: %s", analysis_intent)
+        start_time = time.perf_counter()
+        last_report = float('-inf')
+        
+        def report(progress: int, message: str) -> None:
+            """Forward milestones and failures; other updates at most every 250ms."""
+            nonlocal last_report
+            if progress_callback is None:
+                return
+            now = time.perf_counter()
+            if (progress in _PROGRESS_MILESTONES or progress < 0
+                    or now - last_report >= _PROGRESS_MIN_INTERVAL):
+                last_report = now
+                progress_callback(progress, message)
+        
+        report(5, "Initializing intelligence pipeline")
+        
+        cache_key = self._results_cache_key(video_data, analysis_intent)
+        if cache_key is not None:
+            cached_results = self._get_cached_results(cache_key)
+            if cached_results is not None:
+                logger.info("Reusing cached OpenStarLab intelligence results for %s", cache_key)
+                report(100, "Intelligence processing completed")
+                return cached_results
+        
+        with _reporting_failures(report):
             # Stage 1: Event Detection using LEM3
-            if progress_callback:
-                progress_callback(10, "Detecting events with LEM3 model")
+            report(10, "Detecting events with LEM3 model")
             
             events = self.lem3_processor.detect_events(video_data)
             
-            if progress_callback:
-                progress_callback(35, f"Detected {len(events)} events")
+            report(35, f"Detected {len(events)} events")
             
             # Stage 2: Tactical Analysis using NMSTPP
-            if progress_callback:
-                progress_callback(40, "Analyzing tactical patterns with NMSTPP")
+            report(40, "Analyzing tactical patterns with NMSTPP")
             
             tactical_analysis = self.nmstpp_processor.analyze_tactics(events, video_data)
             
-            if progress_callback:
-                progress_callback(65, "Tactical analysis completed")
+            report(65, "Tactical analysis completed")
             
             # Stage 3: Player Evaluation using RLearn
-            if progress_callback:
-                progress_callback(70, "Evaluating player performance with RLearn")
+            report(70, "Evaluating player performance with RLearn")
             
             player_evaluations = self.rlearn_evaluator.evaluate_players(events, tactical_analysis)
             
-            if progress_callback:
-                progress_callback(85, "Player evaluation completed")
+            report(85, "Player evaluation completed")
             
             # Stage 4: Predictive Modeling
-            if progress_callback:
-                progress_callback(90, "Generating predictive insights")
+            report(90, "Generating predictive insights")
             
-            intelligence_data = {
-                'events': events,
-                'tactical_analysis': tactical_analysis,
-                'player_evaluations': player_evaluations
-            }
-            
-            predictions = self.predictive_engine.generate_predictions(intelligence_data)
+            predictions = self.predictive_engine.generate_predictions(
+                events, tactical_analysis, player_evaluations
+            )
             
-            if progress_callback:
-                progress_callback(95, "Finalizing intelligence results")
+            report(95, "Finalizing intelligence results")
             
             # Compile final results
             confidence_scores = self._calculate_overall_confidence_scores(
                 events, tactical_analysis, player_evaluations, predictions
             )
             
+            player_metrics = player_evaluations.get('player_metrics')
+            strategic_insights = tactical_analysis.get('strategic_insights')
+            match_outcomes = predictions.get('match_outcomes')
+            score_predictions = match_outcomes.get('final_score_predictions') if match_outcomes else None
+            prediction_metadata = predictions.get('processing_metadata')
+            
+            total_time = time.perf_counter() - start_time
             processing_metadata = {
                 'pipeline_version': self.pipeline_version,
-                'total_processing_time': time.time() - start_time,
+                'total_processing_time': total_time,
                 'analysis_intent': analysis_intent,
                 'events_processed': len(events),
-                'players_evaluated': len(player_evaluations.get('player_metrics', {})),
-                'tactical_insights_generated': len(tactical_analysis.get('strategic_insights', [])),
-                'predictions_generated': len(predictions.get('match_outcomes', {}).get('final_score_predictions', [])),
-                'data_quality_score': predictions.get('processing_metadata', {}).get('data_quality_score', 0.8)
+                'players_evaluated': len(player_metrics) if player_metrics else 0,
+                'tactical_insights_generated': len(strategic_insights) if strategic_insights else 0,
+                'predictions_generated': len(score_predictions) if score_predictions else 0,
+                'data_quality_score': (
+                    prediction_metadata.get('data_quality_score', 0.8) if prediction_metadata else 0.8
+                )
             }
             
             results = IntelligenceResults(
@@ -1494,19 +1860,46 @@ class OpenStarLabIntelligenceProcessor:
                 processing_metadata=processing_metadata
             )
             
-            if progress_callback:
-                progress_callback(100, "Intelligence processing completed")
+            if cache_key is not None:
+                self._cache_results(cache_key, results)
             
-            total_time = time.time() - start_time
-            logger.info(f"OpenStarLab intelligence processing completed in {total_time:.2f}s")
+            report(100, "Intelligence processing completed")
             
-            return results
+            logger.info("OpenStarLab intelligence processing completed in %.2fs", total_time)
             
+            return results
+    
+    def _results_cache_key(self, video_data: Dict[str, Any], analysis_intent: str) -> Optional[str]:
+        """
+        Cache key for a video's results, or None if the video has no content hash.
+        
+        The configured seed is part of the key, so a seeded processor never
+        reuses results simulated under another seed.
+        """
+        content_hash = video_data.get('content_hash')
+        if not content_hash:
+            return None
+        
+        digest = hashlib.blake2b(
+            f"{content_hash}|{analysis_intent}|{self.pipeline_version}|{self.config.get('seed')}".encode(),
+            digest_size=16
+        ).hexdigest()
+        return f"analytics:intelligence_results:{digest}"
+    
+    def _get_cached_results(self, cache_key: str) -> Optional[IntelligenceResults]:
+        """Cached results for a key; cache errors are logged and treated as a miss."""
+        try:
+            return cache.get(cache_key)
         except Exception as e:
-            logger.error(f"OpenStarLab intelligence processing failed: {str(e)}")
-            if progress_callback:
-                progress_callback(-1, f"Processing failed: {str(e)}")
-            raise
+            logger.warning("Could not read cached intelligence results for %s: %s", cache_key, e)
+            return None
+    
+    def _cache_results(self, cache_key: str, results: IntelligenceResults) -> None:
+        """Cache results for a key; cache errors are logged and skipped."""
+        try:
+            cache.set(cache_key, results, _RESULTS_CACHE_TIMEOUT)
+        except Exception as e:
+            logger.warning("Could not cache intelligence results for %s: %s", cache_key, e)
     
     def _calculate_overall_confidence_scores(self, events: List[Dict], 
                                            tactical_analysis: Dict[str, Any],
@@ -1514,28 +1907,25 @@ class OpenStarLabIntelligenceProcessor:
                                            predictions: Dict[str, Any]) -> Dict[str, float]:
         """Calculate overall confidence scores for the intelligence results."""
         
-        # Event detection confidence
-        event_confidences = [e.get('confidence', 0) for e in events]
-        event_confidence = np.mean(event_confidences) if event_confidences else 0.0
+        if not (events or tactical_analysis or player_evaluations or predictions):
+            return dict(_ZERO_CONFIDENCE_SCORES)
         
-        # Tactical analysis confidence
+        event_confidences = np.fromiter(
+            (e.get('confidence', 0.0) for e in events), dtype=np.float64, count=len(events)
+        )
         tactical_confidence = tactical_analysis.get('processing_metadata', {}).get('confidence_level', 0.0)
-        
-        # Player evaluation confidence (based on Q-values)
         player_metrics = player_evaluations.get('player_metrics', {})
-        if player_metrics:
-            player_scores = [m.get('overall_performance_score', 0) for m in player_metrics.values()]
-            player_confidence = min(0.9, np.mean(player_scores) + 0.2)
-        else:
-            player_confidence = 0.0
-        
-        # Prediction confidence
+        player_scores = np.fromiter(
+            (m.get('overall_performance_score', 0.0) for m in player_metrics.values()),
+            dtype=np.float64, count=len(player_metrics)
+        )
         prediction_confidence = predictions.get('confidence_metrics', {}).get('overall_confidence', 0.0)
         
-        # Overall intelligence confidence
-        intelligence_confidence = np.mean([
-            event_confidence, tactical_confidence, player_confidence, prediction_confidence
-        ])
+        # Event and player (Q-value based) confidence plus their overall
+        # combination with the tactical and prediction confidence
+        event_confidence, player_confidence, intelligence_confidence = aggregate_confidence(
+            event_confidences, player_scores, float(tactical_confidence), float(prediction_confidence)
+        )
         
         return {
             'overall_intelligence_confidence': intelligence_confidence,
@@ -3,9 +3,17 @@ Analytics serializers for Propter-Optimis Sports Analytics Platform.
 """
 from rest_framework import serializers
 from django.utils import timezone
-from .models import Analysis, AnalysisTask, AnalysisInsight, AnalysisMetrics
+from .models import (
+    Analysis, AnalysisTask, AnalysisInsight, AnalysisMetrics, AnalysisDashboardDaily,
+    format_processing_time
+)
+from apps.videos.models import analysis_intent_display_name, format_duration
 from apps.videos.serializers import VideoListSerializer
-from apps.core.models import AnalysisStatus, AnalysisIntent
+from apps.core.models import AnalysisStatus, AnalysisIntent, InsightImportance
+
+
+# Importance codes clients received before the level was stored as an integer
+_IMPORTANCE_CODES = {level.value: level.name.lower() for level in InsightImportance}
 
 
 class AnalysisTaskSerializer(serializers.ModelSerializer):
@@ -23,13 +31,20 @@ class AnalysisTaskSerializer(serializers.ModelSerializer):
 class AnalysisInsightSerializer(serializers.ModelSerializer):
     """Serializer for analysis insights."""
     
+    importance_level = serializers.SerializerMethodField()
+    importance_label = serializers.CharField(source='get_importance_level_display', read_only=True)
+    
     class Meta:
         model = AnalysisInsight
         fields = [
             'id', 'insight_type', 'title', 'description', 'confidence_score',
-            'importance_level', 'metadata', 'created_at'
+            'importance_level', 'importance_label', 'metadata', 'created_at'
         ]
         read_only_fields = ['id', 'created_at']
+    
+    def get_importance_level(self, obj):
+        """Return the importance code, e.g. 'high'; unknown levels are shown as stored."""
+        return _IMPORTANCE_CODES.get(obj.importance_level, str(obj.importance_level))
 
 
 class AnalysisMetricsSerializer(serializers.ModelSerializer):
@@ -104,6 +119,8 @@ class AnalysisCreateSerializer(serializers.Serializer):
                     f'Video is not ready for analysis. Status: {video.status}'
                 )
             
+            # Reused by create() instead of fetching the video again
+            self._video = video
             return value
             
         except Video.DoesNotExist:
@@ -111,14 +128,12 @@ class AnalysisCreateSerializer(serializers.Serializer):
     
     def create(self, validated_data):
         """Create analysis instance."""
-        from apps.videos.models import Video
-        
-        video = Video.objects.get(id=validated_data['video_id'])
+        video = self._video
         
         # Update video analysis intent if provided
         if 'analysis_intent' in validated_data:
             video.analysis_intent = validated_data['analysis_intent']
-            video.save()
+            video.save(update_fields=['analysis_intent'])
         
         # Create analysis
         analysis = Analysis.objects.create(
@@ -129,21 +144,33 @@ class AnalysisCreateSerializer(serializers.Serializer):
         return analysis
 
 
-class AnalysisListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for analysis list view."""
+class AnalysisListSerializer(serializers.Serializer):
+    """
+    Lightweight serializer for analysis list view.
     
-    video_filename = serializers.CharField(source='video.filename', read_only=True)
-    video_duration = serializers.CharField(source='video.formatted_duration', read_only=True)
-    analysis_intent = serializers.CharField(source='video.get_analysis_intent_display_name', read_only=True)
-    formatted_processing_time = serializers.ReadOnlyField()
+    Reads the dict rows of Analysis.objects.list_values(), so list pages
+    never build Analysis or Video instances.
+    """
     
-    class Meta:
-        model = Analysis
-        fields = [
-            'id', 'video_filename', 'video_duration', 'analysis_intent',
-            'status', 'progress_percentage', 'current_step',
-            'formatted_processing_time', 'created_at', 'completed_at'
-        ]
+    id = serializers.UUIDField(read_only=True)
+    video_filename = serializers.CharField(source='video__filename', read_only=True)
+    video_duration = serializers.SerializerMethodField()
+    analysis_intent = serializers.SerializerMethodField()
+    status = serializers.CharField(read_only=True)
+    progress_percentage = serializers.IntegerField(read_only=True)
+    current_step = serializers.CharField(read_only=True)
+    formatted_processing_time = serializers.SerializerMethodField()
+    created_at = serializers.DateTimeField(read_only=True)
+    completed_at = serializers.DateTimeField(read_only=True)
+    
+    def get_video_duration(self, row):
+        return format_duration(row['video__duration'])
+    
+    def get_analysis_intent(self, row):
+        return analysis_intent_display_name(row['video__analysis_intent'])
+    
+    def get_formatted_processing_time(self, row):
+        return format_processing_time(row['processing_time'])
 
 
 class AnalysisProgressSerializer(serializers.Serializer):
@@ -203,15 +230,26 @@ class AnalysisComparisonSerializer(serializers.Serializer):
         """Validate all analyses exist and belong to user."""
         user = self.context['request'].user
         
-        analyses = Analysis.objects.filter(
+        # Only the number of matches matters; don't load the rows
+        found = Analysis.objects.filter(
             id__in=value,
             video__user=user,
             status=AnalysisStatus.COMPLETED
-        )
+        ).count()
         
-        if len(analyses) != len(value):
+        if found != len(value):
             raise serializers.ValidationError(
                 'One or more analyses not found or not completed.'
             )
         
         return value
+
+
+class AnalysisDashboardDailySerializer(serializers.ModelSerializer):
+    """Serializer for daily analysis dashboard rows."""
+    
+    class Meta:
+        model = AnalysisDashboardDaily
+        fields = [
+            'day', 'status', 'analysis_count', 'avg_processing_time', 'events_detected'
+        ]
@@ -11,8 +11,10 @@ from celery import shared_task
 from django.utils import timezone
 from django.core.files.storage import default_storage
 
-from .models import Analysis, AnalysisTask, AnalysisInsight, AnalysisMetrics
-from apps.core.models import AnalysisStatus
+from .models import (
+    Analysis, AnalysisTask, AnalysisInsight, AnalysisMetrics, AnalysisDashboardDaily
+)
+from apps.core.models import AnalysisStatus, InsightType, InsightImportance
 from apps.videos.models import Video
 
 logger = logging.getLogger(__name__)
@@ -118,16 +120,19 @@ def generate_basic_insights(analysis: Analysis, results: Dict[str, Any]):
     logger.info(f"Generating insights for analysis {analysis.id}")
     
     try:
-        # Create a basic insight
-        AnalysisInsight.objects.create(
-            analysis=analysis,
-            insight_type='statistical_summary',
-            title='Analysis Complete',
-            description=f'Successfully processed {analysis.video.filename}',
-            confidence_score=0.95,
-            importance_level='medium',
-            metadata=results.get('analysis_results', {})
-        )
+        # Build insights unsaved and insert them together
+        insights = [
+            AnalysisInsight(
+                analysis=analysis,
+                insight_type=InsightType.STATISTICAL_SUMMARY,
+                title='Analysis Complete',
+                description=f'Successfully processed {analysis.video.filename}',
+                confidence_score=0.95,
+                importance_level=InsightImportance.MEDIUM,
+                metadata=results.get('analysis_results', {})
+            )
+        ]
+        AnalysisInsight.objects.bulk_insert_models(insights)
         
         # Create metrics
         AnalysisMetrics.objects.create(
@@ -140,7 +145,8 @@ def generate_basic_insights(analysis: Analysis, results: Dict[str, Any]):
             analysis_time=5,
             postprocessing_time=1,
             cpu_time_used=8.0,
-            memory_peak_mb=256
+            memory_peak_mb=256,
+            video_duration_seconds=analysis.video.duration or 0
         )
         
         logger.info(f"Generated insights for analysis {analysis.id}")
@@ -170,4 +176,22 @@ def cleanup_old_analysis_tasks():
         
     except Exception as e:
         logger.error(f"Failed to cleanup old analysis tasks: {str(e)}")
-        raise
\ No newline at end of file
+        raise
+
+
+@shared_task
+def refresh_analysis_dashboard():
+    """Refresh the daily analysis dashboard materialized view."""
+    try:
+        refreshed_at = AnalysisDashboardDaily.refresh()
+        if refreshed_at is None:
+            logger.info("Analysis dashboard view does not exist yet; skipping refresh")
+            return {'refreshed_at': None}
+        
+        logger.info(f"Refreshed analysis dashboard at {refreshed_at.isoformat()}")
+        
+        return {'refreshed_at': refreshed_at.isoformat()}
+        
+    except Exception as e:
+        logger.error(f"Failed to refresh analysis dashboard: {str(e)}")
+        raise
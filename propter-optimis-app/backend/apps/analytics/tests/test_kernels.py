@@ -0,0 +1,53 @@
+"""
+Tests that the compiled OpenStarLab kernels match their NumPy fallbacks.
+"""
+import unittest
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from apps.analytics import _kernels
+
+
+@unittest.skipIf(_kernels.njit is None, "Numba is not installed")
+class CompiledKernelEquivalenceTests(SimpleTestCase):
+    """Each Numba kernel returns what its NumPy fallback returns."""
+    
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+    
+    def test_compute_q_batch(self):
+        n = 2000
+        lut_sizes = (19, 6, 5, 4)
+        codes = [self.rng.integers(0, size, n).astype(np.int8) for size in lut_sizes]
+        noise = self.rng.normal(0, 0.5, n)
+        luts = [self.rng.uniform(-1.5, 1.5, size) for size in lut_sizes]
+        
+        compiled = _kernels.compute_q_batch(*codes, noise, *luts)
+        fallback = _kernels._compute_q_batch_numpy(*codes, noise, *luts)
+        
+        np.testing.assert_allclose(compiled, fallback)
+        self.assertTrue(np.all((compiled >= -1.0) & (compiled <= 1.0)))
+    
+    def test_q_value_stats(self):
+        q_values = self.rng.uniform(-1, 1, 500)
+        
+        count, mean, share = _kernels.q_value_stats(q_values, 0.5)
+        expected_count, expected_mean, expected_share = _kernels._q_value_stats_numpy(q_values, 0.5)
+        
+        self.assertEqual(count, expected_count)
+        self.assertAlmostEqual(mean, expected_mean)
+        self.assertAlmostEqual(share, expected_share)
+    
+    def test_aggregate_confidence(self):
+        cases = [
+            (self.rng.uniform(0, 1, 40), self.rng.uniform(0, 1, 8)),
+            (self.rng.uniform(0, 1, 40), np.full(4, 0.95)),  # player confidence capped at 0.9
+            (np.empty(0), np.empty(0)),
+        ]
+        for event_confidences, player_scores in cases:
+            with self.subTest(events=event_confidences.size, players=player_scores.size):
+                compiled = _kernels.aggregate_confidence(event_confidences, player_scores, 0.7, 0.6)
+                fallback = _kernels._aggregate_confidence_numpy(event_confidences, player_scores, 0.7, 0.6)
+                
+                np.testing.assert_allclose(compiled, fallback)
@@ -0,0 +1,169 @@
+"""
+Tests for analysis and analysis task status transitions.
+"""
+import threading
+import uuid
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from apps.analytics.models import Analysis, AnalysisTask
+from apps.core.models import AnalysisStatus, AnalysisTaskType
+from apps.videos.models import Video
+
+
+def _create_analysis(status=AnalysisStatus.PROCESSING):
+    video = Video.objects.create(user_id=uuid.uuid4(), filename='match.mp4', duration=5400)
+    return Analysis.objects.create(
+        video=video,
+        status=status,
+        started_at=timezone.now() - timedelta(seconds=90)
+    )
+
+
+class AnalysisTransitionTests(TestCase):
+    """Terminal transitions only apply to pending or processing analyses."""
+    
+    def setUp(self):
+        self.analysis = _create_analysis()
+    
+    def test_mark_completed_completes_active_analysis(self):
+        self.assertTrue(self.analysis.mark_completed(results={'events': 12}))
+        
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.status, AnalysisStatus.COMPLETED)
+        self.assertEqual(self.analysis.progress_percentage, 100)
+        self.assertEqual(self.analysis.openstarlab_results, {'events': 12})
+        self.assertIsNotNone(self.analysis.completed_at)
+        self.assertGreaterEqual(self.analysis.processing_time, 90)
+    
+    def test_duplicate_completion_is_a_no_op(self):
+        self.assertTrue(self.analysis.mark_completed(results={'events': 12}))
+        completed_at = Analysis.objects.get(pk=self.analysis.pk).completed_at
+        
+        self.assertFalse(self.analysis.mark_completed(results={'events': 99}))
+        
+        stored = Analysis.objects.get(pk=self.analysis.pk)
+        self.assertEqual(stored.completed_at, completed_at)
+        self.assertEqual(stored.openstarlab_results, {'events': 12})
+    
+    def test_stale_instance_cannot_complete_again(self):
+        stale = Analysis.objects.get(pk=self.analysis.pk)
+        self.assertTrue(self.analysis.mark_completed(results={'events': 12}))
+        
+        self.assertFalse(stale.mark_completed(results={'events': 99}))
+        self.assertEqual(stale.status, AnalysisStatus.PROCESSING)
+        self.assertEqual(Analysis.objects.get(pk=self.analysis.pk).openstarlab_results, {'events': 12})
+    
+    def test_mark_failed_fails_active_analysis(self):
+        self.assertTrue(self.analysis.mark_failed('Processing failed: boom'))
+        
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.status, AnalysisStatus.FAILED)
+        self.assertEqual(self.analysis.error_message, 'Processing failed: boom')
+        self.assertIsNotNone(self.analysis.completed_at)
+    
+    def test_finished_analyses_keep_their_status(self):
+        for status in (AnalysisStatus.COMPLETED, AnalysisStatus.FAILED, AnalysisStatus.CANCELLED):
+            with self.subTest(status=status):
+                analysis = _create_analysis(status=status)
+                
+                self.assertFalse(analysis.mark_completed(results={'events': 1}))
+                self.assertFalse(analysis.mark_failed('late failure'))
+                
+                self.assertEqual(analysis.status, status)
+                stored = Analysis.objects.get(pk=analysis.pk)
+                self.assertEqual(stored.status, status)
+                self.assertIsNone(stored.completed_at)
+                self.assertIsNone(stored.openstarlab_results)
+                self.assertIsNone(stored.error_message)
+
+
+class AnalysisTransitionRaceTests(TransactionTestCase):
+    """Workers racing on the same analysis complete it exactly once."""
+    
+    def setUp(self):
+        self.analysis = _create_analysis()
+    
+    def _in_worker(self, func):
+        """Run func on another thread with its own connection and return its result."""
+        outcome = {}
+        
+        def target():
+            try:
+                outcome['result'] = func()
+            finally:
+                connection.close()
+        
+        worker = threading.Thread(target=target)
+        worker.start()
+        worker.join(timeout=10)
+        self.assertFalse(worker.is_alive(), 'worker blocked on a locked row')
+        return outcome['result']
+    
+    def test_completion_skips_row_locked_by_another_worker(self):
+        pk = self.analysis.pk
+        
+        with transaction.atomic():
+            Analysis.objects.select_for_update().get(pk=pk)
+            completed = self._in_worker(lambda: Analysis.objects.get(pk=pk).mark_completed())
+        
+        self.assertFalse(completed)
+        self.assertEqual(Analysis.objects.get(pk=pk).status, AnalysisStatus.PROCESSING)
+    
+    def test_racing_completions_complete_once(self):
+        pk = self.analysis.pk
+        workers = 4
+        barrier = threading.Barrier(workers)
+        results = []
+        
+        def complete():
+            analysis = Analysis.objects.get(pk=pk)
+            try:
+                barrier.wait(timeout=5)
+                results.append(analysis.mark_completed(results={'events': 12}))
+            finally:
+                connection.close()
+        
+        threads = [threading.Thread(target=complete) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        
+        self.assertEqual(sorted(results), [False] * (workers - 1) + [True])
+        self.assertEqual(Analysis.objects.get(pk=pk).status, AnalysisStatus.COMPLETED)
+
+
+class AnalysisTaskTransitionTests(TestCase):
+    """Task transitions are conditional on the task still being active."""
+    
+    def setUp(self):
+        self.task = AnalysisTask.objects.create(
+            analysis=_create_analysis(),
+            task_name='Event modeling',
+            task_type=AnalysisTaskType.EVENT_MODELING,
+            status=AnalysisStatus.PROCESSING,
+            started_at=timezone.now() - timedelta(seconds=30)
+        )
+    
+    def test_mark_completed_completes_active_task_once(self):
+        self.assertTrue(self.task.mark_completed({'events': 12}))
+        self.assertFalse(self.task.mark_completed({'events': 99}))
+        
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, AnalysisStatus.COMPLETED)
+        self.assertEqual(self.task.result_data, {'events': 12})
+        self.assertGreaterEqual(self.task.duration, 30)
+    
+    def test_failed_task_keeps_its_status(self):
+        self.assertTrue(self.task.mark_failed('boom'))
+        self.assertFalse(self.task.mark_completed({'events': 12}))
+        self.assertFalse(self.task.mark_failed('again'))
+        
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, AnalysisStatus.FAILED)
+        self.assertEqual(self.task.error_message, 'boom')
+        self.assertIsNone(self.task.result_data)
@@ -0,0 +1,148 @@
+"""
+Tests for the analysis list serializer.
+"""
+import uuid
+
+from django.test import SimpleTestCase, TestCase
+from rest_framework import serializers
+
+from apps.analytics.models import Analysis, AnalysisInsight, AnalysisMetrics, AnalysisTask
+from apps.analytics.serializers import (
+    AnalysisInsightSerializer, AnalysisListSerializer, AnalysisSerializer
+)
+from apps.core.models import (
+    AnalysisIntent, AnalysisStatus, AnalysisTaskType, InsightImportance, InsightType
+)
+from apps.videos.models import Video
+
+
+class _ModelAnalysisListSerializer(serializers.ModelSerializer):
+    """The list serializer as it was before it read dict rows, kept as a reference."""
+    
+    video_filename = serializers.CharField(source='video.filename', read_only=True)
+    video_duration = serializers.CharField(source='video.formatted_duration', read_only=True)
+    analysis_intent = serializers.CharField(source='video.get_analysis_intent_display_name', read_only=True)
+    formatted_processing_time = serializers.ReadOnlyField()
+    
+    class Meta:
+        model = Analysis
+        fields = [
+            'id', 'video_filename', 'video_duration', 'analysis_intent',
+            'status', 'progress_percentage', 'current_step',
+            'formatted_processing_time', 'created_at', 'completed_at'
+        ]
+
+
+class AnalysisListSerializerTests(TestCase):
+    """List rows serialize exactly as the model-based serializer did."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        def create(filename, duration, intent, **analysis_fields):
+            video = Video.objects.create(
+                user_id=uuid.uuid4(), filename=filename, duration=duration, analysis_intent=intent
+            )
+            return Analysis.objects.create(video=video, **analysis_fields)
+        
+        create('full.mp4', 5430, AnalysisIntent.FULL_MATCH,
+               status=AnalysisStatus.PROCESSING, progress_percentage=40, current_step='Detecting events')
+        create('short.mp4', 125, AnalysisIntent.SET_PIECE, status=AnalysisStatus.PENDING)
+        create('unknown-duration.mp4', None, None, status=AnalysisStatus.PENDING)
+        create('done.mp4', 45, AnalysisIntent.TACTICAL_PHASE,
+               status=AnalysisStatus.COMPLETED, processing_time=192)
+        
+        # Rows written straight to Supabase can hold intents outside the choices
+        legacy = create('legacy.mp4', 3600, None, status=AnalysisStatus.PENDING)
+        Video.objects.filter(pk=legacy.video_id).update(analysis_intent='legacy_review')
+    
+    def _serialize(self, queryset=None):
+        if queryset is None:
+            queryset = Analysis.objects.all()
+        rows = queryset.list_values().order_by('video__filename')
+        return AnalysisListSerializer(rows, many=True).data
+    
+    def test_matches_model_serializer_output(self):
+        # The model serializer raised KeyError on unknown intents, so compare the rows it could render
+        known = Analysis.objects.exclude(video__filename='legacy.mp4')
+        expected = _ModelAnalysisListSerializer(known.order_by('video__filename'), many=True).data
+        
+        self.assertEqual(
+            [dict(row) for row in self._serialize(known)],
+            [dict(row) for row in expected]
+        )
+    
+    def test_formats_video_and_processing_fields(self):
+        rows = {row['video_filename']: row for row in self._serialize()}
+        
+        self.assertEqual(rows['full.mp4']['video_duration'], '1h 30m 30s')
+        self.assertEqual(rows['full.mp4']['analysis_intent'], 'Full Match Review')
+        self.assertEqual(rows['full.mp4']['current_step'], 'Detecting events')
+        self.assertEqual(rows['done.mp4']['formatted_processing_time'], '3m 12s')
+        self.assertEqual(rows['short.mp4']['formatted_processing_time'], 'Unknown')
+    
+    def test_null_duration_and_intent(self):
+        row = next(row for row in self._serialize() if row['video_filename'] == 'unknown-duration.mp4')
+        
+        self.assertEqual(row['video_duration'], 'Unknown')
+        self.assertEqual(row['analysis_intent'], 'Not selected')
+        self.assertIsNone(row['current_step'])
+        self.assertIsNone(row['completed_at'])
+    
+    def test_unknown_intent_is_shown_as_stored(self):
+        row = next(row for row in self._serialize() if row['video_filename'] == 'legacy.mp4')
+        
+        self.assertEqual(row['analysis_intent'], 'legacy_review')
+
+
+class AnalysisInsightSerializerTests(SimpleTestCase):
+    """Importance levels are returned as the codes clients already read."""
+    
+    def _importance(self, level):
+        data = AnalysisInsightSerializer(AnalysisInsight(importance_level=level)).data
+        return data['importance_level'], data['importance_label']
+    
+    def test_known_levels_use_codes(self):
+        self.assertEqual(self._importance(InsightImportance.HIGH), ('high', 'High'))
+        self.assertEqual(self._importance(InsightImportance.LOW), ('low', 'Low'))
+    
+    def test_unknown_level_is_shown_as_stored(self):
+        self.assertEqual(self._importance(7), ('7', '7'))
+
+
+class AnalysisSerializerQueryTests(TestCase):
+    """The detail serializer reads only preloaded relations."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        video = Video.objects.create(user_id=uuid.uuid4(), filename='match.mp4', duration=5400)
+        cls.analysis = Analysis.objects.create(video=video, status=AnalysisStatus.COMPLETED)
+        AnalysisMetrics.objects.create(analysis=cls.analysis, events_detected=12)
+        for task_type in (AnalysisTaskType.EVENT_MODELING, AnalysisTaskType.TACTICAL_ANALYSIS):
+            AnalysisTask.objects.create(
+                analysis=cls.analysis, task_name=task_type.label, task_type=task_type
+            )
+        AnalysisInsight.objects.create(
+            analysis=cls.analysis, insight_type=InsightType.TACTICAL_PATTERN,
+            title='High press', description='Won the ball high'
+        )
+    
+    def _assert_serializes_without_queries(self, analysis):
+        with self.assertNumQueries(0):
+            data = AnalysisSerializer(analysis).data
+        self.assertEqual(len(data['tasks']), 2)
+        self.assertEqual(len(data['insights']), 1)
+        self.assertEqual(data['metrics']['events_detected'], 12)
+    
+    def test_with_related(self):
+        with self.assertNumQueries(3):
+            analysis = Analysis.objects.with_related().get(pk=self.analysis.pk)
+        
+        self._assert_serializes_without_queries(analysis)
+    
+    def test_load_related_on_fetched_analysis(self):
+        analysis = Analysis.objects.get(pk=self.analysis.pk)
+        
+        with self.assertNumQueries(3):
+            analysis.load_related()
+        
+        self._assert_serializes_without_queries(analysis)
@@ -0,0 +1,76 @@
+"""
+Tests for the analytics API views.
+"""
+import uuid
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.analytics.models import Analysis, AnalysisDashboardDaily, AnalysisMetrics
+from apps.core.models import AnalysisStatus
+from apps.videos.models import Video
+
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[5] / 'supabase' / 'migrations'
+
+User = get_user_model()
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class AnalysisDashboardViewTests(TestCase):
+    """The staff dashboard reads the materialized view with its refresh time."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('analytics:analysis_dashboard')
+        self.staff = User.objects.create_user('staff', password='pw', is_staff=True)
+    
+    def _create_view(self):
+        sql = (MIGRATIONS_DIR / '1753064289_create_analysis_dashboard_daily.sql').read_text()
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+    
+    def test_requires_staff(self):
+        self.client.force_authenticate(User.objects.create_user('coach', password='pw'))
+        
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+    
+    def test_empty_until_view_exists(self):
+        self.client.force_authenticate(self.staff)
+        
+        response = self.client.get(self.url)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['data'], {'refreshed_at': None, 'days': []})
+    
+    def test_returns_rows_with_refresh_time(self):
+        video = Video.objects.create(user_id=uuid.uuid4(), filename='match.mp4', duration=5400)
+        for status, events in ((AnalysisStatus.COMPLETED, 40), (AnalysisStatus.COMPLETED, 60),
+                               (AnalysisStatus.FAILED, None)):
+            analysis = Analysis.objects.create(video=video, status=status, processing_time=120)
+            if events is not None:
+                AnalysisMetrics.objects.create(analysis=analysis, events_detected=events)
+        self._create_view()
+        refreshed_at = AnalysisDashboardDaily.refresh()
+        self.client.force_authenticate(self.staff)
+        
+        response = self.client.get(self.url, {'days': 7})
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.data['data']
+        self.assertEqual(data['refreshed_at'], refreshed_at.isoformat())
+        rows = {row['status']: row for row in data['days']}
+        self.assertEqual(rows[AnalysisStatus.COMPLETED]['analysis_count'], 2)
+        self.assertEqual(rows[AnalysisStatus.COMPLETED]['events_detected'], 100)
+        self.assertEqual(rows[AnalysisStatus.FAILED]['events_detected'], 0)
+    
+    def test_rejects_invalid_days(self):
+        self.client.force_authenticate(self.staff)
+        
+        self.assertEqual(self.client.get(self.url, {'days': 'week'}).status_code, 400)
@@ -11,7 +11,8 @@ from .views import (
     analysis_progress,
     retry_analysis,
     cancel_analysis,
-    analysis_statistics
+    analysis_statistics,
+    analysis_dashboard
 )
 
 app_name = 'analytics'
@@ -30,4 +31,5 @@ urlpatterns = [
     # Analysis utilities
     path('compare/', AnalysisComparisonView.as_view(), name='analysis_comparison'),
     path('statistics/', analysis_statistics, name='analysis_statistics'),
+    path('dashboard/', analysis_dashboard, name='analysis_dashboard'),
 ]
@@ -9,19 +9,21 @@ from django.shortcuts import get_object_or_404
 from django.db import transaction
 from django.utils import timezone
 from django.conf import settings
+from datetime import timedelta
 import logging
 
-from .models import Analysis, AnalysisTask, AnalysisInsight, AnalysisMetrics
+from .models import Analysis, AnalysisTask, AnalysisInsight, AnalysisMetrics, AnalysisDashboardDaily
 from .serializers import (
     AnalysisSerializer,
     AnalysisCreateSerializer,
     AnalysisListSerializer,
     AnalysisProgressSerializer,
     AnalysisResultsSerializer,
-    AnalysisComparisonSerializer
+    AnalysisComparisonSerializer,
+    AnalysisDashboardDailySerializer
 )
 from apps.core.utils import create_error_response, create_success_response
-from apps.core.models import AnalysisStatus
+from apps.core.models import AnalysisStatus, InsightImportance
 from apps.videos.models import Video
 
 
@@ -42,13 +44,13 @@ class AnalysisListCreateView(generics.ListCreateAPIView):
                 test_user = User.objects.get(email='test@example.com')
                 return Analysis.objects.filter(
                     video__user=test_user
-                ).select_related('video').prefetch_related('tasks', 'insights')
+                ).list_values()
             except User.DoesNotExist:
                 return Analysis.objects.none()
         else:
             return Analysis.objects.filter(
                 video__user=self.request.user
-            ).select_related('video').prefetch_related('tasks', 'insights')
+            ).list_values()
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -101,11 +103,11 @@ class AnalysisDetailView(generics.RetrieveUpdateDestroyAPIView):
     
     def get_queryset(self):
         """Get analyses for current user's videos."""
-        return Analysis.objects.filter(
-            video__user=self.request.user
-        ).select_related('video', 'metrics').prefetch_related(
-            'tasks', 'insights'
-        )
+        queryset = Analysis.objects.filter(video__user=self.request.user)
+        if self.request.method == 'GET':
+            # Writes only need the row; reads serialize every relation
+            queryset = queryset.with_related()
+        return queryset
     
     def destroy(self, request, *args, **kwargs):
         """Delete analysis and associated data."""
@@ -193,7 +195,10 @@ def retry_analysis(request, analysis_id):
         analysis.current_step = None
         analysis.started_at = None
         analysis.completed_at = None
-        analysis.save()
+        analysis.save(update_fields=[
+            'status', 'error_message', 'progress_percentage',
+            'current_step', 'started_at', 'completed_at'
+        ])
         
         # Trigger OpenStar Lab analysis retry
         from .tasks import start_openstarlab_analysis
@@ -201,6 +206,7 @@ def retry_analysis(request, analysis_id):
         
         logger.info(f"Analysis retry initiated: {analysis.id}")
         
+        analysis.load_related()
         return create_success_response(
             'Analysis retry initiated',
             AnalysisSerializer(analysis).data
@@ -236,12 +242,13 @@ def cancel_analysis(request, analysis_id):
         # Cancel analysis
         analysis.status = AnalysisStatus.CANCELLED
         analysis.completed_at = timezone.now()
-        analysis.save()
+        analysis.save(update_fields=['status', 'completed_at'])
         
         # TODO: Cancel OpenStar Lab analysis task
         
         logger.info(f"Analysis cancelled: {analysis.id}")
         
+        analysis.load_related()
         return create_success_response(
             'Analysis cancelled successfully',
             AnalysisSerializer(analysis).data
@@ -288,7 +295,7 @@ class AnalysisResultsView(APIView):
                 'confidence_level': 'High',
                 'total_insights': analysis.insights.count(),
                 'high_priority_insights': analysis.insights.filter(
-                    importance_level__in=['high', 'critical']
+                    importance_level__gte=InsightImportance.HIGH
                 ).count(),
                 'recommendations': []
             }
@@ -470,3 +477,48 @@ def analysis_statistics(request):
             {'error': str(e)},
             status.HTTP_500_INTERNAL_SERVER_ERROR
         )
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAdminUser])
+def analysis_dashboard(request):
+    """
+    Get the platform-wide daily analysis roll-up for staff.
+    
+    Rows come from the materialized view, so ``refreshed_at`` is returned
+    alongside them to show how stale they may be.
+    """
+    try:
+        try:
+            days = int(request.query_params.get('days', 30))
+        except ValueError:
+            return create_error_response(
+                'Invalid days parameter',
+                {'days': request.query_params.get('days')},
+                status.HTTP_400_BAD_REQUEST
+            )
+        days = min(max(days, 1), 365)
+        
+        rows = []
+        if AnalysisDashboardDaily.exists():
+            since = timezone.localdate() - timedelta(days=days - 1)
+            rows = AnalysisDashboardDailySerializer(
+                AnalysisDashboardDaily.objects.filter(day__gte=since),
+                many=True
+            ).data
+        
+        return create_success_response(
+            'Analysis dashboard retrieved',
+            {
+                'refreshed_at': AnalysisDashboardDaily.last_refreshed_at(),
+                'days': rows
+            }
+        )
+        
+    except Exception as e:
+        logger.error(f"Error retrieving analysis dashboard: {e}")
+        return create_error_response(
+            'Failed to retrieve analysis dashboard',
+            {'error': str(e)},
+            status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
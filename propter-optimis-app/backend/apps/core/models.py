@@ -25,6 +25,34 @@ class AnalysisStatus(models.TextChoices):
     CANCELLED = 'cancelled', 'Cancelled'
 
 
+class AnalysisTaskType(models.TextChoices):
+    """Choices for analysis pipeline task types."""
+    PREPROCESSING = 'preprocessing', 'Preprocessing'
+    EVENT_MODELING = 'event_modeling', 'Event Modeling'
+    TACTICAL_ANALYSIS = 'tactical_analysis', 'Tactical Analysis'
+    PLAYER_TRACKING = 'player_tracking', 'Player Tracking'
+    INSIGHT_GENERATION = 'insight_generation', 'Insight Generation'
+    POSTPROCESSING = 'postprocessing', 'Postprocessing'
+
+
+class InsightType(models.TextChoices):
+    """Choices for analysis insight types."""
+    TACTICAL_PATTERN = 'tactical_pattern', 'Tactical Pattern'
+    PLAYER_PERFORMANCE = 'player_performance', 'Player Performance'
+    TEAM_DYNAMICS = 'team_dynamics', 'Team Dynamics'
+    KEY_MOMENTS = 'key_moments', 'Key Moments'
+    STATISTICAL_SUMMARY = 'statistical_summary', 'Statistical Summary'
+    RECOMMENDATION = 'recommendation', 'Recommendation'
+
+
+class InsightImportance(models.IntegerChoices):
+    """Choices for insight importance, ordered so higher values rank first."""
+    LOW = 1, 'Low'
+    MEDIUM = 2, 'Medium'
+    HIGH = 3, 'High'
+    CRITICAL = 4, 'Critical'
+
+
 class VideoStatus(models.TextChoices):
     """Choices for video status."""
     UPLOADED = 'uploaded', 'Uploaded'
@@ -5,6 +5,7 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
+from django.db.models import Count
 
 from .models import Export, ExportTemplate, ExportCustomization, ExportShare
 from apps.core.admin import TimestampedModelAdmin
@@ -97,7 +98,7 @@ class ExportAdmin(admin.ModelAdmin):
     
     def shares_count(self, obj):
         """Display number of shares."""
-        count = obj.shares.count()
+        count = obj._shares_count
         if count > 0:
             url = reverse('admin:exports_exportshare_changelist')
             return format_html(
@@ -106,6 +107,7 @@ class ExportAdmin(admin.ModelAdmin):
             )
         return '0 shares'
     shares_count.short_description = 'Shares'
+    shares_count.admin_order_field = '_shares_count'
     
     def download_link(self, obj):
         """Display download link if available."""
@@ -120,8 +122,8 @@ class ExportAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """Optimize queryset with related objects."""
         return super().get_queryset(request).select_related(
-            'analysis', 'analysis__video', 'analysis__video__user'
-        ).prefetch_related('shares')
+            'analysis', 'analysis__video'
+        ).annotate(_shares_count=Count('shares'))
 
 
 @admin.register(ExportTemplate)
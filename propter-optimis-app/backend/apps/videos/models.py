@@ -19,6 +19,38 @@ from apps.core.models import TimestampedModel, VideoStatus, AnalysisIntent
 import uuid
 
 
+_ANALYSIS_INTENT_LABELS = dict(AnalysisIntent.choices)
+
+
+def format_duration(seconds):
+    """Format a duration in seconds as e.g. '1h 2m 3s', '2m 3s' or '3s'."""
+    if not seconds:
+        return 'Unknown'
+    
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    seconds = seconds % 60
+    
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    elif minutes > 0:
+        return f"{minutes}m {seconds}s"
+    else:
+        return f"{seconds}s"
+
+
+def analysis_intent_display_name(analysis_intent):
+    """
+    Human readable label for an analysis intent value.
+    
+    Rows written straight to Supabase can hold codes outside
+    AnalysisIntent; those are shown as stored instead of failing.
+    """
+    if analysis_intent:
+        return _ANALYSIS_INTENT_LABELS.get(analysis_intent, analysis_intent)
+    return 'Not selected'
+
+
 class Video(models.Model):
     """Video model that maps to Supabase videos table."""
     
@@ -91,19 +123,7 @@ class Video(models.Model):
     @property
     def formatted_duration(self):
         """Format duration in human readable format."""
-        if not self.duration:
-            return 'Unknown'
-        
-        hours = self.duration // 3600
-        minutes = (self.duration % 3600) // 60
-        seconds = self.duration % 60
-        
-        if hours > 0:
-            return f"{hours}h {minutes}m {seconds}s"
-        elif minutes > 0:
-            return f"{minutes}m {seconds}s"
-        else:
-            return f"{seconds}s"
+        return format_duration(self.duration)
     
     @property
     def formatted_file_size(self):
@@ -116,9 +136,7 @@ class Video(models.Model):
     
     def get_analysis_intent_display_name(self):
         """Get human readable analysis intent."""
-        if self.analysis_intent:
-            return dict(AnalysisIntent.choices)[self.analysis_intent]
-        return 'Not selected'
+        return analysis_intent_display_name(self.analysis_intent)
 
 
 class VideoUploadSession(TimestampedModel):
@@ -24,6 +24,7 @@ DJANGO_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 ]
 
 THIRD_PARTY_APPS = [
@@ -36,7 +37,7 @@ LOCAL_APPS = [
     'apps.core',
     # 'apps.authentication',  # Removed - using Supabase auth only
     'apps.videos',
-    'apps.analytics',
+    'apps.analytics.apps.AnalyticsConfig',
     'apps.exports',
 ]
 
@@ -201,6 +202,12 @@ CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
 CELERY_TASK_SOFT_TIME_LIMIT = 25 * 60  # 25 minutes
+CELERY_BEAT_SCHEDULE = {
+    'refresh-analysis-dashboard': {
+        'task': 'apps.analytics.tasks.refresh_analysis_dashboard',
+        'schedule': 5 * 60,  # 5 minutes
+    },
+}
 
 # File Upload Settings
 MAX_FILE_SIZE = config('MAX_FILE_SIZE', default=2147483648, cast=int)  # 2GB
@@ -0,0 +1,5 @@
+-- Migration: create_admin_search_indexes
+-- Created at: 1753064285
+
+-- Prefix (istartswith) indexes backing the Django admin search fields
+CREATE INDEX IF NOT EXISTS idx_videos_filename_prefix ON videos(UPPER(filename::text) text_pattern_ops);
@@ -0,0 +1,15 @@
+-- Migration: create_analysis_composite_indexes
+-- Created at: 1753064286
+
+-- Composite indexes matching the analyses list filters and ordering
+CREATE INDEX IF NOT EXISTS analyses_status_created_idx ON analyses(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS analyses_video_status_idx ON analyses(video_id, status);
+
+-- The single-column indexes are prefixes of the composites above and only
+-- add write cost
+DROP INDEX IF EXISTS idx_analyses_status;
+DROP INDEX IF EXISTS idx_analyses_video;
+
+-- Partial index over the in-flight subset polled by progress checks
+CREATE INDEX IF NOT EXISTS analyses_active_idx ON analyses(created_at DESC)
+    WHERE status IN ('pending', 'processing');
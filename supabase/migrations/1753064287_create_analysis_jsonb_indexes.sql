@@ -0,0 +1,7 @@
+-- Migration: create_analysis_jsonb_indexes
+-- Created at: 1753064287
+
+-- GIN indexes for containment (@>) queries on analysis result payloads.
+-- jsonb_path_ops is smaller and faster than the default jsonb_ops for @>.
+CREATE INDEX IF NOT EXISTS analyses_osl_gin ON analyses USING gin (openstarlab_results jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS analyses_ai_insights_gin ON analyses USING gin (ai_insights jsonb_path_ops);
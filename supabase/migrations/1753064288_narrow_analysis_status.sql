@@ -0,0 +1,5 @@
+-- Migration: narrow_analysis_status
+-- Created at: 1753064288
+
+-- Longest status value is 'processing'; match the Django model's max_length
+ALTER TABLE analyses ALTER COLUMN status TYPE VARCHAR(20);
@@ -0,0 +1,38 @@
+-- Migration: create_analysis_dashboard_daily
+-- Created at: 1753064289
+
+-- Daily roll-up of analyses for dashboard aggregates. Refreshed on a
+-- schedule by the refresh_analysis_dashboard Celery task.
+--
+-- The view joins analytics_analysismetrics, which Django creates, so it
+-- is only created once that table exists. Re-run this migration after
+-- the Django migrations; until then the refresh task skips the view.
+DO $$
+BEGIN
+    IF to_regclass('analytics_analysismetrics') IS NOT NULL
+            AND to_regclass('analytics_dashboard_daily') IS NULL THEN
+        CREATE MATERIALIZED VIEW analytics_dashboard_daily AS
+        SELECT
+            to_char(d.day, 'YYYY-MM-DD') || ':' || d.status AS id,
+            d.day,
+            d.status,
+            d.analysis_count,
+            d.avg_processing_time,
+            d.events_detected
+        FROM (
+            SELECT
+                date_trunc('day', a.created_at)::date AS day,
+                a.status,
+                COUNT(*) AS analysis_count,
+                AVG(a.processing_time)::double precision AS avg_processing_time,
+                COALESCE(SUM(m.events_detected), 0)::bigint AS events_detected
+            FROM analyses a
+            LEFT JOIN analytics_analysismetrics m ON m.analysis_id = a.id
+            GROUP BY 1, 2
+        ) d;
+
+        -- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+        CREATE UNIQUE INDEX analytics_dashboard_daily_day_status_idx
+            ON analytics_dashboard_daily(day, status);
+    END IF;
+END $$;
@@ -0,0 +1,13 @@
+-- Migration: tune_analyses_hot_updates
+-- Created at: 1753064290
+
+-- Progress ticks rewrite progress_percentage/current_step many times per
+-- analysis. An index on progress_percentage forces every tick to be a
+-- non-HOT update that also touches every index; nothing queries by it.
+DROP INDEX IF EXISTS idx_analyses_progress;
+
+-- Leave free space on each page so status/progress updates stay HOT
+ALTER TABLE analyses SET (fillfactor = 85);
+
+-- Move result JSONB out of line sooner so heap pages hold more hot rows
+ALTER TABLE analyses SET (toast_tuple_target = 256);
@@ -0,0 +1,19 @@
+-- Migration: lz4_analysis_json_columns
+-- Created at: 1753064292
+
+-- Compress large JSONB payloads with lz4 instead of the default pglz.
+-- lz4 compresses and decompresses several times faster at a similar
+-- ratio. Requires PostgreSQL 14+; only newly written values are affected.
+ALTER TABLE analyses ALTER COLUMN openstarlab_results SET COMPRESSION lz4;
+ALTER TABLE analyses ALTER COLUMN ai_insights SET COMPRESSION lz4;
+
+DO $$
+BEGIN
+    IF to_regclass('analytics_analysistask') IS NOT NULL THEN
+        ALTER TABLE analytics_analysistask ALTER COLUMN result_data SET COMPRESSION lz4;
+    END IF;
+
+    IF to_regclass('analytics_analysisinsight') IS NOT NULL THEN
+        ALTER TABLE analytics_analysisinsight ALTER COLUMN metadata SET COMPRESSION lz4;
+    END IF;
+END $$;
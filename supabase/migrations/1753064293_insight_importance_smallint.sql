@@ -0,0 +1,50 @@
+-- Migration: insight_importance_smallint
+-- Created at: 1753064293
+
+-- Insight importance is stored as an ordered small integer
+-- (low=1, medium=2, high=3, critical=4) so ORDER BY ranks it correctly.
+-- Existing varchar values are mapped in place; unknown values fall back
+-- to medium, the old default. Only runs while the column is still text,
+-- so it is a no-op on fresh installs and safe to re-run.
+--
+-- A CHECK constraint then keeps levels within 1-4, which the API maps
+-- back to the old codes.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'analytics_analysisinsight'
+          AND column_name = 'importance_level'
+          AND data_type IN ('character varying', 'text')
+    ) THEN
+        ALTER TABLE analytics_analysisinsight ALTER COLUMN importance_level DROP DEFAULT;
+
+        ALTER TABLE analytics_analysisinsight
+            ALTER COLUMN importance_level TYPE smallint
+            USING CASE importance_level
+                WHEN 'low' THEN 1
+                WHEN 'medium' THEN 2
+                WHEN 'high' THEN 3
+                WHEN 'critical' THEN 4
+                ELSE 2
+            END;
+
+        ALTER TABLE analytics_analysisinsight ALTER COLUMN importance_level SET DEFAULT 2;
+    END IF;
+END $$;
+
+DO $$
+BEGIN
+    IF to_regclass('analytics_analysisinsight') IS NOT NULL AND NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'analysis_insight_importance_range'
+    ) THEN
+        UPDATE analytics_analysisinsight
+        SET importance_level = 2
+        WHERE importance_level NOT BETWEEN 1 AND 4;
+
+        ALTER TABLE analytics_analysisinsight
+            ADD CONSTRAINT analysis_insight_importance_range
+            CHECK (importance_level BETWEEN 1 AND 4);
+    END IF;
+END $$;
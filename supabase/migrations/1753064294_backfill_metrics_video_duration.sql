@@ -0,0 +1,22 @@
+-- Migration: backfill_metrics_video_duration
+-- Created at: 1753064294
+
+-- AnalysisMetrics copies the video duration when metrics are recorded so
+-- events_per_minute does not have to join through the analysis. Fill it
+-- in for rows recorded before the column existed.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'analytics_analysismetrics'
+          AND column_name = 'video_duration_seconds'
+    ) THEN
+        UPDATE analytics_analysismetrics m
+        SET video_duration_seconds = v.duration
+        FROM analyses a
+        JOIN videos v ON v.id = a.video_id
+        WHERE a.id = m.analysis_id
+          AND m.video_duration_seconds = 0
+          AND v.duration > 0;
+    END IF;
+END $$;
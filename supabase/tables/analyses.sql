@@ -3,7 +3,7 @@ CREATE TABLE analyses (
     video_id UUID NOT NULL REFERENCES videos(id) ON DELETE CASCADE,
     openstarlab_results JSONB,
     ai_insights JSONB,
-    status VARCHAR(50) DEFAULT 'pending',
+    status VARCHAR(20) DEFAULT 'pending',
     processing_time INTEGER,
     progress_percentage INTEGER DEFAULT 0 CHECK (progress_percentage >= 0 AND progress_percentage <= 100),
     current_step VARCHAR(100),